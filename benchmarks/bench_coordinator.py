@@ -0,0 +1,105 @@
+"""Coordinator benchmarks: payload parsing stages and full update cycles.
+
+Stage benchmarks call the parsing helpers directly on synthetic payloads of
+10 to 2000 signals and 1 to 500 wallboxes. Cycle benchmarks run steady-state
+update cycles of a real coordinator against the local FusionSolar emulator.
+Every measured cycle reads the device list and realtime data like a regular
+poll; ``spans_ms`` and ``requests`` describe one such cycle and come from the
+coordinator's own cycle trace and the emulator's request counters.
+
+Run with ``python -m benchmarks.bench_coordinator``; see ``benchmarks.harness``.
+"""
+
+import random
+import sys
+from functools import partial
+
+from .fusionsolar_emulator import FusionSolarEmulator, build_coordinator, stub_hass
+from .harness import async_measure, main, measure
+from .payloads import device_list_payload, realtime_payload
+
+SIGNAL_COUNTS = (10, 100, 500, 2000)
+DEVICE_COUNTS = (1, 10, 100, 500)
+RECORD_SIGNALS = 100
+NORMALIZE_ROUNDS = 20
+# (wallboxes, signals per wallbox) of the end-to-end cycle benchmarks.
+CYCLE_SIZES = ((1, 10), (1, 2000), (10, 200), (100, 200), (500, 10))
+QUICK_SIGNALS = 100
+QUICK_DEVICES = 10
+
+
+async def bench_walk(signals):
+    coordinator = build_coordinator(stub_hass())
+    payload = realtime_payload(signals)
+    return measure(lambda: coordinator._walk_signal_payload(payload), rounds=20)
+
+
+async def bench_decode(signals):
+    coordinator = build_coordinator(stub_hass())
+    payload = realtime_payload(signals)
+    # The first response teaches the coordinator the realtime shape.
+    coordinator._decode_signal_payload("wallbox-realtime", payload)
+    return measure(lambda: coordinator._decode_signal_payload("wallbox-realtime", payload), rounds=20)
+
+
+def poll_values(reg_ids, index):
+    """Return the param values of poll ``index``, with readings seeded from the index.
+
+    Register strings are parsed through a cache, so normalizing the same values
+    every round would mostly time cache hits.
+    """
+    rng = random.Random(index)
+    return {reg_id: f"{rng.uniform(0, 10000):.2f}" for reg_id in reg_ids}
+
+
+async def bench_normalize(signals):
+    coordinator = build_coordinator(stub_hass())
+    reg_ids = list(coordinator._walk_signal_payload(realtime_payload(signals))["values"])
+    # One poll per warm-up, measured and memory-traced call.
+    polls = iter([poll_values(reg_ids, index) for index in range(NORMALIZE_ROUNDS + 2)])
+    return measure(lambda: coordinator._normalize_param_values(next(polls)), rounds=NORMALIZE_ROUNDS)
+
+
+async def bench_device_records(devices):
+    coordinator = build_coordinator(stub_hass())
+    records = device_list_payload(devices, RECORD_SIGNALS)["data"]
+    return measure(lambda: [coordinator._wallbox_record_values(record) for record in records], rounds=20)
+
+
+async def bench_sanitize(devices):
+    coordinator = build_coordinator(stub_hass())
+    payload = device_list_payload(devices, RECORD_SIGNALS)
+    return measure(lambda: coordinator._sanitize_debug_value(payload), rounds=20)
+
+
+async def bench_cycle(devices, signals):
+    async with FusionSolarEmulator(devices=devices, signals=signals) as emulator:
+        coordinator = emulator.build_coordinator(stub_hass())
+        # The warm-up cycle logs in and loads the topology; the measured ones are regular polls.
+        result = await async_measure(coordinator._async_update_data, rounds=3 if devices > 100 else 10)
+        # The memory-traced round runs slowed down by tracemalloc; describe one more plain cycle.
+        requests_before = sum(emulator.requests.values())
+        await coordinator._async_update_data()
+        result["spans_ms"] = coordinator.cycle_traces[-1].as_dict()["spans_ms"]
+        result["requests"] = sum(emulator.requests.values()) - requests_before
+        return result
+
+
+def benchmarks():
+    """Return the ``(name, bench, quick)`` entries of this suite."""
+    for signals in SIGNAL_COUNTS:
+        quick = signals == QUICK_SIGNALS
+        yield f"walk[signals={signals}]", partial(bench_walk, signals), quick
+        yield f"decode[signals={signals}]", partial(bench_decode, signals), quick
+        yield f"normalize[signals={signals}]", partial(bench_normalize, signals), quick
+    for devices in DEVICE_COUNTS:
+        quick = devices == QUICK_DEVICES
+        yield f"device-records[devices={devices}]", partial(bench_device_records, devices), quick
+        yield f"sanitize[devices={devices}]", partial(bench_sanitize, devices), quick
+    for devices, signals in CYCLE_SIZES:
+        quick = devices <= QUICK_DEVICES and signals <= QUICK_SIGNALS
+        yield f"cycle[devices={devices},signals={signals}]", partial(bench_cycle, devices, signals), quick
+
+
+if __name__ == "__main__":
+    sys.exit(main("coordinator", list(benchmarks())))
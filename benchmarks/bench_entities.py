@@ -0,0 +1,192 @@
+"""Entity fan-out benchmarks: what one coordinator update costs the entity layer.
+
+Each benchmark sets up the sensor, number and binary sensor platforms for N
+config entries with M registers each against a stub ``hass``, then publishes
+coordinator updates that change a share of the registers. A state write reads
+``available``, ``state`` and ``extra_state_attributes`` like Home Assistant's
+own write does; ``writes`` counts them for one update across all entries.
+The discovery benchmarks time the sensor platform's new-register listener alone,
+and the reconcile benchmarks time the setup pass that drops registry entries of
+registers a wallbox no longer reports.
+
+Run with ``python -m benchmarks.bench_entities``; see ``benchmarks.harness``.
+"""
+
+import asyncio
+import sys
+from functools import partial
+from itertools import count
+from types import SimpleNamespace
+
+from custom_components.huawei_charger import _async_reconcile_entity_registry, binary_sensor, number, sensor
+from custom_components.huawei_charger.const import DOMAIN
+
+from .fusionsolar_emulator import build_coordinator, stub_hass
+from .harness import async_measure, main, measure
+from .payloads import CORE_SIGNALS, realtime_groups
+
+PLATFORMS = (sensor, number, binary_sensor)
+# (config entries, registers per entry) of the fan-out benchmarks.
+FANOUT_SIZES = ((1, 10), (1, 100), (1, 500), (10, 100), (50, 100), (10, 500))
+# Percentage of each entry's registers that change per update.
+CHANGED_SHARES = (0, 10, 100)
+QUICK_SIZE = (1, 100)
+ORPHAN_COUNTS = (10, 100, 1000)
+
+
+class StubEntityRegistry:
+    """Entity registry stand-in holding ``RegistryEntry``-like objects per config entry.
+
+    Removals are only recorded, so a benchmark can repeat the same reconciliation.
+    """
+
+    def __init__(self, entries=()):
+        self.entities = self
+        self.removed = []
+        self._entries = {}
+        for entry in entries:
+            self._entries.setdefault(entry.config_entry_id, []).append(entry)
+
+    def get_entries_for_config_entry_id(self, entry_id):
+        return list(self._entries.get(entry_id, ()))
+
+    def async_remove(self, entity_id):
+        self.removed.append(entity_id)
+
+
+def registry_entry(config_entry_id, domain, unique_id):
+    return SimpleNamespace(
+        config_entry_id=config_entry_id,
+        domain=domain,
+        unique_id=unique_id,
+        entity_id=f"{domain}.{unique_id.lower()}",
+    )
+
+
+class FanoutBench:
+    """N config entries with M registers each and their entities attached to a stub ``hass``."""
+
+    def __init__(self, entries, registers, registry=None):
+        self.hass = stub_hass()
+        self.hass.data["entity_registry"] = registry or StubEntityRegistry()
+        self.hass.data[DOMAIN] = {}
+        self.registers = registers
+        self.coordinators = []
+        self.entities = []
+        self.writes = 0
+        self._attaching = []
+        self._values = count()
+        for index in range(entries):
+            coordinator = build_coordinator(self.hass, entry_id=f"entry_{index}")
+            # Updates are published by the benchmark, not by the coordinator's timer.
+            coordinator.update_interval = None
+            coordinator.param_values = {
+                signal["id"]: signal["value"]
+                for group in realtime_groups(f"NE={100000 + index}", registers)
+                for signal in group["signals"]
+            }
+            coordinator.data = coordinator.param_values
+            coordinator._track_register_changes()
+            self.hass.data[DOMAIN][coordinator.entry.entry_id] = coordinator
+            self.coordinators.append(coordinator)
+
+    async def async_setup(self):
+        """Set up every platform for every entry and attach the entities."""
+        for coordinator in self.coordinators:
+            for platform in PLATFORMS:
+                await platform.async_setup_entry(self.hass, coordinator.entry, self.add_entities)
+        await asyncio.gather(*self._attaching)
+        self._attaching.clear()
+
+    def publish(self, changed_share):
+        """Change ``changed_share`` percent of every entry's registers and notify listeners."""
+        value = str(next(self._values))
+        for coordinator in self.coordinators:
+            reg_ids = list(coordinator.param_values)
+            for reg_id in reg_ids[: len(reg_ids) * changed_share // 100]:
+                coordinator.param_values[reg_id] = value
+            coordinator._track_register_changes()
+            coordinator.async_update_listeners()
+
+    async def _async_attach(self, entity):
+        entity.hass = self.hass
+        entity.entity_id = f"{DOMAIN}.{entity.unique_id}"
+        entity.async_write_ha_state = partial(self._write_state, entity)
+        self.entities.append(entity)
+        await entity.async_added_to_hass()
+
+    def _write_state(self, entity):
+        self.writes += 1
+        if entity.available:
+            entity.state
+        entity.extra_state_attributes
+
+    def sensor_listeners(self):
+        """Return the sensor platform's new-register listeners of all entries."""
+        return [
+            update_callback
+            for coordinator in self.coordinators
+            for update_callback, _ in coordinator._listeners.values()
+            if update_callback.__module__ == sensor.__name__ and not hasattr(update_callback, "__self__")
+        ]
+
+    def add_entities(self, entities):
+        """``async_add_entities`` of every platform; entities are attached in the background."""
+        self._attaching.extend(self.hass.loop.create_task(self._async_attach(entity)) for entity in entities)
+
+
+async def bench_fanout(entries, registers, changed_share):
+    bench = FanoutBench(entries, registers)
+    await bench.async_setup()
+    bench.publish(100)
+    result = measure(partial(bench.publish, changed_share), rounds=10)
+    bench.writes = 0
+    bench.publish(changed_share)
+    result["entities"] = len(bench.entities)
+    result["writes"] = bench.writes
+    return result
+
+
+async def bench_discovery(registers):
+    bench = FanoutBench(1, registers)
+    await bench.async_setup()
+    (listener,) = bench.sensor_listeners()
+    return measure(listener, rounds=20)
+
+
+async def bench_reconcile(orphans, registers=100):
+    entry_id = "entry_0"
+    # Entries for the live registers plus orphans left behind by registers that disappeared.
+    entries = [
+        registry_entry(entry_id, "sensor", f"{entry_id}_sensor_{reg_id}")
+        for reg_id in range(30000, 30000 + registers + orphans)
+    ]
+    entries.append(registry_entry(entry_id, "binary_sensor", f"{entry_id}_reauthentication_required"))
+    registry = StubEntityRegistry(entries)
+    bench = FanoutBench(1, registers + len(CORE_SIGNALS), registry)
+    coordinator = bench.coordinators[0]
+    reconcile = partial(_async_reconcile_entity_registry, bench.hass, coordinator.entry, coordinator)
+    result = await async_measure(reconcile, rounds=10)
+    registry.removed.clear()
+    await reconcile()
+    result["removed"] = len(registry.removed)
+    return result
+
+
+def benchmarks():
+    """Return the ``(name, bench, quick)`` entries of this suite."""
+    for entries, registers in FANOUT_SIZES:
+        for changed_share in CHANGED_SHARES:
+            yield (
+                f"fanout[entries={entries},registers={registers},changed={changed_share}%]",
+                partial(bench_fanout, entries, registers, changed_share),
+                (entries, registers) == QUICK_SIZE,
+            )
+    for registers in (10, 100, 500):
+        yield f"discovery[registers={registers}]", partial(bench_discovery, registers), registers == QUICK_SIZE[1]
+    for orphans in ORPHAN_COUNTS:
+        yield f"reconcile[orphans={orphans}]", partial(bench_reconcile, orphans), orphans == ORPHAN_COUNTS[0]
+
+
+if __name__ == "__main__":
+    sys.exit(main("entities", list(benchmarks())))
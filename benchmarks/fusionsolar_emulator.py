@@ -0,0 +1,257 @@
+"""Local FusionSolar stand-in for benchmarking the coordinator without network access.
+
+The emulator serves the endpoints ``HuaweiChargerCoordinator`` talks to over
+plain HTTP on 127.0.0.1. Latency, jitter, error rate, token lifetime and the
+number of stations, wallboxes and signals are configurable, and every request
+is counted per endpoint::
+
+    async with FusionSolarEmulator(devices=20, signals=200, latency=0.05) as emulator:
+        coordinator = emulator.build_coordinator(hass)
+        await coordinator._async_update_data()
+"""
+
+import asyncio
+import json
+import random
+import secrets
+import time
+from collections import Counter
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from .payloads import (
+    CONFIG_SIGNALS,
+    CORE_SIGNALS,
+    config_signals,
+    device_dns,
+    device_record,
+    realtime_groups,
+    station_dns,
+)
+
+APP_TOKEN_PATH = "/rest/neteco/appauthen/v1/smapp/app/token"
+STATION_LIST_PATH = "/rest/pvms/web/station/v1/station/station-list"
+DEVICE_LIST_PATH = "/rest/neteco/web/config/device/v1/device-list"
+REALTIME_PATH = "/rest/pvms/web/device/v1/device-realtime-data"
+GET_CONFIG_PATH = "/rest/pvms/web/device/v1/deviceExt/get-config-signals"
+SET_CONFIG_PATH = "/rest/pvms/web/device/v1/deviceExt/set-config-signals"
+HISTORY_PATH = "/rest/pvms/web/device/v1/device-history-data"
+
+class FusionSolarEmulator:
+    """Serve emulated FusionSolar responses from a local aiohttp server.
+
+    ``latency`` and ``jitter`` are in seconds; ``error_rate`` is the share of
+    API requests answered with HTTP 500; tokens older than ``token_ttl`` seconds
+    are answered with HTTP 401 so the coordinator has to log in again.
+    """
+
+    def __init__(
+        self,
+        *,
+        stations=1,
+        devices=1,
+        signals=len(CORE_SIGNALS),
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        token_ttl=None,
+        seed=0,
+    ):
+        self.stations = stations
+        self.devices = devices
+        self.signals = max(signals, len(CORE_SIGNALS))
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.token_ttl = token_ttl
+        self.requests = Counter()
+        self.errors = Counter()
+        self._random = random.Random(seed)
+        self._tokens = {}
+        self._config_values = {}
+        self._server = None
+        self._session = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self):
+        # The history probe asks for every realtime signal ID in one query string.
+        app = web.Application(middlewares=[self._middleware], handler_args={"max_line_size": 1 << 20})
+        app.router.add_post(APP_TOKEN_PATH, self._handle_token)
+        app.router.add_post(STATION_LIST_PATH, self._handle_station_list)
+        app.router.add_post(DEVICE_LIST_PATH, self._handle_device_list)
+        app.router.add_get(REALTIME_PATH, self._handle_realtime)
+        app.router.add_get(GET_CONFIG_PATH, self._handle_get_config)
+        app.router.add_post(SET_CONFIG_PATH, self._handle_set_config)
+        app.router.add_get(HISTORY_PATH, self._handle_history)
+        self._server = TestServer(app, host="127.0.0.1")
+        await self._server.start_server()
+        self._session = aiohttp.ClientSession()
+
+    async def stop(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    @property
+    def host(self):
+        return "127.0.0.1"
+
+    @property
+    def port(self):
+        return self._server.port
+
+    def expire_tokens(self):
+        """Answer the next API request of every issued token with HTTP 401."""
+        self._tokens.clear()
+
+    def build_coordinator(self, hass, *, entry_id="emulator", options=None):
+        """Return a coordinator that talks to this emulator and keeps its session in memory."""
+        coordinator = build_coordinator(hass, host=self.host, entry_id=entry_id, options=options)
+        coordinator.api_scheme = "http"
+        coordinator.api_port = self.port
+        # Stands in for Home Assistant's shared client session.
+        coordinator._get_session = lambda: self._session
+        return coordinator
+
+    @web.middleware
+    async def _middleware(self, request, handler):
+        endpoint = request.path.rsplit("/", 1)[-1]
+        self.requests[endpoint] += 1
+
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if request.path != APP_TOKEN_PATH:
+            issued_at = self._tokens.get(request.cookies.get("bspsession"))
+            expired = issued_at is None or (
+                self.token_ttl is not None and time.monotonic() - issued_at > self.token_ttl
+            )
+            if expired:
+                self.errors[endpoint] += 1
+                return web.json_response({"failCode": 401, "message": "token expired"}, status=401)
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors[endpoint] += 1
+                return web.json_response({"failCode": 500, "message": "emulated failure"}, status=500)
+
+        return await handler(request)
+
+    async def _handle_token(self, request):
+        token = secrets.token_hex(16)
+        self._tokens[token] = time.monotonic()
+        return web.json_response(
+            {
+                "success": True,
+                "data": {"accessToken": token, "regionFloatIp": self.host, "roaRand": secrets.token_hex(8)},
+            }
+        )
+
+    async def _handle_station_list(self, request):
+        stations = [
+            {"dn": station_dn, "name": f"Station {index + 1}", "chargeStore": 0}
+            for index, station_dn in enumerate(station_dns(self.stations))
+        ]
+        return web.json_response({"success": True, "data": {"list": stations, "total": len(stations)}})
+
+    async def _handle_device_list(self, request):
+        form = parse_qs(await request.text())
+        station_dn = form.get("conditionParams.parentDn", [station_dns(self.stations)[0]])[0]
+        wallbox_dn = form.get("conditionParams.dn", [None])[0]
+        page_size = int(form.get("conditionParams.recordperpage", ["500"])[0])
+        dns = [
+            device_dn
+            for device_dn in device_dns(station_dn, self.devices)
+            if wallbox_dn is None or device_dn == wallbox_dn
+        ]
+        return web.json_response(
+            {
+                "success": True,
+                # Like the cloud, the device list only carries a few values; live data comes from realtime.
+                "data": [
+                    device_record(
+                        device_dn,
+                        {reg_id: self._config_value(device_dn, reg_id) for reg_id in CONFIG_SIGNALS},
+                    )
+                    for device_dn in dns[:page_size]
+                ],
+            }
+        )
+
+    async def _handle_realtime(self, request):
+        device_dn = request.query.get("deviceDn")
+        return web.json_response(
+            {"success": True, "data": realtime_groups(device_dn, self.signals, self._random)}
+        )
+
+    async def _handle_get_config(self, request):
+        device_dn = request.query.get("dn")
+        values = {reg_id: self._config_value(device_dn, reg_id) for reg_id in CONFIG_SIGNALS}
+        return web.json_response({"success": True, "data": config_signals(values)})
+
+    async def _handle_set_config(self, request):
+        form = await request.post()
+        device_dn = form.get("dn")
+        for change in json.loads(form.get("changeValues") or "[]"):
+            self._config_values[(device_dn, str(change["id"]))] = str(change["value"])
+        return web.json_response({"success": True, "data": None})
+
+    async def _handle_history(self, request):
+        signal_ids = request.query.getall("signalIds", [])
+        return web.json_response(
+            {"success": True, "data": [{"signalId": signal_id, "values": []} for signal_id in signal_ids]}
+        )
+
+    def _config_value(self, device_dn, reg_id):
+        return self._config_values.get((device_dn, reg_id), CONFIG_SIGNALS[reg_id]["value"])
+
+
+def stub_hass():
+    """Return the parts of ``HomeAssistant`` a coordinator touches; call inside a running loop."""
+    return SimpleNamespace(
+        loop=asyncio.get_running_loop(),
+        config=SimpleNamespace(language="en", time_zone="UTC", config_dir="/tmp"),
+        data={},
+    )
+
+
+def build_coordinator(hass, *, host="127.0.0.1", entry_id="emulator", options=None):
+    """Return a coordinator for ``host`` that keeps its session in memory."""
+    from custom_components.huawei_charger.coordinator import HuaweiChargerCoordinator
+
+    entry = SimpleNamespace(
+        entry_id=entry_id,
+        data={"username": "emulator", "password": "emulator", "host": host},
+        options=dict(options or {}),
+    )
+    coordinator = HuaweiChargerCoordinator(hass, entry)
+    coordinator._session_store = MemoryStore()
+    return coordinator
+
+
+class MemoryStore:
+    """In-memory stand-in for the session ``Store`` of an emulated coordinator."""
+
+    def __init__(self):
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = data
+
+    async def async_remove(self):
+        self.data = None
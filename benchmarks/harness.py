@@ -0,0 +1,168 @@
+"""Minimal benchmark harness: timing, CPU time, peak memory and baseline comparison.
+
+Each benchmark is a named coroutine function returning the result of
+``measure`` or ``async_measure``. ``main`` runs a suite, prints one line per
+benchmark and compares the results with the suite's stored baseline::
+
+    python -m benchmarks.bench_coordinator                  # compare with the baseline
+    python -m benchmarks.bench_coordinator --save-baseline  # record a new baseline
+    python -m benchmarks.bench_coordinator --quick          # smallest sizes only
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+DEFAULT_THRESHOLD = 2.0
+# Metrics compared with the baseline; the fastest round is far steadier than the median
+# on a shared machine. Results below the floor are noise and never fail.
+COMPARED_METRICS = {"min_ms": 0.05, "peak_kib": 16}
+
+
+def measure(func, *, rounds=5, warmup=1):
+    """Time ``func()`` over ``rounds`` calls, then trace the peak memory of one more call."""
+    for _ in range(warmup):
+        func()
+    wall = []
+    cpu = []
+    for _ in range(rounds):
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        func()
+        wall.append(time.perf_counter() - started)
+        cpu.append(time.process_time() - cpu_started)
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return _summary(wall, cpu, peak)
+
+
+async def async_measure(func, *, rounds=5, warmup=1):
+    """Like ``measure`` for a coroutine function; CPU time includes everything else on the loop."""
+    for _ in range(warmup):
+        await func()
+    wall = []
+    cpu = []
+    for _ in range(rounds):
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        await func()
+        wall.append(time.perf_counter() - started)
+        cpu.append(time.process_time() - cpu_started)
+    tracemalloc.start()
+    try:
+        await func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return _summary(wall, cpu, peak)
+
+
+def _summary(wall, cpu, peak):
+    return {
+        "rounds": len(wall),
+        "median_ms": round(statistics.median(wall) * 1000, 4),
+        "min_ms": round(min(wall) * 1000, 4),
+        "cpu_ms": round(statistics.median(cpu) * 1000, 4),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return one message per metric that grew past ``threshold`` times its baseline."""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        for metric, floor in COMPARED_METRICS.items():
+            reference = expected.get(metric)
+            if reference is None or metric not in result:
+                continue
+            if max(reference, result[metric]) < floor:
+                continue
+            if result[metric] > max(reference, floor) * threshold:
+                regressions.append(f"{name}: {metric} {result[metric]} > {threshold} x {reference}")
+    return regressions
+
+
+def baseline_path(suite):
+    return Path(__file__).with_name(f"baseline_{suite}.json")
+
+
+def load_baseline(path):
+    try:
+        return json.loads(Path(path).read_text())["results"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path, results):
+    payload = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    Path(path).write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+async def run_benchmarks(benchmarks, *, quick=False, only=None, report=None):
+    """Run ``(name, bench, quick)`` entries and return ``{name: result}``."""
+    results = {}
+    for name, bench, in_quick in benchmarks:
+        if quick and not in_quick:
+            continue
+        if only and only not in name:
+            continue
+        results[name] = await bench()
+        if report is not None:
+            report(name, results[name])
+    return results
+
+
+def _print_result(name, result):
+    extra = "".join(
+        f" {key}={value}" for key, value in result.items() if key not in {"rounds", "median_ms", "min_ms", "cpu_ms", "peak_kib"}
+    )
+    print(
+        f"{name:<50} {result['min_ms']:>10.3f} min-ms {result['median_ms']:>10.3f} ms {result['cpu_ms']:>10.3f} cpu-ms "
+        f"{result['peak_kib']:>10.1f} KiB{extra}",
+        flush=True,
+    )
+
+
+def main(suite, benchmarks, argv=None):
+    """Command line entry point shared by the benchmark suites; returns the exit code."""
+    parser = argparse.ArgumentParser(description=f"Run the {suite} benchmarks.")
+    parser.add_argument("--quick", action="store_true", help="only run the smallest sizes")
+    parser.add_argument("--only", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--baseline", default=baseline_path(suite), help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"fail when a metric exceeds this multiple of its baseline (default {DEFAULT_THRESHOLD})",
+    )
+    args = parser.parse_args(argv)
+    # Keep the coordinator's warnings (e.g. multiple wallboxes found) out of the report.
+    logging.basicConfig(level=logging.ERROR)
+
+    results = asyncio.run(run_benchmarks(benchmarks, quick=args.quick, only=args.only, report=_print_result))
+    if args.save_baseline:
+        baseline = load_baseline(args.baseline)
+        baseline.update(results)
+        save_baseline(args.baseline, baseline)
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
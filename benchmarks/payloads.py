@@ -0,0 +1,90 @@
+"""Synthetic FusionSolar payloads shared by the emulator and the benchmarks.
+
+The shapes follow the responses the integration parses: device-list records
+carry a ``paramValues`` dict, realtime data groups ``signals`` records under a
+``groupName`` and get-config-signals lists writable signals with their limits.
+"""
+
+import random
+
+# Realtime signals every emulated wallbox reports, with a unit and a value generator.
+CORE_SIGNALS = {
+    "10003": ("Rated Charging Power", "kW", lambda rng: "7.4"),
+    "10008": ("Total Energy Charged", "kWh", lambda rng: f"{rng.uniform(100, 5000):.2f}"),
+    "10009": ("Session Energy", "kWh", lambda rng: f"{rng.uniform(0, 40):.2f}"),
+    "10010": ("Session Duration", "min", lambda rng: str(rng.randint(0, 600))),
+    "20012": ("Charging Current", "A", lambda rng: f"{rng.uniform(0, 32):.1f}"),
+    "20017": ("Plugged In", None, lambda rng: rng.choice(["true", "false"])),
+    "2101259": ("Phase A Voltage", "V", lambda rng: f"{rng.uniform(225, 240):.1f}"),
+}
+
+# Writable config signals served by get-config-signals and changed by set-config-signals.
+CONFIG_SIGNALS = {
+    "20001": {"name": "Dynamic Power Limit", "unit": "kW", "value": "7.4", "minValue": "1.6", "maxValue": "7.4"},
+    "538976598": {"name": "Fixed Max Charging Power", "unit": "kW", "value": "7.4", "minValue": "1.6", "maxValue": "7.4"},
+}
+
+
+def station_dns(stations):
+    return [f"NE={1000 + index}" for index in range(stations)]
+
+
+def device_dns(station_dn, devices):
+    station_index = int(station_dn.split("=", 1)[1]) - 1000
+    first = 100000 + station_index * devices
+    return [f"NE={first + index}" for index in range(devices)]
+
+
+def realtime_groups(device_dn, signals, rng=None):
+    """Return the ``data`` list of a device-realtime-data response with ``signals`` records."""
+    rng = rng or random.Random(0)
+    core = [
+        {"id": reg_id, "name": name, "unit": unit, "value": value(rng)}
+        for reg_id, (name, unit, value) in CORE_SIGNALS.items()
+    ]
+    extra = [
+        {"id": str(30000 + index), "name": f"Signal {index}", "unit": None, "value": str(rng.randint(0, 1000))}
+        for index in range(max(signals - len(CORE_SIGNALS), 0))
+    ]
+    return [
+        {"groupName": "Basic", "deviceDn": device_dn, "signals": core},
+        {"groupName": "Extended", "deviceDn": device_dn, "signals": extra},
+    ]
+
+
+def device_record(device_dn, param_values):
+    """Return one device-list record for ``device_dn``."""
+    return {
+        "dn": device_dn,
+        "dnId": device_dn.split("=", 1)[1],
+        "name": f"Wallbox {device_dn}",
+        "deviceStatus": "Connected",
+        "paramValues": param_values,
+    }
+
+
+def config_signals(values):
+    """Return the ``data`` list of a get-config-signals response for ``{reg_id: value}``."""
+    signals = [
+        {"id": reg_id, "writable": True, **CONFIG_SIGNALS[reg_id], "value": value}
+        for reg_id, value in values.items()
+    ]
+    return [{"signals": signals}]
+
+
+def realtime_payload(signals, *, device_dn="NE=100000", seed=0):
+    return {"success": True, "data": realtime_groups(device_dn, signals, random.Random(seed))}
+
+
+def device_list_payload(devices, signals, *, seed=0):
+    """Return a device-list response whose records each carry ``signals`` param values."""
+    rng = random.Random(seed)
+    records = []
+    for device_dn in device_dns(station_dns(1)[0], devices):
+        param_values = {
+            signal["id"]: signal["value"]
+            for group in realtime_groups(device_dn, signals, rng)
+            for signal in group["signals"]
+        }
+        records.append(device_record(device_dn, param_values))
+    return {"success": True, "data": records}
@@ -1,18 +1,20 @@
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.components.frontend import add_extra_js_url
 from homeassistant.components.lovelace.const import (
     CONF_RESOURCE_TYPE_WS,
     DOMAIN as LOVELACE_DOMAIN,
 )
-from homeassistant.const import CONF_URL
+from homeassistant.const import CONF_HOST, CONF_URL, CONF_USERNAME
 import os
 import logging
 from collections.abc import Mapping
 
-from .const import DOMAIN
+from .const import CONF_WALLBOX_DN, DEFAULT_FUSIONSOLAR_HOST, DOMAIN, SESSION_STORAGE_VERSION
+from .hub import async_get_account_hub, async_release_account_hub
 from .services import async_register_services, async_unregister_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -131,30 +133,65 @@ async def register_custom_cards(hass: HomeAssistant) -> None:
         _LOGGER.error("Failed to register custom cards: %s", err)
 
 
-async def _async_remove_legacy_platform_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Remove stale registry entries for platforms that no longer exist."""
-    registry = er.async_get(hass)
-    legacy_unique_ids = {
-        f"{entry.entry_id}_{suffix}" for suffix in LEGACY_REMOVED_ENTITY_UNIQUE_IDS
+def _legacy_unique_id_filter(entry_id):
+    legacy_unique_ids = {f"{entry_id}_{suffix}" for suffix in LEGACY_REMOVED_ENTITY_UNIQUE_IDS}
+    return legacy_unique_ids.__contains__
+
+
+async def _async_reconcile_entity_registry(hass: HomeAssistant, entry: ConfigEntry, coordinator) -> None:
+    """Remove registry entries of every platform that no longer map to an entity, in one pass."""
+    from . import binary_sensor, sensor
+
+    # Each platform precomputes its active unique IDs once; the filters are then O(1) per entry.
+    stale_filters = {
+        "button": _legacy_unique_id_filter(entry.entry_id),
+        "switch": _legacy_unique_id_filter(entry.entry_id),
+        "sensor": sensor.stale_unique_id_filter(entry.entry_id, coordinator),
+        "binary_sensor": binary_sensor.stale_unique_id_filter(entry.entry_id, coordinator),
     }
-    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
-        if registry_entry.domain not in {"button", "switch"}:
-            continue
-        if registry_entry.unique_id in legacy_unique_ids:
-            registry.async_remove(registry_entry.entity_id)
+    registry = er.async_get(hass)
+    stale_entity_ids = [
+        registry_entry.entity_id
+        for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if registry_entry.unique_id
+        and registry_entry.domain in stale_filters
+        and stale_filters[registry_entry.domain](registry_entry.unique_id)
+    ]
+    for entity_id in stale_entity_ids:
+        registry.async_remove(entity_id)
+    if stale_entity_ids:
+        _LOGGER.debug("Removed %s stale Huawei Charger registry entries", len(stale_entity_ids))
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Huawei Charger from a config entry."""
+    from .config_flow import HuaweiChargerConfigFlow
     from .coordinator import HuaweiChargerCoordinator
 
     # Register custom cards automatically
     await register_custom_cards(hass)
     async_register_services(hass)
 
-    coordinator = HuaweiChargerCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    # Entries sharing a FusionSolar login share one account hub for login and topology reads.
+    account_id = HuaweiChargerConfigFlow._build_unique_id(
+        entry.data[CONF_USERNAME],
+        entry.data.get(CONF_HOST, DEFAULT_FUSIONSOLAR_HOST),
+    )
+    account_hub = async_get_account_hub(
+        hass,
+        account_id,
+        entry.entry_id,
+        entry.options.get(CONF_WALLBOX_DN, entry.data.get(CONF_WALLBOX_DN)),
+    )
+    coordinator = HuaweiChargerCoordinator(hass, entry, account_hub)
+    try:
+        await coordinator.async_restore_session_context()
+        await coordinator.async_config_entry_first_refresh()
+    except BaseException:
+        await coordinator.async_close_session()
+        async_release_account_hub(hass, account_hub, entry.entry_id)
+        raise
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-    await _async_remove_legacy_platform_entities(hass, entry)
+    await _async_reconcile_entity_registry(hass, entry, coordinator)
     entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -164,7 +201,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_close_session()
+        async_release_account_hub(hass, coordinator.account_hub, entry.entry_id)
         if not any(not str(key).startswith("_") for key in hass.data[DOMAIN]):
             async_unregister_services(hass)
     return unload_ok
@@ -173,3 +212,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached FusionSolar session when the config entry is deleted."""
+    from .coordinator import session_storage_key
+
+    await Store(hass, SESSION_STORAGE_VERSION, session_storage_key(entry.entry_id)).async_remove()
@@ -1,5 +1,4 @@
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -8,20 +7,18 @@ from .const import DOMAIN
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [HuaweiChargerCredentialsRejectedBinarySensor(coordinator)]
+    async_add_entities([HuaweiChargerCredentialsRejectedBinarySensor(coordinator)])
 
-    registry = er.async_get(hass)
-    active_unique_ids = {entity.unique_id for entity in entities}
-    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
-        if (
-            registry_entry.domain == "binary_sensor"
-            and registry_entry.unique_id
-            and registry_entry.unique_id.startswith(f"{entry.entry_id}_")
-            and registry_entry.unique_id not in active_unique_ids
-        ):
-            registry.async_remove(registry_entry.entity_id)
 
-    async_add_entities(entities)
+def _reauthentication_unique_id(entry_id):
+    return f"{entry_id}_reauthentication_required"
+
+
+def stale_unique_id_filter(entry_id, coordinator):
+    """Return a check for binary sensor unique IDs of the entry that no longer map to an entity."""
+    prefix = f"{entry_id}_"
+    active_unique_ids = {_reauthentication_unique_id(entry_id)}
+    return lambda unique_id: unique_id.startswith(prefix) and unique_id not in active_unique_ids
 
 
 class HuaweiChargerCredentialsRejectedBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -29,7 +26,7 @@ class HuaweiChargerCredentialsRejectedBinarySensor(CoordinatorEntity, BinarySens
         super().__init__(coordinator)
         self.coordinator = coordinator
         self._attr_name = "Reauthentication Required"
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_reauthentication_required"
+        self._attr_unique_id = _reauthentication_unique_id(coordinator.entry.entry_id)
         self._attr_device_class = BinarySensorDeviceClass.PROBLEM
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_device_info = {
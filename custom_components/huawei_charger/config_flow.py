@@ -8,12 +8,20 @@ from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, CONF_VE
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
+    CONF_CHARGING_INTERVAL,
+    CONF_COMPACT_ATTRIBUTES,
     CONF_ENABLE_LOGGING,
+    CONF_IDLE_INTERVAL,
     CONF_INTERVAL,
+    CONF_MAX_BACKOFF_INTERVAL,
     CONF_STATION_DN,
     CONF_WALLBOX_DN,
+    DEFAULT_CHARGING_INTERVAL,
+    DEFAULT_COMPACT_ATTRIBUTES,
     DEFAULT_ENABLE_LOGGING,
     DEFAULT_FUSIONSOLAR_HOST,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_BACKOFF_INTERVAL,
     DEFAULT_REQUEST_TIMEOUT,
     DOMAIN,
 )
@@ -33,6 +41,7 @@ DATA_SCHEMA = vol.Schema(
         ),
         vol.Optional(CONF_VERIFY_SSL, default=False): bool,
         vol.Optional(CONF_ENABLE_LOGGING, default=DEFAULT_ENABLE_LOGGING): bool,
+        vol.Optional(CONF_WALLBOX_DN, default=""): str,
     }
 )
 
@@ -74,7 +83,8 @@ class HuaweiChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 host = self._normalize_host(user_input[CONF_HOST])
                 username = user_input[CONF_USERNAME].strip()
-                await self.async_set_unique_id(self._build_unique_id(username, host))
+                wallbox_dn = self._coerce_optional_string(user_input.get(CONF_WALLBOX_DN))
+                await self.async_set_unique_id(self._build_unique_id(username, host, wallbox_dn))
                 self._abort_if_unique_id_configured()
 
                 await self.hass.async_add_executor_job(
@@ -96,6 +106,8 @@ class HuaweiChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         DEFAULT_ENABLE_LOGGING,
                     ),
                 }
+                if wallbox_dn:
+                    options[CONF_WALLBOX_DN] = wallbox_dn
                 entry_data = {
                     CONF_USERNAME: username,
                     CONF_PASSWORD: user_input[CONF_PASSWORD],
@@ -128,7 +140,7 @@ class HuaweiChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 host = self._normalize_host(user_input[CONF_HOST])
                 username = user_input[CONF_USERNAME].strip()
-                unique_id = self._build_unique_id(username, host)
+                unique_id = self._build_unique_id(username, host, self._entry_wallbox_dn(entry))
                 await self.async_set_unique_id(unique_id)
                 if self._has_conflicting_entry(unique_id, entry.entry_id):
                     return self.async_abort(reason="already_configured")
@@ -190,7 +202,7 @@ class HuaweiChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             host = self._normalize_host(user_input[CONF_HOST])
             username = entry.data.get(CONF_USERNAME, "")
-            unique_id = self._build_unique_id(username, host)
+            unique_id = self._build_unique_id(username, host, self._entry_wallbox_dn(entry))
             await self.async_set_unique_id(unique_id)
             if self._has_conflicting_entry(unique_id, entry.entry_id):
                 return self.async_abort(reason="already_configured")
@@ -310,8 +322,16 @@ class HuaweiChargerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return normalized
 
     @staticmethod
-    def _build_unique_id(username: str, host: str) -> str:
-        return f"{username.lower()}@{host.lower()}"
+    def _build_unique_id(username: str, host: str, wallbox_dn: str | None = None) -> str:
+        """Return the account id, scoped to a wallbox when the entry is pinned to one."""
+        account_id = f"{username.lower()}@{host.lower()}"
+        return f"{account_id}/{wallbox_dn}" if wallbox_dn else account_id
+
+    @staticmethod
+    def _entry_wallbox_dn(entry) -> str | None:
+        return HuaweiChargerConfigFlow._coerce_optional_string(
+            entry.options.get(CONF_WALLBOX_DN, entry.data.get(CONF_WALLBOX_DN))
+        )
 
     @staticmethod
     def _build_title(username: str, host: str) -> str:
@@ -350,8 +370,13 @@ class HuaweiChargerOptionsFlow(config_entries.OptionsFlow):
             try:
                 host = HuaweiChargerConfigFlow._normalize_host(user_input[CONF_HOST])
                 username = entry.data.get(CONF_USERNAME, "")
+                wallbox_dn = (
+                    HuaweiChargerConfigFlow._coerce_optional_string(user_input[CONF_WALLBOX_DN])
+                    if CONF_WALLBOX_DN in user_input
+                    else HuaweiChargerConfigFlow._entry_wallbox_dn(entry)
+                )
                 unique_id = (
-                    HuaweiChargerConfigFlow._build_unique_id(username, host)
+                    HuaweiChargerConfigFlow._build_unique_id(username, host, wallbox_dn)
                     if username
                     else entry.unique_id
                 )
@@ -367,6 +392,18 @@ class HuaweiChargerOptionsFlow(config_entries.OptionsFlow):
                         CONF_INTERVAL,
                         entry.options.get(CONF_INTERVAL, DEFAULT_INTERVAL),
                     ),
+                    CONF_CHARGING_INTERVAL: user_input.get(
+                        CONF_CHARGING_INTERVAL,
+                        entry.options.get(CONF_CHARGING_INTERVAL, DEFAULT_CHARGING_INTERVAL),
+                    ),
+                    CONF_IDLE_INTERVAL: user_input.get(
+                        CONF_IDLE_INTERVAL,
+                        entry.options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+                    ),
+                    CONF_MAX_BACKOFF_INTERVAL: user_input.get(
+                        CONF_MAX_BACKOFF_INTERVAL,
+                        entry.options.get(CONF_MAX_BACKOFF_INTERVAL, DEFAULT_MAX_BACKOFF_INTERVAL),
+                    ),
                     CONF_VERIFY_SSL: HuaweiChargerConfigFlow._coerce_bool(
                         user_input.get(CONF_VERIFY_SSL),
                         False,
@@ -375,6 +412,10 @@ class HuaweiChargerOptionsFlow(config_entries.OptionsFlow):
                         user_input.get(CONF_ENABLE_LOGGING),
                         False,
                     ),
+                    CONF_COMPACT_ATTRIBUTES: HuaweiChargerConfigFlow._coerce_bool(
+                        user_input.get(CONF_COMPACT_ATTRIBUTES),
+                        entry.options.get(CONF_COMPACT_ATTRIBUTES, DEFAULT_COMPACT_ATTRIBUTES),
+                    ),
                 }
                 for optional_key in (CONF_STATION_DN, CONF_WALLBOX_DN):
                     if optional_key in user_input:
@@ -407,6 +448,18 @@ class HuaweiChargerOptionsFlow(config_entries.OptionsFlow):
             CONF_INTERVAL,
             entry.data.get(CONF_INTERVAL, DEFAULT_INTERVAL),
         )
+        current_charging_interval = entry.options.get(
+            CONF_CHARGING_INTERVAL,
+            DEFAULT_CHARGING_INTERVAL,
+        )
+        current_idle_interval = entry.options.get(
+            CONF_IDLE_INTERVAL,
+            DEFAULT_IDLE_INTERVAL,
+        )
+        current_max_backoff_interval = entry.options.get(
+            CONF_MAX_BACKOFF_INTERVAL,
+            DEFAULT_MAX_BACKOFF_INTERVAL,
+        )
         current_verify_ssl = entry.options.get(
             CONF_VERIFY_SSL,
             entry.data.get(CONF_VERIFY_SSL, False),
@@ -416,6 +469,10 @@ class HuaweiChargerOptionsFlow(config_entries.OptionsFlow):
             CONF_ENABLE_LOGGING,
             entry.data.get(CONF_ENABLE_LOGGING, DEFAULT_ENABLE_LOGGING),
         )
+        current_compact_attributes = entry.options.get(
+            CONF_COMPACT_ATTRIBUTES,
+            DEFAULT_COMPACT_ATTRIBUTES,
+        )
         current_station_dn = entry.options.get(
             CONF_STATION_DN,
             entry.data.get(CONF_STATION_DN, ""),
@@ -431,8 +488,18 @@ class HuaweiChargerOptionsFlow(config_entries.OptionsFlow):
                 vol.Required(CONF_INTERVAL, default=current_interval): vol.All(
                     int, vol.Range(min=10, max=3600)
                 ),
+                vol.Required(CONF_CHARGING_INTERVAL, default=current_charging_interval): vol.All(
+                    int, vol.Range(min=10, max=3600)
+                ),
+                vol.Required(CONF_IDLE_INTERVAL, default=current_idle_interval): vol.All(
+                    int, vol.Range(min=10, max=3600)
+                ),
+                vol.Required(CONF_MAX_BACKOFF_INTERVAL, default=current_max_backoff_interval): vol.All(
+                    int, vol.Range(min=60, max=3600)
+                ),
                 vol.Required(CONF_VERIFY_SSL, default=current_verify_ssl): bool,
                 vol.Required(CONF_ENABLE_LOGGING, default=current_enable_logging): bool,
+                vol.Required(CONF_COMPACT_ATTRIBUTES, default=current_compact_attributes): bool,
                 vol.Optional(CONF_STATION_DN, default=current_station_dn): str,
                 vol.Optional(CONF_WALLBOX_DN, default=current_wallbox_dn): str,
             }
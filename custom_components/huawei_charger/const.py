@@ -6,12 +6,40 @@ CONF_VERIFY_SSL = "verify_ssl"
 CONF_ENABLE_LOGGING = "enable_logging"
 CONF_STATION_DN = "station_dn"
 CONF_WALLBOX_DN = "wallbox_dn"
+CONF_CHARGING_INTERVAL = "charging_interval"
+CONF_IDLE_INTERVAL = "idle_interval"
+CONF_MAX_BACKOFF_INTERVAL = "max_backoff_interval"
+CONF_COMPACT_ATTRIBUTES = "compact_attributes"
 
 DEFAULT_REQUEST_TIMEOUT = 15
+DEFAULT_POOL_MAXSIZE = 10  # concurrent FusionSolar connections per entry; further requests queue
+DEFAULT_POOL_IDLE_TIMEOUT = 90  # seconds before an idle keep-alive connection is closed
+DEFAULT_TOPOLOGY_REFRESH_INTERVAL = 900  # seconds between station/device-list/config catalog refreshes
+DEFAULT_CHARGING_INTERVAL = 15  # seconds between polls while a session is charging
+DEFAULT_IDLE_INTERVAL = 300  # seconds between polls while no car is plugged in
+DEFAULT_MAX_BACKOFF_INTERVAL = 900  # upper bound for the poll interval while the cloud keeps failing
+WRITE_BOOST_WINDOW = 120  # seconds of fast polling after a successful config write
+DEFAULT_ACCOUNT_SHARE_WINDOW = 10  # seconds a station/device-list response is shared between entries
 DEFAULT_LOCALE = "de_DE"
 DEFAULT_TIMEZONE_OFFSET = 120  # +2:00 fallback
 DEFAULT_FUSIONSOLAR_HOST = "intl.fusionsolar.huawei.com"
 DEFAULT_ENABLE_LOGGING = False
+DEFAULT_COMPACT_ATTRIBUTES = True  # keep bulky debug payloads out of entity attributes and the recorder
+DEFAULT_SESSION_CACHE_TTL = 8 * 3600  # seconds a stored FusionSolar session is reused
+SESSION_STORAGE_VERSION = 1
+
+# FusionSolar endpoints with request counters and latency histograms
+METRIC_OPERATIONS = (
+    "authenticate",
+    "station-list",
+    "wallbox-info",
+    "wallbox-realtime",
+    "wallbox-config-get-dn",
+    "wallbox-history",
+    "set-config-new",
+)
+DIAGNOSTIC_RESPONSE_HISTORY = 5  # raw responses kept per operation for the diagnostics download
+CYCLE_TRACE_HISTORY = 10  # update cycles whose phase timings are kept for diagnostics
 
 # Writable registers
 REG_FIXED_MAX_POWER = "538976598"
@@ -19,6 +47,10 @@ REG_DYNAMIC_POWER_LIMIT = "20001"
 WRITABLE_REGISTERS = [REG_FIXED_MAX_POWER, REG_DYNAMIC_POWER_LIMIT]
 SENSITIVE_REGISTERS = ["20034"]
 
+# Registers driving the adaptive poll interval
+REG_PLUGGED_IN = "20017"
+REG_SESSION_ENERGY = "10009"
+
 # Register name mapping
 REGISTER_NAME_MAP = {
     "device_status": "Device Status",
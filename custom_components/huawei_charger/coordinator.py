@@ -1,39 +1,158 @@
 import logging
 import re
-from datetime import timedelta, datetime
+from collections import deque
+from datetime import timedelta, datetime, timezone
+from functools import lru_cache
 from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 import asyncio
+import contextvars
 import json
 import time
 
-import requests
+import aiohttp
 
 from homeassistant.const import CONF_HOST
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.util.ssl import get_default_context, get_default_no_verify_context
 
 from .const import (
+    CONF_CHARGING_INTERVAL,
+    CONF_COMPACT_ATTRIBUTES,
     CONF_ENABLE_LOGGING,
+    CONF_IDLE_INTERVAL,
+    CONF_MAX_BACKOFF_INTERVAL,
     DOMAIN,
     CONF_INTERVAL,
     CONF_STATION_DN,
     CONF_VERIFY_SSL,
     CONF_WALLBOX_DN,
+    CYCLE_TRACE_HISTORY,
+    DEFAULT_CHARGING_INTERVAL,
+    DEFAULT_COMPACT_ATTRIBUTES,
     DEFAULT_ENABLE_LOGGING,
     DEFAULT_FUSIONSOLAR_HOST,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_BACKOFF_INTERVAL,
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_MAXSIZE,
     DEFAULT_REQUEST_TIMEOUT,
     DEFAULT_LOCALE,
+    DEFAULT_SESSION_CACHE_TTL,
     DEFAULT_TIMEZONE_OFFSET,
+    DEFAULT_TOPOLOGY_REFRESH_INTERVAL,
+    DIAGNOSTIC_RESPONSE_HISTORY,
+    METRIC_OPERATIONS,
+    REG_PLUGGED_IN,
+    REG_SESSION_ENERGY,
+    SESSION_STORAGE_VERSION,
     WRITABLE_REGISTERS,
+    WRITE_BOOST_WINDOW,
+)
+from .hub import FusionSolarAccountHub, SingleFlightGroup
+from .metrics import CycleTrace, EndpointMetrics
+from .schema import (
+    SIGNAL_ID_KEYS,
+    SIGNAL_VALUE_KEYS,
+    decode_signal_shape,
+    learn_signal_shape,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 _NUMERIC_PATTERN = re.compile(r"^-?\d+(?:\.\d+)?$")
 APP_TOKEN_PATH = "/rest/neteco/appauthen/v1/smapp/app/token"
+# Cycle-trace phase of each FusionSolar endpoint
+_REQUEST_PHASES = {
+    "authenticate": "auth",
+    "station-list": "station",
+    "wallbox-info": "device-list",
+    "wallbox-config-get-dn": "config-probe",
+    "wallbox-realtime": "realtime",
+    "wallbox-history": "history",
+    "set-config-new": "write",
+}
+# Trace of the update cycle the current task runs, and of the tasks it starts. A write
+# running in another task meanwhile does not add its requests to the cycle.
+_CYCLE_TRACE = contextvars.ContextVar("huawei_charger_cycle_trace", default=None)
+# Debug-state batch of the update cycle or write the current task runs.
+_DEBUG_BATCH = contextvars.ContextVar("huawei_charger_debug_batch", default=None)
+# Keys whose values are credentials: tokens, cookies and CSRF or session fields
+_RESPONSE_SECRET_KEYS = frozenset(
+    {
+        "password",
+        "accesstoken",
+        "refreshtoken",
+        "token",
+        "cookie",
+        "set-cookie",
+        "authorization",
+        "bspsession",
+        "dp-session",
+        "csrftoken",
+        "csrf-token",
+        "roarand",
+    }
+)
+# Debug attributes and log lines also hide the register values written or read
+_DEBUG_SECRET_KEYS = _RESPONSE_SECRET_KEYS | {"value"}
+_MAX_PAYLOAD_DEPTH = 64
+_CONFIG_SIGNAL_KEYS = frozenset(
+    {
+        "name",
+        "label",
+        "unit",
+        "value",
+        "realValue",
+        "defaultValue",
+        "rwFlag",
+        "readOnly",
+        "readonly",
+        "writable",
+        "writeable",
+        "min",
+        "max",
+        "minValue",
+        "maxValue",
+        "step",
+        "enumValues",
+        "options",
+        "optionList",
+        "range",
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _convert_register_string(value):
+    """Parse a register string once; FusionSolar repeats the same strings every cycle."""
+    stripped = value.strip()
+    if stripped == "":
+        return ""
+
+    lowered = stripped.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+
+    if _NUMERIC_PATTERN.match(stripped):
+        if "." in stripped:
+            number = float(stripped)
+            return int(number) if number.is_integer() else number
+        try:
+            return int(stripped)
+        except ValueError:
+            return stripped
+
+    return stripped
+
+
+def session_storage_key(entry_id):
+    """Return the storage key holding the cached FusionSolar session of an entry."""
+    return f"{DOMAIN}.{entry_id}.session"
 
 
 class FusionSolarRequestError(UpdateFailed):
@@ -48,8 +167,49 @@ class AuthenticationFailed(FusionSolarRequestError):
     """Raised when FusionSolar signals an authentication failure."""
 
 
+class FusionSolarResponse:
+    """Buffered FusionSolar HTTP response read from the aiohttp transport."""
+
+    def __init__(self, status_code, headers, text):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class _LazyLogArg:
+    """Log argument whose text is only built when the log record is formatted."""
+
+    __slots__ = ("_build", "_args")
+
+    def __init__(self, build, *args):
+        self._build = build
+        self._args = args
+
+    def __str__(self):
+        return str(self._build(*self._args))
+
+    __repr__ = __str__
+
+
+class _DebugBatch:
+    """Debug-state pushes of one update cycle or write, held until it ends."""
+
+    __slots__ = ("coordinator", "pending")
+
+    def __init__(self, coordinator):
+        self.coordinator = coordinator
+        self.pending = False
+
+
 class HuaweiChargerCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
+    # FusionSolar serves every API on HTTPS port 32800; a local emulator can override both.
+    api_scheme = "https"
+    api_port = 32800
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, account_hub: FusionSolarAccountHub | None = None):
         update_seconds = entry.options.get(CONF_INTERVAL, entry.data.get(CONF_INTERVAL, 30))
         super().__init__(
             hass,
@@ -67,27 +227,68 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             CONF_ENABLE_LOGGING,
             entry.data.get(CONF_ENABLE_LOGGING, DEFAULT_ENABLE_LOGGING),
         )
+        self.compact_attributes = entry.options.get(CONF_COMPACT_ATTRIBUTES, DEFAULT_COMPACT_ATTRIBUTES)
         self.request_timeout = DEFAULT_REQUEST_TIMEOUT
+        self.pool_maxsize = DEFAULT_POOL_MAXSIZE
+        self.pool_idle_timeout = DEFAULT_POOL_IDLE_TIMEOUT
+        self.topology_refresh_interval = DEFAULT_TOPOLOGY_REFRESH_INTERVAL
+        self.base_update_interval = update_seconds
+        self.charging_update_interval = entry.options.get(CONF_CHARGING_INTERVAL, DEFAULT_CHARGING_INTERVAL)
+        self.idle_update_interval = entry.options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL)
+        self.max_backoff_interval = entry.options.get(CONF_MAX_BACKOFF_INTERVAL, DEFAULT_MAX_BACKOFF_INTERVAL)
         self.preferred_station_dn = entry.options.get(CONF_STATION_DN, entry.data.get(CONF_STATION_DN))
         self.preferred_wallbox_dn = entry.options.get(CONF_WALLBOX_DN, entry.data.get(CONF_WALLBOX_DN))
 
         self.token = None
         self.headers = {}
         self.region_ip = None
+        self.roa_rand = None
         self.dn_id = None
         self.wallbox_dn = None
         self.wallbox_dn_id = None
         self.station_values = {}
         self.param_values = {}
+        self.additional_wallboxes = {}
+        self.data_generation = 0
+        self._register_snapshot = {}
+        self._register_generations = {}
+        self._new_register_keys = set()
+        self._response_shapes = {}
+        self.schema_fallbacks = {}
         self.config_signal_details = {}
         self.config_signal_values = {}
+        self._device_list_values = {}
+        # Cleared once FusionSolar answers a dn-filtered device list with another wallbox.
+        self._device_list_filtered = True
+        self._station_refreshed_at = None
+        self._topology_refreshed_at = None
         self.locale = self._derive_locale()
         self.timezone_offset = self._derive_timezone_offset()
         self.debug_data = self._build_debug_data()
         self._request_counter = 0
         self._last_realtime_signal_catalog = None
         self._last_config_signal_catalog = None
+        self.response_history = {}
+        self.signal_catalogs = {}
+        self.request_metrics = {operation: EndpointMetrics() for operation in METRIC_OPERATIONS}
+        self.cycle_traces = deque(maxlen=CYCLE_TRACE_HISTORY)
+        self._update_cycle = 0
+        self._unpublished_trace = None
         self._history_probe_completed = False
+        self._realtime_expected = True
+        self._session_store = Store(hass, SESSION_STORAGE_VERSION, session_storage_key(entry.entry_id))
+        self._session_expires_at = None
+        self._session_from_cache = False
+        self._saved_session_context = None
+        self._consecutive_failures = 0
+        self._plugged_in = None
+        self._charging = False
+        self._last_session_energy = None
+        self._write_boost_until = None
+        self.account_hub = account_hub or FusionSolarAccountHub(entry.entry_id)
+        self._inflight = SingleFlightGroup()
+        self._http_session = None
+        self._debug_push_handle = None
         self._debug_log(
             "Huawei coordinator initialized host=%s verify_ssl=%s update_interval=%ss",
             self.auth_host,
@@ -96,6 +297,71 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         )
 
     async def _async_update_data(self):
+        self._update_cycle += 1
+        batch_token = self._begin_debug_batch()
+        trace_token = self._start_cycle_trace()
+        notified_by_refresh = False
+        cycle_status = "error"
+        try:
+            param_values = await self._async_run_update_cycle()
+            cycle_status = "success"
+            # DataUpdateCoordinator notifies listeners after every successful cycle.
+            notified_by_refresh = True
+            return param_values
+        except Exception:
+            # A failed cycle only notifies listeners when the previous one succeeded.
+            notified_by_refresh = self.last_update_success
+            raise
+        finally:
+            self._finish_cycle_trace(trace_token, cycle_status)
+            self._end_debug_batch(batch_token, publish=not notified_by_refresh)
+            if not notified_by_refresh:
+                # Any notification ending this cycle was the debug batch publish above.
+                self._unpublished_trace = None
+
+    def _start_cycle_trace(self):
+        """Start the trace of this task's update cycle and return the token ending it."""
+        self._unpublished_trace = None
+        trace = CycleTrace(self._utc_timestamp(), time.monotonic())
+        try:
+            asyncio.get_running_loop().call_soon(trace.note_loop_lag, trace.started)
+        except RuntimeError:
+            pass
+        return _CYCLE_TRACE.set(trace)
+
+    def _finish_cycle_trace(self, token, status):
+        trace = _CYCLE_TRACE.get()
+        _CYCLE_TRACE.reset(token)
+        trace.status = status
+        trace.duration_ms = self._elapsed_ms(trace.started)
+        self.cycle_traces.append(trace)
+        self._unpublished_trace = trace
+        self._ensure_debug_data()
+        self.debug_data["last_update_spans"] = trace.as_dict()
+
+    def _hub_requester(self):
+        """Identify this entry's current update cycle to the account hub's read sharing."""
+        return self.entry.entry_id, self._update_cycle
+
+    def _trace_span(self, phase, started):
+        trace = _CYCLE_TRACE.get()
+        if trace is not None:
+            trace.add(phase, started, time.monotonic())
+
+    def async_update_listeners(self):
+        """Notify listeners, adding the publish time to the trace of the cycle this notification ends.
+
+        Debug pushes and post-write notifications belong to no cycle and are not traced.
+        """
+        trace = self._unpublished_trace
+        self._unpublished_trace = None
+        started = time.monotonic()
+        super().async_update_listeners()
+        if trace is not None:
+            trace.add("publish", started, time.monotonic())
+            self.debug_data["last_update_spans"] = trace.as_dict()
+
+    async def _async_run_update_cycle(self):
         cycle_started = time.monotonic()
         self._debug_log(
             "Huawei update cycle started host=%s token_present=%s region_ip=%s",
@@ -104,18 +370,21 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             self.region_ip,
         )
         for attempt in range(3):
+            trace = _CYCLE_TRACE.get()
+            if trace is not None:
+                trace.attempts = attempt + 1
             try:
-                await self.hass.async_add_executor_job(self._ensure_device_context)
-                await self.hass.async_add_executor_job(self.fetch_wallbox_info)
+                await self._async_refresh_device_data()
                 self._record_update_debug(
                     status="success",
                     duration_ms=self._elapsed_ms(cycle_started),
                 )
+                self._adapt_update_interval(succeeded=True)
                 return self.param_values
 
             except AuthenticationFailed as err:
                 _LOGGER.warning("Authentication failure on update attempt %s: %s", attempt + 1, err)
-                self._reset_auth_state()
+                self._reset_auth_state(token_rejected=True)
                 self._clear_register_debug_state()
                 self._record_update_debug(
                     status="error",
@@ -124,8 +393,9 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                     response_excerpt=getattr(err, "response_excerpt", None),
                 )
                 if attempt == 2:
+                    self._adapt_update_interval(succeeded=False)
                     raise ConfigEntryAuthFailed("Authentication failed after retries") from err
-                await asyncio.sleep(2 ** attempt)
+                await self._async_backoff(2 ** attempt)
             except Exception as err:
                 _LOGGER.warning("Update attempt %s/3 failed: %s", attempt + 1, err)
                 self._reset_auth_state()
@@ -137,11 +407,202 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                     response_excerpt=getattr(err, "response_excerpt", None),
                 )
                 if attempt < 2:
-                    await asyncio.sleep(2 ** attempt)
+                    await self._async_backoff(2 ** attempt)
                 else:
+                    self._adapt_update_interval(succeeded=False)
                     raise UpdateFailed(f"Update failed after retries: {err}") from err
 
-    def authenticate(self):
+    async def _async_backoff(self, delay):
+        started = time.monotonic()
+        await asyncio.sleep(delay)
+        self._trace_span("backoff", started)
+
+    def _adapt_update_interval(self, succeeded):
+        """Pick the next poll interval from the charger state and the cloud's health."""
+        if succeeded:
+            self._consecutive_failures = 0
+            self._observe_charging_state(self.param_values)
+        else:
+            self._consecutive_failures += 1
+
+        interval = timedelta(seconds=self._next_update_seconds())
+        if interval != self.update_interval:
+            self._debug_log(
+                "Huawei poll interval changed to %ss charging=%s plugged_in=%s failures=%s",
+                int(interval.total_seconds()),
+                self._charging,
+                self._plugged_in,
+                self._consecutive_failures,
+            )
+        self.update_interval = interval
+
+    def _observe_charging_state(self, values):
+        plugged_in = self._plugged_in_flag(values.get(REG_PLUGGED_IN))
+        session_energy = values.get(REG_SESSION_ENERGY)
+        if isinstance(session_energy, bool) or not isinstance(session_energy, (int, float)):
+            session_energy = None
+
+        previous_energy = self._last_session_energy
+        energy_advanced = (
+            session_energy is not None
+            and previous_energy is not None
+            and session_energy > previous_energy
+        )
+        # A fresh plug-in usually precedes a charging session, so poll fast until it is confirmed.
+        just_plugged_in = plugged_in is True and self._plugged_in is False
+        self._charging = bool(plugged_in) and (energy_advanced or just_plugged_in)
+        self._plugged_in = plugged_in
+        self._last_session_energy = session_energy
+
+    def _next_update_seconds(self):
+        base = self.base_update_interval
+        write_boost_until = self._write_boost_until
+        if self._charging or (
+            write_boost_until is not None and time.monotonic() < write_boost_until
+        ):
+            seconds = self.charging_update_interval
+        elif self._plugged_in is False:
+            seconds = self.idle_update_interval
+        else:
+            seconds = base
+
+        failures = self._consecutive_failures
+        if failures:
+            backoff = max(seconds, base) * 2 ** failures
+            seconds = min(backoff, max(self.max_backoff_interval, seconds))
+        return seconds
+
+    @staticmethod
+    def _plugged_in_flag(value):
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return value != 0
+        return None
+
+    async def _async_refresh_device_data(self):
+        """Fetch charger data, replacing a rejected cached session with a fresh login."""
+        await self._async_ensure_device_context()
+        try:
+            await self.async_fetch_wallbox_info()
+        except AuthenticationFailed:
+            if not self._session_from_cache:
+                raise
+            self._debug_log("Cached FusionSolar session was rejected; falling back to a full login")
+            await self._async_discard_session_context()
+            await self._async_ensure_device_context()
+            await self.async_fetch_wallbox_info()
+
+        self._session_from_cache = False
+        await self._async_save_session_context()
+
+    async def async_restore_session_context(self):
+        """Load a previously stored FusionSolar session so startup can skip the login."""
+        cached = await self._session_store.async_load()
+        if not isinstance(cached, dict):
+            return False
+
+        expires_at = cached.get("expires_at")
+        if (
+            cached.get("username") != self.username
+            or cached.get("auth_host") != self.auth_host
+            or not cached.get("token")
+            or not cached.get("region_ip")
+            or not isinstance(expires_at, (int, float))
+            or expires_at <= time.time()
+        ):
+            self._debug_log("Ignoring stale or mismatching cached FusionSolar session")
+            return False
+
+        self._apply_session_token(cached["token"], cached["region_ip"], cached.get("roa_rand"))
+        self.dn_id = cached.get("dn_id")
+        self.wallbox_dn = cached.get("wallbox_dn")
+        self.wallbox_dn_id = cached.get("wallbox_dn_id")
+        station_values = cached.get("station_values")
+        self.station_values = dict(station_values) if isinstance(station_values, dict) else {}
+        self._session_expires_at = expires_at
+        self._session_from_cache = True
+        self._saved_session_context = cached
+        if self.account_hub.current_session() is None:
+            self.account_hub.publish_session(
+                {
+                    "token": self.token,
+                    "region_ip": self.region_ip,
+                    "roa_rand": self.roa_rand,
+                    "expires_at": expires_at,
+                }
+            )
+        self._debug_log(
+            "Restored cached FusionSolar session region_ip=%s dn_id=%s wallbox_dn=%s",
+            self.region_ip,
+            self.dn_id,
+            self.wallbox_dn,
+        )
+        return True
+
+    def _session_context(self):
+        return {
+            "username": self.username,
+            "auth_host": self.auth_host,
+            "token": self.token,
+            "region_ip": self.region_ip,
+            "roa_rand": self.roa_rand,
+            "dn_id": self.dn_id,
+            "wallbox_dn": self.wallbox_dn,
+            "wallbox_dn_id": self.wallbox_dn_id,
+            "station_values": dict(self.station_values),
+            "expires_at": self._session_expires_at,
+        }
+
+    async def _async_save_session_context(self):
+        """Persist the session context whenever the login or discovered devices changed."""
+        if not self.token or self._session_expires_at is None:
+            return
+
+        context = self._session_context()
+        if context == self._saved_session_context:
+            return
+
+        await self._session_store.async_save(context)
+        self._saved_session_context = context
+
+    async def _async_discard_session_context(self):
+        self._reset_auth_state(token_rejected=True)
+        self._saved_session_context = None
+        await self._session_store.async_remove()
+
+    def _apply_session_token(self, token, region_ip, roa_rand=None):
+        self.token = token
+        self.region_ip = region_ip
+        self.roa_rand = str(roa_rand) if roa_rand else None
+
+        cookie_locale = self.locale.replace("_", "-").lower()
+        self.headers = {
+            "Cookie": (
+                f"locale={cookie_locale};bspsession={self.token};"
+                f"dp-session={self.token}; Secure; HttpOnly"
+            ),
+            "Content-Type": "application/json",
+            "x-timezone-offset": str(self.timezone_offset),
+            "User-Agent": "iCleanPower/24.6.102006",
+        }
+        if self.roa_rand:
+            self.headers["roaRand"] = self.roa_rand
+
+    async def async_authenticate(self):
+        """Adopt the account's shared login, or log in once for every waiting entry."""
+        session = self.account_hub.current_session()
+        if session is None:
+            session = await self.account_hub.async_login(self._async_login)
+        else:
+            self._debug_log("Reusing the FusionSolar login shared by account %s", self.account_hub.account_id)
+
+        self._apply_session_token(session["token"], session["region_ip"], session.get("roa_rand"))
+        self._session_expires_at = session.get("expires_at")
+        self._session_from_cache = False
+        await self.async_fetch_station_dn()
+
+    async def _async_login(self):
         payload = {
             "userName": self.username,
             "value": self.password,
@@ -149,10 +610,10 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             "verifyCode": "",
             "appClientId": "86366133-B8B5-41FA-8EB9-E5A64229E3E1",
         }
-        last_response_excerpt = None
+        last_response_data = None
 
         for candidate_host in self._authentication_hosts():
-            response = self._request_post(
+            response = await self._async_request_post(
                 self._app_token_url(candidate_host),
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -160,7 +621,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             )
             data = self._json_or_error(response, f"authenticate:{candidate_host}")
             token_data = data.get("data") or {}
-            last_response_excerpt = self._json_dump(data)
+            last_response_data = data
 
             token = self._extract_token(token_data)
             self._debug_log(
@@ -173,34 +634,38 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             if not token:
                 continue
 
-            self.token = token
-            self.region_ip = self._extract_region_host(token_data) or candidate_host
-
-            cookie_locale = self.locale.replace("_", "-").lower()
-            self.headers = {
-                "Cookie": (
-                    f"locale={cookie_locale};bspsession={self.token};"
-                    f"dp-session={self.token}; Secure; HttpOnly"
-                ),
-                "Content-Type": "application/json",
-                "x-timezone-offset": str(self.timezone_offset),
-                "User-Agent": "iCleanPower/24.6.102006",
+            return {
+                "token": token,
+                "region_ip": self._extract_region_host(token_data) or candidate_host,
+                "roa_rand": token_data.get("roaRand") or token_data.get("csrfToken"),
+                "expires_at": time.time() + DEFAULT_SESSION_CACHE_TTL,
             }
 
-            roa_rand = token_data.get("roaRand") or token_data.get("csrfToken")
-            if roa_rand:
-                self.headers["roaRand"] = str(roa_rand)
-
-            self.fetch_station_dn()
-            return
-
         raise UpdateFailed(
             f"Authentication response missing access token"
-            f"{f': {last_response_excerpt}' if last_response_excerpt else ''}"
+            f"{f': {self._json_dump(last_response_data)}' if last_response_data is not None else ''}"
         )
 
-    def fetch_station_dn(self):
-        url = f"https://{self.region_ip}:32800/rest/pvms/web/station/v1/station/station-list"
+    async def async_fetch_station_dn(self):
+        stations = await self.account_hub.async_station_list(
+            self.region_ip, self._async_fetch_station_list, self._hub_requester()
+        )
+        station = self._select_record(
+            stations,
+            key="dn",
+            preferred=getattr(self, "preferred_station_dn", None),
+            current=self.dn_id,
+            entity_name="station",
+        )
+        self.dn_id = station["dn"]
+        self.station_values = {}
+        charge_store = station.get("chargeStore")
+        if charge_store is not None:
+            self.station_values["charge_store"] = str(charge_store)
+        self._station_refreshed_at = time.monotonic()
+
+    async def _async_fetch_station_list(self):
+        url = self._api_url(self.region_ip, "/rest/pvms/web/station/v1/station/station-list")
         payload = {
             "locale": self.locale,
             "sortId": "createTime",
@@ -210,7 +675,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             "sortDir": "DESC",
             "curPage": 1
         }
-        response = self._request_post(
+        response = await self._async_request_post(
             url,
             json=payload,
             headers=self.headers,
@@ -221,32 +686,234 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         if not data.get("data", {}).get("list"):
             raise ValueError("No stations found in account")
         
-        stations = data["data"]["list"]
-        station = self._select_record(
-            stations,
+        return data["data"]["list"]
+
+    async def async_fetch_wallbox_info(self):
+        return await self._async_single_flight(("wallbox-info", self.wallbox_dn), self._async_fetch_wallbox_info)
+
+    async def _async_fetch_wallbox_info(self):
+        param_values = None
+        if not self._topology_refresh_due():
+            param_values = await self._async_fetch_telemetry()
+            if param_values is None:
+                self._debug_log("Wallbox telemetry lookup missed; refreshing station topology")
+        refreshed = param_values is None
+        if refreshed:
+            param_values = await self._async_refresh_topology()
+
+        param_values.update(self.station_values)
+        self.param_values = param_values
+        if refreshed or self.additional_wallboxes:
+            await self._async_fetch_additional_wallboxes()
+        self._track_register_changes()
+        self._update_register_debug_state()
+
+        if self._debug_enabled() and (self.param_values or self.config_signal_values):
+            available_registers = sorted(
+                {str(reg_id) for reg_id in self.param_values.keys()}.union(self.config_signal_values.keys())
+            )
+            self._debug_log("Available register IDs from charger: %s", sorted(available_registers))
+
+            for reg_id in WRITABLE_REGISTERS + ["10009", "10010", "20017"]:
+                reg_value = self.get_register_value(reg_id)
+                if reg_value is not None:
+                    self._debug_log("Register %s value: %s", reg_id, reg_value)
+
+        return self.param_values
+
+    def _topology_refresh_due(self):
+        """Return True when the station/device/config topology must be fetched again."""
+        if not self.wallbox_dn or self._topology_refreshed_at is None:
+            return True
+        return time.monotonic() - self._topology_refreshed_at >= self.topology_refresh_interval
+
+    async def _async_refresh_topology(self):
+        """Fetch the device list and config catalog, plus realtime values when needed."""
+        known_station_dn = self.dn_id
+        known_wallbox_dn = self.wallbox_dn
+        refresh_station = (
+            self._station_refreshed_at is None
+            or time.monotonic() - self._station_refreshed_at >= self.topology_refresh_interval
+        )
+        realtime_values = None
+        if known_wallbox_dn:
+            # The config probe and realtime call only need the cached wallbox dn,
+            # so they can run alongside the device-list request.
+            fetch_realtime = self._realtime_expected
+            cycle_requests = [
+                self._async_fetch_wallbox_record(),
+                self.async_fetch_wallbox_config_probe(),
+            ]
+            if fetch_realtime:
+                cycle_requests.append(self.async_fetch_wallbox_realtime_data())
+            if refresh_station:
+                cycle_requests.append(self.async_fetch_station_dn())
+            results = await self._async_gather_cycle(cycle_requests)
+            wallbox = results[0]
+            if fetch_realtime:
+                realtime_values = results[2]
+        else:
+            if refresh_station:
+                await self.async_fetch_station_dn()
+            wallbox = await self._async_fetch_wallbox_record()
+
+        self.wallbox_dn = wallbox.get("dn")
+        self.wallbox_dn_id = wallbox["dnId"]
+        if self.wallbox_dn != known_wallbox_dn:
+            if known_wallbox_dn:
+                self._debug_log(
+                    "Wallbox selection changed from %s to %s; discarding concurrent results",
+                    known_wallbox_dn,
+                    self.wallbox_dn,
+                )
+            realtime_values = None
+            await self.async_fetch_wallbox_config_probe()
+
+        param_values = self._wallbox_record_values(wallbox)
+        self._device_list_values = dict(param_values)
+        self._realtime_expected = self._should_fetch_realtime_data(param_values)
+        if self._realtime_expected:
+            if realtime_values is None:
+                realtime_values = await self.async_fetch_wallbox_realtime_data()
+            if realtime_values:
+                self._debug_log(
+                    "Using wallbox realtime-data signals because device-list returned limited paramValues"
+                )
+                param_values.update(realtime_values)
+
+        if self.dn_id != known_station_dn and known_wallbox_dn:
+            # The device list above was queried under the previous station dn.
+            self._topology_refreshed_at = None
+        else:
+            self._topology_refreshed_at = time.monotonic()
+        return param_values
+
+    async def _async_fetch_telemetry(self):
+        """Fetch the live values of the known wallbox; return None on a lookup miss.
+
+        deviceStatus only comes with the device list, so every poll reads the
+        device list alongside the realtime data. While the entry shows no other
+        wallboxes, only the known wallbox's record is read.
+        """
+        if self._device_list_filtered and not self.additional_wallboxes:
+            record_request = self._async_fetch_own_wallbox_record()
+        else:
+            record_request = self._async_fetch_wallbox_record()
+        realtime_values = None
+        if self._realtime_expected:
+            wallbox, realtime_values = await self._async_gather_cycle(
+                [record_request, self.async_fetch_wallbox_realtime_data()]
+            )
+            if not realtime_values:
+                return None
+        else:
+            wallbox = await record_request
+        if wallbox.get("dn") != self.wallbox_dn:
+            return None
+
+        param_values = self._wallbox_record_values(wallbox)
+        if realtime_values is None and self._should_fetch_realtime_data(param_values):
+            return None
+        self._device_list_values = dict(param_values)
+        if realtime_values:
+            param_values.update(realtime_values)
+        return param_values
+
+    async def _async_fetch_additional_wallboxes(self):
+        """Expose the station's other wallboxes from the device-list response of this cycle."""
+        if self.preferred_wallbox_dn:
+            # An entry pinned to one wallbox leaves the others to their own entries.
+            self.additional_wallboxes = {}
+            return
+
+        previous = self.additional_wallboxes
+        # Every poll reads the device list for deviceStatus; the account hub answers this from this cycle's response.
+        records = await self.account_hub.async_device_list(
+            self.dn_id, self._async_fetch_device_list, self._hub_requester()
+        )
+        # Wallboxes pinned by other entries of the account already have their own devices.
+        claimed = self.account_hub.claimed_wallboxes(self.entry.entry_id)
+        wallboxes = {}
+        for record in records:
+            wallbox_dn = record.get("dn")
+            if not wallbox_dn or wallbox_dn == self.wallbox_dn or wallbox_dn in claimed:
+                continue
+            device_values = self._wallbox_record_values(record)
+            wallboxes[wallbox_dn] = {
+                "dn_id": record.get("dnId"),
+                "name": record.get("name") or device_values.get("33595393") or wallbox_dn,
+                "realtime": self._should_fetch_realtime_data(device_values),
+                "device_values": device_values,
+                "values": previous.get(wallbox_dn, {}).get("values", {}),
+            }
+
+        realtime_dns = [wallbox_dn for wallbox_dn, wallbox in wallboxes.items() if wallbox["realtime"]]
+        results = await asyncio.gather(
+            *(self.async_fetch_wallbox_realtime_data(wallbox_dn) for wallbox_dn in realtime_dns),
+            return_exceptions=True,
+        )
+        realtime_values = dict(zip(realtime_dns, results))
+        for wallbox_dn, wallbox in wallboxes.items():
+            live_values = realtime_values.get(wallbox_dn)
+            if isinstance(live_values, BaseException):
+                # Keep the last values of this wallbox; the primary wallbox already updated fine.
+                self._debug_log("Realtime data for wallbox %s failed: %s", wallbox_dn, live_values)
+                continue
+            values = dict(wallbox["device_values"])
+            values.update(live_values or {})
+            values.update(self.station_values)
+            wallbox["values"] = values
+        self.additional_wallboxes = wallboxes
+
+    def _wallbox_record_values(self, wallbox):
+        param_values = self._normalize_param_values(wallbox.get("paramValues", {}))
+        device_status = wallbox.get("deviceStatus")
+        if device_status is not None:
+            param_values["device_status"] = str(device_status)
+        return param_values
+
+    async def _async_fetch_wallbox_record(self):
+        records = await self.account_hub.async_device_list(
+            self.dn_id, self._async_fetch_device_list, self._hub_requester()
+        )
+        preferred = getattr(self, "preferred_wallbox_dn", None)
+        if not preferred:
+            claimed = self.account_hub.claimed_wallboxes(self.entry.entry_id)
+            records = [record for record in records if record.get("dn") not in claimed] or records
+        return self._select_record(
+            records,
             key="dn",
-            preferred=getattr(self, "preferred_station_dn", None),
-            current=self.dn_id,
-            entity_name="station",
+            preferred=preferred,
+            current=self.wallbox_dn,
+            entity_name="wallbox",
         )
-        self.dn_id = station["dn"]
-        self.station_values = {}
-        charge_store = station.get("chargeStore")
-        if charge_store is not None:
-            self.station_values["charge_store"] = str(charge_store)
 
-    def fetch_wallbox_info(self):
-        url = f"https://{self.region_ip}:32800/rest/neteco/web/config/device/v1/device-list"
+    async def _async_fetch_own_wallbox_record(self):
+        """Read the device-list record of the known wallbox alone; return {} when it is gone."""
+        records = await self._async_fetch_device_list(self.wallbox_dn)
+        record = records[0] if records else {}
+        if record and record.get("dn") != self.wallbox_dn:
+            # FusionSolar ignored the dn filter; read the whole station list from now on.
+            self._debug_log("Device list is not filtered by dn; reading the full station list")
+            self._device_list_filtered = False
+        return record
+
+    async def _async_fetch_device_list(self, wallbox_dn=None):
+        """Read the station's wallboxes, or only ``wallbox_dn`` when it is given."""
+        url = self._api_url(self.region_ip, "/rest/neteco/web/config/device/v1/device-list")
         payload = (
             f"conditionParams.curPage=0&"
             f"conditionParams.mocTypes=60080&"
             f"conditionParams.parentDn={self.dn_id}&"
-            f"conditionParams.recordperpage=500"
         )
+        if wallbox_dn:
+            payload += f"conditionParams.dn={wallbox_dn}&conditionParams.recordperpage=1"
+        else:
+            payload += "conditionParams.recordperpage=500"
         headers = self.headers.copy()
         headers["Content-Type"] = "application/x-www-form-urlencoded"
 
-        response = self._request_post(
+        response = await self._async_request_post(
             url,
             data=payload,
             headers=headers,
@@ -254,83 +921,73 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         )
 
         data = self._json_or_error(response, "wallbox-info", default={})
-        self._debug_log("Full wallbox fetch response: %s", self._json_dump(data))
+        self._debug_log("Full wallbox fetch response: %s", self._lazy(self._json_dump, data))
 
+        if wallbox_dn:
+            return data["data"] if isinstance(data.get("data"), list) else []
         if not data.get("data") or not isinstance(data["data"], list) or len(data["data"]) == 0:
             raise ValueError("No wallbox devices found in station")
 
-        wallboxes = data["data"]
-        wallbox = self._select_record(
-            wallboxes,
-            key="dn",
-            preferred=getattr(self, "preferred_wallbox_dn", None),
-            current=self.wallbox_dn,
-            entity_name="wallbox",
-        )
-        self.wallbox_dn = wallbox.get("dn")
-        self.wallbox_dn_id = wallbox["dnId"]
-        self.fetch_wallbox_config_probe()
-        self.param_values = self._normalize_param_values(wallbox.get("paramValues", {}))
-        device_status = wallbox.get("deviceStatus")
-        if device_status is not None:
-            self.param_values["device_status"] = str(device_status)
-        if self._should_fetch_realtime_data(self.param_values):
-            realtime_values = self.fetch_wallbox_realtime_data()
-            if realtime_values:
-                self._debug_log(
-                    "Using wallbox realtime-data signals because device-list returned limited paramValues"
-                )
-                self.param_values.update(realtime_values)
-        self.param_values.update(self.station_values)
-        self._update_register_debug_state()
-
-        if self.param_values or self.config_signal_values:
-            available_registers = sorted(
-                {str(reg_id) for reg_id in self.param_values.keys()}.union(self.config_signal_values.keys())
-            )
-            self._debug_log("Available register IDs from charger: %s", sorted(available_registers))
+        return data["data"]
 
-            for reg_id in WRITABLE_REGISTERS + ["10009", "10010", "20017"]:
-                reg_value = self.get_register_value(reg_id)
-                if reg_value is not None:
-                    self._debug_log("Register %s value: %s", reg_id, reg_value)
+    async def _async_single_flight(self, key, request):
+        """Share one in-flight per-wallbox request between concurrent callers."""
+        return await self._inflight.async_do(key, request)
 
-        return self.param_values
+    async def _async_gather_cycle(self, cycle_requests):
+        """Run independent cycle requests concurrently, re-raising the first failure in plan order."""
+        results = await asyncio.gather(*cycle_requests, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
 
-    def fetch_wallbox_realtime_data(self):
-        if not self.wallbox_dn:
+    async def async_fetch_wallbox_realtime_data(self, device_dn=None):
+        primary = device_dn is None
+        device_dn = self.wallbox_dn if primary else device_dn
+        if not device_dn:
             self._debug_log("Skipping wallbox realtime-data request because wallbox dn is missing")
             return {}
 
-        url = f"https://{self.region_ip}:32800/rest/pvms/web/device/v1/device-realtime-data"
-        response = self._request_get(
+        url = self._api_url(self.region_ip, "/rest/pvms/web/device/v1/device-realtime-data")
+        response = await self._async_request_get(
             url,
             params={
-                "deviceDn": self.wallbox_dn,
+                "deviceDn": device_dn,
                 "_": round(time.time() * 1000),
             },
             headers=self.headers,
             operation="wallbox-realtime",
         )
         data = self._json_or_error(response, "wallbox-realtime", default={})
-        self._debug_log("Full wallbox realtime response: %s", self._json_dump(data))
+        self._debug_log("Full wallbox realtime response: %s", self._lazy(self._json_dump, data))
+
+        walked = self._decode_signal_payload("wallbox-realtime", data)
+        signal_values = walked["values"]
+        if not primary:
+            return self._normalize_param_values(signal_values)
 
-        signal_values = self._extract_signal_values(data)
-        signal_catalog = self._extract_signal_catalog(data)
-        self._log_realtime_signal_catalog(signal_catalog)
+        self.signal_catalogs["wallbox-realtime"] = walked["catalog"]
+        self._log_realtime_signal_catalog(walked["catalog"])
         if signal_values:
             self._debug_log(
                 "Available realtime register IDs from charger: %s",
                 sorted(signal_values.keys()),
             )
             if not self._history_probe_completed:
-                self.fetch_wallbox_history_probe(sorted(signal_values.keys()))
+                await self.async_fetch_wallbox_history_probe(sorted(signal_values.keys()))
             return self._normalize_param_values(signal_values)
 
         self._debug_log("Wallbox realtime-data response did not contain usable signals")
         return {}
 
-    def fetch_wallbox_config_probe(self):
+    async def async_fetch_wallbox_config_probe(self):
+        return await self._async_single_flight(
+            ("config-probe", self.wallbox_dn),
+            self._async_fetch_config_probe,
+        )
+
+    async def _async_fetch_config_probe(self):
         if not self.wallbox_dn and not self.wallbox_dn_id:
             self._debug_log("Skipping wallbox config probes because dn and dnId are missing")
             self.config_signal_values = {}
@@ -339,7 +996,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         discovered_values = {}
         for probe in self._config_probe_requests():
             try:
-                response = self._request_get(
+                response = await self._async_request_get(
                     probe["url"],
                     params=probe.get("params"),
                     headers=self.headers,
@@ -349,16 +1006,18 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                 self._debug_log(
                     "Full %s response: %s",
                     probe["operation"],
-                    self._json_dump(data),
+                    self._lazy(self._json_dump, data),
                 )
-                signal_catalog = self._extract_config_signal_catalog(data)
+                walked = self._walk_signal_payload(data, config_catalog=True)
+                signal_catalog = walked["config_catalog"]
+                self.signal_catalogs[probe["operation"]] = signal_catalog
                 self._store_config_signal_details(signal_catalog)
                 discovered_values.update(self._config_signal_values_from_catalog(signal_catalog))
                 self._log_config_signal_catalog(probe["operation"], signal_catalog)
                 self._debug_log(
                     "Wallbox config probe %s returned signal_ids=%s",
                     probe["operation"],
-                    sorted(self._extract_signal_ids(data)),
+                    sorted(walked["ids"]),
                 )
             except Exception as err:
                 self._debug_log(
@@ -378,17 +1037,17 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             {
                 "method": "GET",
                 "operation": "wallbox-config-get-dn",
-                "url": f"https://{self.region_ip}:32800/rest/pvms/web/device/v1/deviceExt/get-config-signals",
+                "url": self._api_url(self.region_ip, "/rest/pvms/web/device/v1/deviceExt/get-config-signals"),
                 "params": {"dn": self.wallbox_dn, "_": timestamp},
             }
         ]
 
-    def fetch_wallbox_history_probe(self, realtime_signal_ids):
+    async def async_fetch_wallbox_history_probe(self, realtime_signal_ids):
         if not self.wallbox_dn:
             return
 
         requested_signal_ids = self._history_probe_signal_ids(realtime_signal_ids)
-        url = f"https://{self.region_ip}:32800/rest/pvms/web/device/v1/device-history-data"
+        url = self._api_url(self.region_ip, "/rest/pvms/web/device/v1/device-history-data")
         params = [("signalIds", signal_id) for signal_id in requested_signal_ids]
         params.extend(
             [
@@ -399,15 +1058,15 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         )
 
         try:
-            response = self._request_get(
+            response = await self._async_request_get(
                 url,
                 params=params,
                 headers=self.headers,
                 operation="wallbox-history",
             )
             data = self._json_or_error(response, "wallbox-history", default={})
-            self._debug_log("Full wallbox history response: %s", self._json_dump(data))
-            returned_signal_ids = sorted(self._extract_signal_ids(data))
+            self._debug_log("Full wallbox history response: %s", self._lazy(self._json_dump, data))
+            returned_signal_ids = sorted(self._decode_signal_payload("wallbox-history", data)["ids"])
             self._debug_log(
                 "Wallbox history probe requested_ids=%s returned_ids=%s",
                 requested_signal_ids,
@@ -418,7 +1077,14 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         finally:
             self._history_probe_completed = True
 
-    def set_config_value(self, param_id: str, value, retries=3):
+    async def async_set_config_value(self, param_id: str, value, retries=3):
+        batch_token = self._begin_debug_batch()
+        try:
+            return await self._async_write_config_value(param_id, value, retries)
+        finally:
+            self._end_debug_batch(batch_token, publish=True)
+
+    async def _async_write_config_value(self, param_id, value, retries):
         write_started = time.monotonic()
         self._record_write_debug(
             status="pending",
@@ -428,9 +1094,9 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         )
 
         try:
-            self._ensure_device_context()
+            await self._async_ensure_device_context()
             if not self.wallbox_dn or not self.wallbox_dn_id:
-                self.fetch_wallbox_info()
+                await self.async_fetch_wallbox_info()
         except Exception as err:
             _LOGGER.error("Unable to prepare charger context before writing %s: %s", param_id, err)
             self._record_write_debug(
@@ -452,7 +1118,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                         headers = self.headers.copy()
                         if target.get("data") is not None:
                             headers["Content-Type"] = "application/x-www-form-urlencoded"
-                        response = self._request_post(
+                        response = await self._async_request_post(
                             target["url"],
                             json=target.get("json"),
                             data=target.get("data"),
@@ -464,12 +1130,11 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                             target["operation"],
                             default={},
                         )
-                        response_excerpt = self._json_dump(data)
                         self._debug_log(
                             "Set config response for %s via %s: %s",
                             param_id,
                             target["operation"],
-                            response_excerpt,
+                            self._lazy(self._json_dump, data),
                         )
                         if response.status_code == 200 and self._payload_succeeded(data):
                             normalized_value = self._convert_register_value(value)
@@ -477,7 +1142,9 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                             self.config_signal_values[str(param_id)] = normalized_value
                             if str(param_id) in self.config_signal_details:
                                 self.config_signal_details[str(param_id)]["value"] = normalized_value
+                            self._track_register_changes()
                             self._update_register_debug_state()
+                            self._write_boost_until = time.monotonic() + WRITE_BOOST_WINDOW
                             _LOGGER.warning(
                                 "Successfully set config %s to %s using %s",
                                 param_id,
@@ -490,16 +1157,21 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                                 value=value,
                                 attempts=attempt + 1,
                                 duration_ms=self._elapsed_ms(write_started),
-                                response_excerpt=response_excerpt,
+                                # Compact mode serves the response from the diagnostics capture instead.
+                                response_excerpt=(
+                                    None
+                                    if self.compact_attributes
+                                    else self._json_dump(data)
+                                ),
                             )
                             return True
                         raise FusionSolarRequestError(
                             f"Huawei config write for {param_id} returned an unsuccessful payload",
-                            response_excerpt=response_excerpt,
+                            response_excerpt=self._json_dump(data),
                         )
                     except AuthenticationFailed:
                         raise
-                    except (FusionSolarRequestError, UpdateFailed, requests.RequestException) as err:
+                    except (FusionSolarRequestError, UpdateFailed, aiohttp.ClientError) as err:
                         last_write_error = err
                         response_excerpt = getattr(err, "response_excerpt", response_excerpt)
                         self._debug_log(
@@ -512,7 +1184,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                     raise last_write_error
             except AuthenticationFailed as err:
                 _LOGGER.warning("Authentication expired while writing %s; refreshing token", param_id)
-                self._reset_auth_state()
+                self._reset_auth_state(token_rejected=True)
                 self._record_write_debug(
                     status="retrying" if attempt < retries - 1 else "error",
                     param_id=param_id,
@@ -523,9 +1195,9 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                     response_excerpt=getattr(err, "response_excerpt", None),
                 )
                 try:
-                    self._ensure_device_context()
+                    await self._async_ensure_device_context()
                     if not self.wallbox_dn or not self.wallbox_dn_id:
-                        self.fetch_wallbox_info()
+                        await self.async_fetch_wallbox_info()
                 except Exception as refresh_err:
                     _LOGGER.warning(
                         "Unable to restore charger context after auth refresh for %s: %s",
@@ -553,7 +1225,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                     duration_ms=self._elapsed_ms(write_started),
                     response_excerpt=getattr(err, "response_excerpt", None),
                 )
-            except requests.RequestException as err:
+            except aiohttp.ClientError as err:
                 _LOGGER.warning("Set config attempt %s/%s failed: %s", attempt + 1, retries, err)
                 self._record_write_debug(
                     status="retrying" if attempt < retries - 1 else "error",
@@ -565,7 +1237,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                 )
 
             if attempt < retries - 1:
-                time.sleep(2 ** attempt)
+                await self._async_backoff(2 ** attempt)
             else:
                 _LOGGER.error("Failed to set config %s after %s attempts", param_id, retries)
 
@@ -579,7 +1251,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             targets.append(
                 {
                     "operation": f"set-config-new:{param_id}",
-                    "url": f"https://{self.region_ip}:32800/rest/pvms/web/device/v1/deviceExt/set-config-signals",
+                    "url": self._api_url(self.region_ip, "/rest/pvms/web/device/v1/deviceExt/set-config-signals"),
                     "json": None,
                     "data": {
                         "dn": self.wallbox_dn,
@@ -590,113 +1262,206 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
 
         return targets
 
-    def _request_post(self, url, *, json=None, data=None, headers=None, operation=None):
+    async def _async_request_post(self, url, *, json=None, data=None, headers=None, operation=None):
         """Wrapper for POST requests with shared settings."""
         self._request_counter += 1
         request_id = self._request_counter
-        started = time.monotonic()
-        try:
-            self._debug_log(
-                "Huawei HTTP #%s %s request url=%s json=%s data=%s headers=%s",
-                request_id,
-                operation or "POST",
-                url,
-                self._debug_repr(json),
-                self._debug_repr(data),
-                self._debug_repr(headers),
-            )
-            response = requests.post(
-                url,
-                json=json,
-                data=data,
-                headers=headers,
-                verify=self.verify_ssl,
-                timeout=self.request_timeout,
-            )
-            self._debug_log(
-                "Huawei HTTP #%s %s response status=%s duration_ms=%s headers=%s body=%s",
-                request_id,
-                operation or "POST",
-                response.status_code,
-                self._elapsed_ms(started),
-                self._response_headers_excerpt(response),
-                self._response_excerpt(response),
-            )
-            response.raise_for_status()
-            return response
-        except requests.exceptions.SSLError as err:
-            ssl_hint = " (disable verify_ssl in integration options)" if self.verify_ssl else ""
-            raise UpdateFailed(f"SSL error during request{ssl_hint}") from err
-        except requests.exceptions.Timeout as err:
-            raise UpdateFailed("Request timeout while contacting FusionSolar API") from err
-        except requests.exceptions.ConnectionError as err:
-            raise UpdateFailed("Connection error to FusionSolar API") from err
-        except requests.exceptions.HTTPError as err:
-            status = err.response.status_code if err.response is not None else "unknown"
-            response_excerpt = self._response_excerpt(err.response)
-            detail = f": {response_excerpt}" if response_excerpt else ""
-            if status in (401, 403):
-                raise AuthenticationFailed(
-                    f"HTTP {status} authentication error from FusionSolar{detail}",
-                    response_excerpt=response_excerpt,
-                ) from err
-            raise FusionSolarRequestError(
-                f"HTTP {status} error while contacting FusionSolar API{detail}",
-                response_excerpt=response_excerpt,
-            ) from err
+        self._debug_log(
+            "Huawei HTTP #%s %s request url=%s json=%s data=%s headers=%s",
+            request_id,
+            operation or "POST",
+            url,
+            self._lazy(self._debug_repr, json),
+            self._lazy(self._debug_repr, data),
+            self._lazy(self._debug_repr, headers),
+        )
+        return await self._async_request(
+            "POST",
+            url,
+            request_id=request_id,
+            operation=operation or "POST",
+            json=json,
+            data=data,
+            headers=headers,
+        )
 
-    def _request_get(self, url, *, params=None, headers=None, operation=None):
+    async def _async_request_get(self, url, *, params=None, headers=None, operation=None):
         """Wrapper for GET requests with shared settings."""
         self._request_counter += 1
         request_id = self._request_counter
+        self._debug_log(
+            "Huawei HTTP #%s %s request url=%s params=%s headers=%s",
+            request_id,
+            operation or "GET",
+            url,
+            self._lazy(self._debug_repr, params),
+            self._lazy(self._debug_repr, headers),
+        )
+        return await self._async_request(
+            "GET",
+            url,
+            request_id=request_id,
+            operation=operation or "GET",
+            params=params,
+            headers=headers,
+        )
+
+    async def _async_request(self, method, url, *, request_id, operation, **kwargs):
+        """Send a request over the shared aiohttp session and map transport errors."""
         started = time.monotonic()
         try:
-            self._debug_log(
-                "Huawei HTTP #%s %s request url=%s params=%s headers=%s",
-                request_id,
-                operation or "GET",
-                url,
-                self._debug_repr(params),
-                self._debug_repr(headers),
-            )
-            response = requests.get(
+            async with self._get_session().request(
+                method,
                 url,
-                params=params,
-                headers=headers,
-                verify=self.verify_ssl,
-                timeout=self.request_timeout,
-            )
-            self._debug_log(
-                "Huawei HTTP #%s %s response status=%s duration_ms=%s headers=%s body=%s",
-                request_id,
-                operation or "GET",
-                response.status_code,
-                self._elapsed_ms(started),
-                self._response_headers_excerpt(response),
-                self._response_excerpt(response),
-            )
-            response.raise_for_status()
-            return response
-        except requests.exceptions.SSLError as err:
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                **kwargs,
+            ) as raw_response:
+                response = FusionSolarResponse(
+                    raw_response.status,
+                    dict(raw_response.headers),
+                    await raw_response.text(errors="replace"),
+                )
+        except aiohttp.ClientSSLError as err:
+            self._record_request_metric(operation, started, error=True)
             ssl_hint = " (disable verify_ssl in integration options)" if self.verify_ssl else ""
             raise UpdateFailed(f"SSL error during request{ssl_hint}") from err
-        except requests.exceptions.Timeout as err:
+        except asyncio.TimeoutError as err:
+            self._record_request_metric(operation, started, error=True)
             raise UpdateFailed("Request timeout while contacting FusionSolar API") from err
-        except requests.exceptions.ConnectionError as err:
+        except aiohttp.ClientError as err:
+            self._record_request_metric(operation, started, error=True)
             raise UpdateFailed("Connection error to FusionSolar API") from err
-        except requests.exceptions.HTTPError as err:
-            status = err.response.status_code if err.response is not None else "unknown"
-            response_excerpt = self._response_excerpt(err.response)
+
+        duration_ms = self._record_request_metric(operation, started, error=response.status_code >= 400)
+        self._capture_response(operation, request_id, response, duration_ms)
+        self._debug_log(
+            "Huawei HTTP #%s %s response status=%s duration_ms=%s headers=%s body=%s",
+            request_id,
+            operation,
+            response.status_code,
+            duration_ms,
+            self._lazy(self._response_headers_excerpt, response),
+            self._lazy(self._response_excerpt, response),
+        )
+        if response.status_code >= 400:
+            status = response.status_code
+            response_excerpt = self._response_excerpt(response)
             detail = f": {response_excerpt}" if response_excerpt else ""
             if status in (401, 403):
                 raise AuthenticationFailed(
                     f"HTTP {status} authentication error from FusionSolar{detail}",
                     response_excerpt=response_excerpt,
-                ) from err
+                )
             raise FusionSolarRequestError(
                 f"HTTP {status} error while contacting FusionSolar API{detail}",
                 response_excerpt=response_excerpt,
-            ) from err
+            )
+        return response
+
+    def _record_request_metric(self, operation, started, error=False):
+        """Record a request that started at ``started`` and return its duration in milliseconds."""
+        ended = time.monotonic()
+        duration_ms = round((ended - started) * 1000)
+        # authenticate:<host> and set-config-new:<register> share one metric per endpoint.
+        endpoint = operation.split(":", 1)[0]
+        metrics = self.request_metrics.get(endpoint)
+        if metrics is None:
+            metrics = self.request_metrics[endpoint] = EndpointMetrics()
+        metrics.record(duration_ms, error=error)
+        trace = _CYCLE_TRACE.get()
+        if trace is not None:
+            trace.add(_REQUEST_PHASES.get(endpoint, endpoint), started, ended)
+        return duration_ms
+
+    def _capture_response(self, operation, request_id, response, duration_ms):
+        """Keep the buffered response for diagnostics; it is only serialized on download."""
+        history = self.response_history.get(operation)
+        if history is None:
+            history = self.response_history[operation] = deque(maxlen=DIAGNOSTIC_RESPONSE_HISTORY)
+        history.append((time.time(), request_id, duration_ms, response))
+
+    def diagnostics_snapshot(self):
+        """Return sanitized responses, catalogs, timing and state for the diagnostics download."""
+        responses = {}
+        for operation, history in self.response_history.items():
+            responses[operation] = [
+                {
+                    "at": datetime.fromtimestamp(captured_at, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "request_id": request_id,
+                    "status": response.status_code,
+                    "duration_ms": duration_ms,
+                    "headers": self._sanitize_debug_value(dict(response.headers)),
+                    "body": self._diagnostic_body(response),
+                }
+                for captured_at, request_id, duration_ms, response in history
+            ]
+
+        return {
+            "state": {
+                "last_update_success": self.last_update_success,
+                "update_interval_seconds": (
+                    self.update_interval.total_seconds() if self.update_interval else None
+                ),
+                "consecutive_failures": self._consecutive_failures,
+                "plugged_in": self._plugged_in,
+                "charging": self._charging,
+                "region_ip": self.region_ip,
+                "station_dn": self.dn_id,
+                "wallbox_dn": self.wallbox_dn,
+                "additional_wallboxes": sorted(self.additional_wallboxes),
+                "data_generation": self.data_generation,
+                "schema_fallbacks": dict(self.schema_fallbacks),
+                "session_from_cache": self._session_from_cache,
+                "session_expires_at": self._session_expires_at,
+            },
+            "timing": {
+                "last_update_at": self.debug_data.get("last_update_at"),
+                "last_update_duration_ms": self.debug_data.get("last_update_duration_ms"),
+                "last_write_at": self.debug_data.get("last_write_at"),
+                "last_write_duration_ms": self.debug_data.get("last_write_duration_ms"),
+            },
+            "debug": dict(self.debug_data),
+            "registers": dict(self.param_values),
+            "config_signal_values": dict(self.config_signal_values),
+            "config_signal_details": dict(self.config_signal_details),
+            "signal_catalogs": dict(self.signal_catalogs),
+            "cycle_traces": [trace.as_dict() for trace in self.cycle_traces],
+            "request_metrics": {
+                operation: metrics.as_dict() for operation, metrics in self.request_metrics.items()
+            },
+            "responses": responses,
+        }
+
+    def _diagnostic_body(self, response):
+        try:
+            return self._sanitize_response_value(response.json())
+        except ValueError:
+            return self._sanitize_text(response.text)
+
+    def _get_session(self):
+        """Return this entry's pooled keep-alive aiohttp session.
+
+        The connector keeps up to ``pool_maxsize`` connections and closes those idle
+        for ``pool_idle_timeout`` seconds. Requests carry the FusionSolar cookies
+        themselves; the dummy cookie jar keeps them out of any shared jar.
+        """
+        if self._http_session is None:
+            ssl_context = get_default_context() if self.verify_ssl else get_default_no_verify_context()
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=ssl_context,
+                    limit=self.pool_maxsize,
+                    keepalive_timeout=self.pool_idle_timeout,
+                ),
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+        return self._http_session
+
+    async def async_close_session(self):
+        """Close the pooled session; the next request opens a new one."""
+        session, self._http_session = self._http_session, None
+        if session is not None:
+            await session.close()
 
     def _authentication_hosts(self):
         hosts = [self.auth_host]
@@ -705,7 +1470,10 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         return hosts
 
     def _app_token_url(self, host):
-        return f"https://{host}:32800{APP_TOKEN_PATH}"
+        return self._api_url(host, APP_TOKEN_PATH)
+
+    def _api_url(self, host, path):
+        return f"{self.api_scheme}://{host}:{self.api_port}{path}"
 
     def _extract_token(self, token_data):
         if not isinstance(token_data, dict):
@@ -737,9 +1505,11 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         if not isinstance(param_values, dict):
             return {}
 
+        started = time.monotonic()
         normalized = {}
         for reg_id, value in param_values.items():
             normalized[reg_id] = self._convert_register_value(value)
+        self._trace_span("normalization", started)
         return normalized
 
     def _has_expected_registers(self, param_values):
@@ -778,18 +1548,75 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                 ordered.append(signal_id)
         return ordered
 
-    def _extract_signal_values(self, payload):
-        collected = {}
+    def _decode_signal_payload(self, operation, payload):
+        """Decode a signal response through its endpoint's learned shape when it still fits."""
+        started = time.monotonic()
+        try:
+            return self._decode_known_signal_shape(operation, payload)
+        finally:
+            self._trace_span("normalization", started)
+
+    def _decode_known_signal_shape(self, operation, payload):
+        shape = self._response_shapes.get(operation)
+        if shape is not None:
+            decoded = decode_signal_shape(shape, payload)
+            if decoded is not None:
+                decoded["catalog"] = self._dedupe_signal_catalog(decoded["catalog"])
+                decoded["config_catalog"] = None
+                return decoded
+
+            self.schema_fallbacks[operation] = self.schema_fallbacks.get(operation, 0) + 1
+            self._debug_log(
+                "Huawei %s response no longer matches %s; using generic decoding (fallback #%s)",
+                operation,
+                shape,
+                self.schema_fallbacks[operation],
+            )
+            del self._response_shapes[operation]
+
+        walked = self._walk_signal_payload(payload)
+        shape = learn_signal_shape(payload)
+        if shape is not None:
+            decoded = decode_signal_shape(shape, payload)
+            # Only trust a shape that reproduces the generic result for the payload it was learned from.
+            if decoded is not None and (
+                decoded["values"] == walked["values"]
+                and decoded["ids"] == walked["ids"]
+                and self._dedupe_signal_catalog(decoded["catalog"]) == walked["catalog"]
+            ):
+                self._response_shapes[operation] = shape
+                self._debug_log("Learned Huawei %s response shape %s", operation, shape)
+        return walked
+
+    def _walk_signal_payload(self, payload, config_catalog=False):
+        """Collect signal values, catalog and IDs from a response in one traversal.
+
+        The walk is iterative and stops descending at ``_MAX_PAYLOAD_DEPTH`` so a
+        deeply nested payload cannot raise ``RecursionError``. Nodes are visited
+        in document order, so later values win exactly as they did before.
+        """
+        values = {}
+        catalog = []
+        signal_ids = set()
+        config_entries = [] if config_catalog else None
+        truncated = False
 
-        def visit(node):
+        stack = [(payload, None, 0)]
+        while stack:
+            node, group_name, depth = stack.pop()
             if isinstance(node, dict):
-                if "paramValues" in node and isinstance(node["paramValues"], dict):
-                    collected.update(
-                        {
-                            str(reg_id): value
-                            for reg_id, value in node["paramValues"].items()
-                        }
-                    )
+                if depth >= _MAX_PAYLOAD_DEPTH:
+                    truncated = True
+                    continue
+
+                param_values = node.get("paramValues")
+                if isinstance(param_values, dict):
+                    for reg_id, value in param_values.items():
+                        values[str(reg_id)] = value
+
+                for key in SIGNAL_ID_KEYS:
+                    if node.get(key) is not None:
+                        signal_ids.add(str(node[key]))
 
                 reg_id = (
                     node.get("id")
@@ -797,36 +1624,20 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                     or node.get("signalID")
                     or node.get("signal_id")
                 )
-                has_value = any(
-                    key in node
-                    for key in ("value", "signalValue", "realValue", "currentValue", "val")
-                )
-                if reg_id is not None and has_value:
-                    for key in ("value", "signalValue", "realValue", "currentValue", "val"):
+                if reg_id is not None:
+                    for key in SIGNAL_VALUE_KEYS:
                         if key in node:
-                            collected[str(reg_id)] = node[key]
+                            values[str(reg_id)] = node[key]
                             break
+                    if config_entries is not None and not _CONFIG_SIGNAL_KEYS.isdisjoint(node):
+                        config_entries.append(self._config_signal_entry(reg_id, node))
 
-                for item in node.values():
-                    visit(item)
-            elif isinstance(node, list):
-                for item in node:
-                    visit(item)
-
-        visit(payload)
-        return collected
-
-    def _extract_signal_catalog(self, payload):
-        catalog = []
-
-        def visit(node, group_name=None):
-            if isinstance(node, dict):
-                next_group = group_name
-                if "groupName" in node and isinstance(node["groupName"], str):
-                    next_group = node["groupName"]
+                if isinstance(node.get("groupName"), str):
+                    group_name = node["groupName"]
 
-                if "signals" in node and isinstance(node["signals"], list):
-                    for signal in node["signals"]:
+                signals = node.get("signals")
+                if isinstance(signals, list):
+                    for signal in signals:
                         if not isinstance(signal, dict):
                             continue
                         signal_id = signal.get("id") or signal.get("signalId")
@@ -837,17 +1648,63 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
                                 "id": str(signal_id),
                                 "name": signal.get("name"),
                                 "unit": signal.get("unit"),
-                                "group": next_group,
+                                "group": group_name,
                             }
                         )
 
-                for item in node.values():
-                    visit(item, next_group)
+                children = node.values()
             elif isinstance(node, list):
-                for item in node:
-                    visit(item, group_name)
+                if depth >= _MAX_PAYLOAD_DEPTH:
+                    truncated = True
+                    continue
+                children = node
+            else:
+                continue
+
+            # Push in reverse so the stack pops children in document order.
+            stack.extend(
+                (child, group_name, depth + 1)
+                for child in reversed(list(children))
+                if isinstance(child, (dict, list))
+            )
+
+        if truncated:
+            self._debug_log(
+                "Huawei response nested deeper than %s levels; ignoring the deepest nodes",
+                _MAX_PAYLOAD_DEPTH,
+            )
+
+        return {
+            "values": values,
+            "catalog": self._dedupe_signal_catalog(catalog),
+            "ids": signal_ids,
+            "config_catalog": (
+                self._dedupe_config_signal_catalog(config_entries)
+                if config_entries is not None
+                else None
+            ),
+        }
+
+    @staticmethod
+    def _config_signal_entry(signal_id, node):
+        return {
+            "id": str(signal_id),
+            "name": node.get("name") or node.get("label"),
+            "unit": node.get("unit"),
+            "value": node.get("value", node.get("realValue")),
+            "default": node.get("defaultValue"),
+            "writable": node.get("writable", node.get("writeable")),
+            "read_only": node.get("readOnly", node.get("readonly")),
+            "rw_flag": node.get("rwFlag"),
+            "min": node.get("min", node.get("minValue")),
+            "max": node.get("max", node.get("maxValue")),
+            "step": node.get("step"),
+            "options": node.get("options", node.get("optionList", node.get("enumValues"))),
+            "range": node.get("range"),
+        }
 
-        visit(payload)
+    @staticmethod
+    def _dedupe_signal_catalog(catalog):
         deduped = []
         seen = set()
         for item in catalog:
@@ -858,82 +1715,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             deduped.append(item)
         return deduped
 
-    def _extract_signal_ids(self, payload):
-        signal_ids = set()
-
-        def visit(node):
-            if isinstance(node, dict):
-                for key in ("id", "signalId", "signalID", "signal_id"):
-                    if key in node and node[key] is not None:
-                        signal_ids.add(str(node[key]))
-                for item in node.values():
-                    visit(item)
-            elif isinstance(node, list):
-                for item in node:
-                    visit(item)
-
-        visit(payload)
-        return signal_ids
-
-    def _extract_config_signal_catalog(self, payload):
-        catalog = []
-
-        def visit(node):
-            if isinstance(node, dict):
-                signal_id = (
-                    node.get("id")
-                    or node.get("signalId")
-                    or node.get("signalID")
-                    or node.get("signal_id")
-                )
-                interesting_keys = {
-                    "name",
-                    "label",
-                    "unit",
-                    "value",
-                    "realValue",
-                    "defaultValue",
-                    "rwFlag",
-                    "readOnly",
-                    "readonly",
-                    "writable",
-                    "writeable",
-                    "min",
-                    "max",
-                    "minValue",
-                    "maxValue",
-                    "step",
-                    "enumValues",
-                    "options",
-                    "optionList",
-                    "range",
-                }
-                if signal_id is not None and any(key in node for key in interesting_keys):
-                    catalog.append(
-                        {
-                            "id": str(signal_id),
-                            "name": node.get("name") or node.get("label"),
-                            "unit": node.get("unit"),
-                            "value": node.get("value", node.get("realValue")),
-                            "default": node.get("defaultValue"),
-                            "writable": node.get("writable", node.get("writeable")),
-                            "read_only": node.get("readOnly", node.get("readonly")),
-                            "rw_flag": node.get("rwFlag"),
-                            "min": node.get("min", node.get("minValue")),
-                            "max": node.get("max", node.get("maxValue")),
-                            "step": node.get("step"),
-                            "options": node.get("options", node.get("optionList", node.get("enumValues"))),
-                            "range": node.get("range"),
-                        }
-                    )
-
-                for item in node.values():
-                    visit(item)
-            elif isinstance(node, list):
-                for item in node:
-                    visit(item)
-
-        visit(payload)
+    def _dedupe_config_signal_catalog(self, catalog):
         deduped = []
         seen = set()
         for item in catalog:
@@ -969,6 +1751,9 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             self.config_signal_details[item["id"]] = dict(item)
 
     def _log_realtime_signal_catalog(self, signal_catalog):
+        if not self._debug_enabled():
+            return
+
         catalog_key = tuple(
             (item["id"], item.get("name"), item.get("unit"), item.get("group"))
             for item in signal_catalog
@@ -992,6 +1777,9 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             )
 
     def _log_config_signal_catalog(self, operation, signal_catalog):
+        if not self._debug_enabled():
+            return
+
         catalog_key = tuple(
             (
                 operation,
@@ -1046,25 +1834,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
     def _convert_register_value(self, value):
         """Best-effort conversion for register payloads returned as strings."""
         if isinstance(value, str):
-            stripped = value.strip()
-            if stripped == "":
-                return ""
-
-            lowered = stripped.lower()
-            if lowered in ("true", "false"):
-                return lowered == "true"
-
-            if _NUMERIC_PATTERN.match(stripped):
-                if "." in stripped:
-                    number = float(stripped)
-                    return int(number) if number.is_integer() else number
-                try:
-                    return int(stripped)
-                except ValueError:
-                    return stripped
-
-            return stripped
-
+            return _convert_register_string(value)
         return value
 
     def _normalize_host(self, value):
@@ -1174,29 +1944,90 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             return DEFAULT_TIMEZONE_OFFSET
         return int(offset.total_seconds() / 60)
 
-    def _reset_auth_state(self):
-        """Clear auth-related state so the next request authenticates again."""
+    def _reset_auth_state(self, token_rejected=False):
+        """Clear auth-related state so the next request authenticates again.
+
+        Only a token FusionSolar rejected is dropped from the account hub; other
+        failures leave the shared login to the entries still using it.
+        """
+        if token_rejected:
+            self.account_hub.discard_session(self.token)
         self.token = None
         self.headers = {}
         self.region_ip = None
+        self.roa_rand = None
         self.dn_id = None
         self.wallbox_dn = None
         self.wallbox_dn_id = None
+        self._session_expires_at = None
+        self._session_from_cache = False
         self.config_signal_details = {}
         self.config_signal_values = {}
         self._last_realtime_signal_catalog = None
         self._last_config_signal_catalog = None
         self._history_probe_completed = False
+        self._realtime_expected = True
+        self._device_list_values = {}
+        self._station_refreshed_at = None
+        self._topology_refreshed_at = None
 
-    def _ensure_device_context(self):
+    async def _async_ensure_device_context(self):
         """Ensure authentication and target device identifiers are available."""
         if not self.token or not self.region_ip or not self.headers:
-            self.authenticate()
+            await self.async_authenticate()
         elif not self.dn_id:
-            self.fetch_station_dn()
+            await self.async_fetch_station_dn()
+
+    def _track_register_changes(self):
+        """Record which registers changed since the last publish so entities can skip unchanged state."""
+        started = time.monotonic()
+        snapshot = {(None, str(reg_id)): value for reg_id, value in self.config_signal_values.items()}
+        for reg_id, value in self.param_values.items():
+            snapshot[(None, str(reg_id))] = value
+        for wallbox_dn, wallbox in self.additional_wallboxes.items():
+            for reg_id, value in wallbox["values"].items():
+                snapshot[(wallbox_dn, str(reg_id))] = value
+
+        previous = self._register_snapshot
+        changed = {
+            key
+            for key in snapshot.keys() | previous.keys()
+            if key not in snapshot
+            or key not in previous
+            # 1, 1.0 and True compare equal but publish different states.
+            or type(snapshot[key]) is not type(previous[key])
+            or snapshot[key] != previous[key]
+        }
+        if changed:
+            self.data_generation += 1
+            for key in changed:
+                self._register_generations[key] = self.data_generation
+            self._new_register_keys.update(key for key in changed if key not in previous)
+            self._debug_log("Huawei registers changed this cycle: %s", len(changed))
+        self._register_snapshot = snapshot
+        self._trace_span("normalization", started)
+        return changed
+
+    def take_new_register_keys(self):
+        """Return and clear the (wallbox_dn, reg_id) keys that appeared since the last call."""
+        if not self._new_register_keys:
+            return ()
+        new_register_keys = self._new_register_keys
+        self._new_register_keys = set()
+        return new_register_keys
+
+    def registers_changed_since(self, generation, reg_ids, wallbox_dn=None):
+        """Return True when any of the registers changed after the given data generation."""
+        return any(
+            self._register_generations.get((wallbox_dn, str(reg_id)), 0) > generation
+            for reg_id in reg_ids
+        )
 
-    def get_register_value(self, reg_id):
+    def get_register_value(self, reg_id, wallbox_dn=None):
         reg_id = str(reg_id)
+        if wallbox_dn is not None and wallbox_dn != self.wallbox_dn:
+            wallbox = self.additional_wallboxes.get(wallbox_dn)
+            return wallbox["values"].get(reg_id) if wallbox else None
         if reg_id in self.param_values:
             return self.param_values[reg_id]
         return self.config_signal_values.get(reg_id)
@@ -1208,6 +2039,7 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
             "last_update_at": None,
             "last_update_duration_ms": None,
             "last_update_response_excerpt": None,
+            "last_update_spans": None,
             "last_register_count": 0,
             "available_registers": [],
             "writable_registers_available": [],
@@ -1314,47 +2146,74 @@ class HuaweiChargerCoordinator(DataUpdateCoordinator):
         if not hasattr(self, "debug_data"):
             self.debug_data = self._build_debug_data()
 
+    def _debug_enabled(self):
+        return getattr(self, "enable_logging", True) and _LOGGER.isEnabledFor(logging.WARNING)
+
     def _debug_log(self, message, *args):
-        if getattr(self, "enable_logging", True):
+        if self._debug_enabled():
             _LOGGER.warning(message, *args)
 
+    def _lazy(self, build, *args):
+        """Defer an expensive log argument such as a sanitized response excerpt."""
+        return _LazyLogArg(build, *args)
+
     def _schedule_debug_state_push(self):
+        """Queue one listener notification for debug-state changes, merging bursts."""
+        batch = _DEBUG_BATCH.get()
+        if batch is not None and batch.coordinator is self:
+            # The cycle or write running in this task publishes once when it ends.
+            batch.pending = True
+            return
+        if self._debug_push_handle is not None:
+            return
+
         loop = getattr(self.hass, "loop", None)
         if loop is None:
             return
+        self._debug_push_handle = loop.call_soon(self._flush_debug_state_push)
+
+    def _flush_debug_state_push(self):
+        self._debug_push_handle = None
+        self.async_update_listeners()
+
+    def _begin_debug_batch(self):
+        """Hold this task's debug-state pushes until ``_end_debug_batch``; return the batch token.
+
+        The batch follows the task (and the tasks it starts), so a write overlapping
+        an update cycle publishes when the write ends, not when the cycle does.
+        """
+        batch = _DEBUG_BATCH.get()
+        if batch is not None and batch.coordinator is self:
+            # Nested in a batch of this task; the outer one publishes.
+            return None
+        return _DEBUG_BATCH.set(_DebugBatch(self))
 
-        current_data = getattr(self, "data", self.param_values)
-        loop.call_soon_threadsafe(self.async_set_updated_data, current_data)
+    def _end_debug_batch(self, token, *, publish):
+        if token is None:
+            return
+        batch = _DEBUG_BATCH.get()
+        _DEBUG_BATCH.reset(token)
+        if batch.pending and publish and self._debug_push_handle is None:
+            self.async_update_listeners()
 
     def _debug_repr(self, value):
         return self._truncate_text(self._sanitize_debug_value(value))
 
     def _sanitize_debug_value(self, value):
+        return self._mask_keys(value, _DEBUG_SECRET_KEYS)
+
+    def _sanitize_response_value(self, value):
+        """Mask credentials in a captured response body and keep the signal values."""
+        return self._mask_keys(value, _RESPONSE_SECRET_KEYS)
+
+    def _mask_keys(self, value, keys):
         if isinstance(value, dict):
-            sanitized = {}
-            for key, item in value.items():
-                lower_key = str(key).lower()
-                if lower_key in {
-                    "password",
-                    "value",
-                    "accesstoken",
-                    "refreshtoken",
-                    "token",
-                    "cookie",
-                    "set-cookie",
-                    "authorization",
-                    "bspsession",
-                    "dp-session",
-                    "csrftoken",
-                    "csrf-token",
-                    "roarand",
-                }:
-                    sanitized[key] = "***"
-                else:
-                    sanitized[key] = self._sanitize_debug_value(item)
-            return sanitized
+            return {
+                key: "***" if str(key).lower() in keys else self._mask_keys(item, keys)
+                for key, item in value.items()
+            }
         if isinstance(value, list):
-            return [self._sanitize_debug_value(item) for item in value]
+            return [self._mask_keys(item, keys) for item in value]
         return value
 
     def _truncate_text(self, value, limit=500):
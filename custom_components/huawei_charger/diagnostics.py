@@ -0,0 +1,29 @@
+"""Diagnostics support for Huawei Charger."""
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, SENSITIVE_REGISTERS
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, "token", "roa_rand", "region_ip", *SENSITIVE_REGISTERS}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
+    """Return the captured responses, catalogs and coordinator state of an entry.
+
+    Responses are kept as received in a small per-operation ring buffer and are
+    only sanitized and serialized here, when a download is requested.
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    return async_redact_data(
+        {
+            "entry": {
+                "data": dict(entry.data),
+                "options": dict(entry.options),
+            },
+            **coordinator.diagnostics_snapshot(),
+        },
+        TO_REDACT,
+    )
@@ -0,0 +1,24 @@
+"""Shared helpers for register-backed Huawei Charger entities."""
+
+
+class RegisterDeltaMixin:
+    """Skip state writes for coordinator updates that left the entity's registers unchanged."""
+
+    _published_generation = -1
+    _published_stale = None
+
+    def _registers_changed(self, reg_ids, wallbox_dn=None):
+        coordinator = self.coordinator
+        generation = getattr(coordinator, "data_generation", None)
+        if generation is None:
+            return True
+
+        stale = not coordinator.last_update_success
+        changed = stale != self._published_stale or coordinator.registers_changed_since(
+            self._published_generation,
+            reg_ids,
+            wallbox_dn,
+        )
+        self._published_stale = stale
+        self._published_generation = generation
+        return changed
@@ -0,0 +1,153 @@
+"""Account-level FusionSolar state shared by the config entries of one login."""
+
+import asyncio
+import logging
+import time
+
+from .const import DEFAULT_ACCOUNT_SHARE_WINDOW, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ACCOUNT_HUBS = "_account_hubs"
+
+
+class SingleFlightGroup:
+    """Run one request per key, letting concurrent callers share its in-flight result."""
+
+    def __init__(self):
+        self.requests = {}
+
+    async def async_do(self, key, request):
+        task = self.requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(request())
+            self.requests[key] = task
+
+            def _forget(done_task):
+                if self.requests.get(key) is done_task:
+                    del self.requests[key]
+                if not done_task.cancelled():
+                    # Mark the outcome as retrieved even when every caller was cancelled.
+                    done_task.exception()
+
+            task.add_done_callback(_forget)
+        else:
+            _LOGGER.debug("Joining in-flight Huawei request %s", key[0])
+
+        # Shield the shared task so one cancelled caller does not cancel it for the others.
+        return await asyncio.shield(task)
+
+
+class FusionSolarAccountHub:
+    """Own the login, station list and device list of one FusionSolar account.
+
+    Every coordinator polling a wallbox of the account goes through the hub, so
+    a single login is shared and station/device-list reads of different entries
+    issued within ``share_window`` seconds of each other collapse into one
+    request per station. An entry's own next update cycle always reads again.
+    """
+
+    def __init__(self, account_id, share_window=DEFAULT_ACCOUNT_SHARE_WINDOW):
+        self.account_id = account_id
+        self.share_window = share_window
+        self.entry_ids = set()
+        # Config entry id -> the wallbox DN that entry is pinned to.
+        self.pinned_wallboxes = {}
+        self.session = None
+        self._requests = SingleFlightGroup()
+        self._responses = {}
+
+    def current_session(self):
+        """Return the shared login while it has not expired."""
+        if not self.session:
+            return None
+        expires_at = self.session.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            self.session = None
+            return None
+        return self.session
+
+    def claimed_wallboxes(self, entry_id):
+        """Return the wallboxes other config entries of the account are pinned to."""
+        return {
+            wallbox_dn
+            for other_entry_id, wallbox_dn in self.pinned_wallboxes.items()
+            if other_entry_id != entry_id
+        }
+
+    def publish_session(self, session):
+        self.session = dict(session)
+
+    def discard_session(self, token):
+        """Forget the shared login once FusionSolar rejected its token."""
+        if self.session and self.session.get("token") == token:
+            self.session = None
+            self._responses = {}
+
+    async def async_login(self, login):
+        """Log in once for every coordinator waiting on the account."""
+
+        async def _login():
+            session = await login()
+            self.publish_session(session)
+            self._responses = {}
+            return session
+
+        return await self._requests.async_do(("login",), _login)
+
+    async def async_station_list(self, region_ip, fetch, requester):
+        return await self._async_shared(("station-list", region_ip), fetch, requester)
+
+    async def async_device_list(self, station_dn, fetch, requester):
+        return await self._async_shared(("device-list", station_dn), fetch, requester)
+
+    async def _async_shared(self, key, fetch, requester):
+        """Return a recent response for ``key`` or fetch it.
+
+        ``requester`` is the ``(entry_id, update cycle)`` asking. A cached response
+        is reused by other entries and by the cycle that fetched it, never by a
+        later cycle of the same entry.
+        """
+        cached = self._responses.get(key)
+        if cached is not None:
+            fetched_at, fetched_by, result = cached
+            if (fetched_by == requester or fetched_by[0] != requester[0]) and (
+                time.monotonic() - fetched_at < self.share_window
+            ):
+                return result
+
+        async def _fetch():
+            result = await fetch()
+            self._responses[key] = (time.monotonic(), requester, result)
+            return result
+
+        return await self._requests.async_do(key, _fetch)
+
+
+def async_get_account_hub(hass, account_id, entry_id, wallbox_dn=None):
+    """Return the hub of an account, creating it for the first config entry.
+
+    ``wallbox_dn`` is the wallbox the entry is pinned to, if any; entries without
+    one leave it to that entry instead of exposing it a second time.
+    """
+    hubs = hass.data.setdefault(DOMAIN, {}).setdefault(ACCOUNT_HUBS, {})
+    hub = hubs.get(account_id)
+    if hub is None:
+        hub = hubs[account_id] = FusionSolarAccountHub(account_id)
+    hub.entry_ids.add(entry_id)
+    if wallbox_dn:
+        hub.pinned_wallboxes[entry_id] = wallbox_dn
+    return hub
+
+
+def async_release_account_hub(hass, hub, entry_id):
+    """Drop the hub once the last config entry using it is unloaded."""
+    hub.entry_ids.discard(entry_id)
+    hub.pinned_wallboxes.pop(entry_id, None)
+    if hub.entry_ids:
+        return
+    hubs = hass.data.get(DOMAIN, {}).get(ACCOUNT_HUBS, {})
+    if hubs.get(hub.account_id) is hub:
+        del hubs[hub.account_id]
+        if not hubs:
+            hass.data[DOMAIN].pop(ACCOUNT_HUBS, None)
@@ -0,0 +1,122 @@
+"""Request counters and fixed-bucket latency histograms per FusionSolar endpoint."""
+
+import time
+from bisect import bisect_left
+
+# Upper bounds in milliseconds; slower requests land in a final overflow bucket.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2000, 5000, 10000, 20000)
+
+
+class EndpointMetrics:
+    """Count requests and errors of one endpoint and bucket their latency."""
+
+    __slots__ = ("count", "errors", "buckets", "max_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.max_ms = None
+
+    def record(self, duration_ms, error=False):
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        if self.max_ms is None or duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def quantile(self, fraction):
+        """Return the upper bound of the bucket holding the given quantile."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return LATENCY_BUCKETS_MS[index]
+                break
+        return self.max_ms
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": self.max_ms,
+        }
+
+
+def _union_ms(intervals):
+    """Return the milliseconds covered by ``(start, end)`` intervals, counting overlaps once."""
+    covered = 0
+    span_start = span_end = None
+    for start, end in sorted(intervals):
+        if span_end is None or start > span_end:
+            if span_end is not None:
+                covered += span_end - span_start
+            span_start, span_end = start, end
+        elif end > span_end:
+            span_end = end
+    if span_end is not None:
+        covered += span_end - span_start
+    return round(covered * 1000)
+
+
+class CycleTrace:
+    """Time spent per phase of one update cycle.
+
+    Cloud phases are filled from the requests made during the cycle; local
+    phases (normalization, publish, backoff) are added around their code.
+    Phases are kept as ``(start, end)`` intervals, so concurrent requests count
+    their overlap once and the spans never add up to more than the wall time.
+    ``loop_lag_ms`` is how long a callback queued at cycle start waited for the
+    event loop, which exposes local starvation independent of cloud latency.
+    """
+
+    __slots__ = ("started_at", "started", "status", "attempts", "duration_ms", "loop_lag_ms", "intervals")
+
+    def __init__(self, started_at, started):
+        self.started_at = started_at
+        self.started = started
+        self.status = None
+        self.attempts = 0
+        self.duration_ms = None
+        self.loop_lag_ms = None
+        self.intervals = {}
+
+    def add(self, phase, started, ended):
+        """Record that ``phase`` ran from ``started`` to ``ended`` (``time.monotonic`` seconds)."""
+        self.intervals.setdefault(phase, []).append((started, ended))
+
+    @property
+    def spans(self):
+        """Milliseconds per phase, with the overlap of concurrent intervals counted once."""
+        return {phase: _union_ms(intervals) for phase, intervals in self.intervals.items()}
+
+    def note_loop_lag(self, scheduled):
+        self.loop_lag_ms = round((time.monotonic() - scheduled) * 1000)
+
+    def as_dict(self):
+        # Publishing happens after the cycle ends and is not part of its duration.
+        measured_ms = _union_ms(
+            interval
+            for phase, intervals in self.intervals.items()
+            if phase != "publish"
+            for interval in intervals
+        )
+        return {
+            "started_at": self.started_at,
+            "status": self.status,
+            "attempts": self.attempts,
+            "duration_ms": self.duration_ms,
+            "loop_lag_ms": self.loop_lag_ms,
+            "spans_ms": self.spans,
+            "unattributed_ms": (
+                max(self.duration_ms - measured_ms, 0) if self.duration_ms is not None else None
+            ),
+        }
@@ -1,4 +1,5 @@
 from homeassistant.components.number import NumberEntity
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfPower
 import asyncio
@@ -6,9 +7,13 @@ import logging
 import time
 
 from .const import DOMAIN, REGISTER_NAME_MAP, REG_FIXED_MAX_POWER, REG_DYNAMIC_POWER_LIMIT
+from .entity import RegisterDeltaMixin
 
 _LOGGER = logging.getLogger(__name__)
 
+# Registers the power limits of the writable numbers are derived from.
+POWER_LIMIT_REGISTERS = ("538976569", "538976570", "10003")
+
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = []
@@ -16,7 +21,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         entities.append(HuaweiChargerNumber(coordinator, reg_id))
     async_add_entities(entities)
 
-class HuaweiChargerNumber(CoordinatorEntity, NumberEntity):
+class HuaweiChargerNumber(RegisterDeltaMixin, CoordinatorEntity, NumberEntity):
     def __init__(self, coordinator, reg_id):
         super().__init__(coordinator)
         self.coordinator = coordinator
@@ -91,10 +96,14 @@ class HuaweiChargerNumber(CoordinatorEntity, NumberEntity):
             max_power,
         )
 
+    @callback
     def _handle_coordinator_update(self):
+        previous_limits = (self._attr_native_min_value, self._attr_native_max_value)
         self._set_power_limits()
         self._attr_native_step = 0.1 if self._attr_native_max_value <= 3.7 else 0.2
-        super()._handle_coordinator_update()
+        registers_changed = self._registers_changed((self._reg_id, *POWER_LIMIT_REGISTERS))
+        if registers_changed or previous_limits != (self._attr_native_min_value, self._attr_native_max_value):
+            self.async_write_ha_state()
 
     @property
     def native_value(self):
@@ -159,9 +168,7 @@ class HuaweiChargerNumber(CoordinatorEntity, NumberEntity):
                 return
                 
             self._log_warning("Writing debounced value %.2f to register %s", value, self._reg_id)
-            success = await self.hass.async_add_executor_job(
-                self.coordinator.set_config_value, self._reg_id, value
-            )
+            success = await self.coordinator.async_set_config_value(self._reg_id, value)
             
             if success:
                 self._last_write_time = time.time()
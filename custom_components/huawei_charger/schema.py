@@ -0,0 +1,130 @@
+"""Learned FusionSolar response shapes used to decode signal payloads directly."""
+
+SIGNAL_ID_KEYS = ("id", "signalId", "signalID", "signal_id")
+SIGNAL_VALUE_KEYS = ("value", "signalValue", "realValue", "currentValue", "val")
+_CONTAINERS = (dict, list)
+
+
+class SignalShape:
+    """Concrete location and keys of the signal records in one endpoint's response.
+
+    ``path`` lists the steps from the payload root to the records: a string is
+    a dict key and ``None`` iterates a list, so ``("data", None, "signals", None)``
+    describes ``data[].signals[]``. A response only takes the fast path while it
+    still matches the shape exactly; anything else is left to the generic walker.
+    """
+
+    __slots__ = ("path", "id_key", "value_key", "record_keys")
+
+    def __init__(self, path, id_key, value_key, record_keys):
+        self.path = tuple(path)
+        self.id_key = id_key
+        self.value_key = value_key
+        self.record_keys = frozenset(record_keys)
+
+    def __repr__(self):
+        steps = ".".join("[]" if step is None else step for step in self.path)
+        return f"SignalShape({steps}, id={self.id_key}, value={self.value_key})"
+
+
+def learn_signal_shape(payload):
+    """Return the shape of the signal records in ``payload`` or ``None``.
+
+    A shape is only learned when every record sits at the same path, uses the
+    same ID and value keys and holds nothing but scalar fields.
+    """
+    paths = set()
+    records = []
+    stack = [(payload, ())]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, dict):
+            if any(key in node for key in SIGNAL_ID_KEYS):
+                paths.add(path)
+                records.append(node)
+            stack.extend((value, path + (key,)) for key, value in node.items() if isinstance(value, _CONTAINERS))
+        elif isinstance(node, list):
+            stack.extend((item, path + (None,)) for item in node if isinstance(item, _CONTAINERS))
+
+    if len(paths) != 1:
+        return None
+    path = paths.pop()
+    if not path:
+        return None
+
+    record_keys = set()
+    for record in records:
+        if any(isinstance(value, _CONTAINERS) for value in record.values()):
+            return None
+        record_keys.update(record)
+
+    id_keys = [key for key in SIGNAL_ID_KEYS if key in record_keys]
+    value_keys = [key for key in SIGNAL_VALUE_KEYS if key in record_keys]
+    if len(id_keys) != 1 or len(value_keys) > 1:
+        return None
+    return SignalShape(path, id_keys[0], value_keys[0] if value_keys else None, record_keys)
+
+
+def decode_signal_shape(shape, payload):
+    """Read values, catalog and IDs along ``shape`` or return ``None`` on mismatch.
+
+    The result matches what the generic walker produces for the same payload;
+    the returned catalog is not yet de-duplicated.
+    """
+    frontier = [(payload, None)]
+    for step in shape.path:
+        next_frontier = []
+        for node, group_name in frontier:
+            if step is None:
+                if not isinstance(node, list):
+                    return None
+                next_frontier.extend((item, group_name) for item in node if isinstance(item, _CONTAINERS))
+                continue
+
+            if not isinstance(node, dict):
+                return None
+            for key, value in node.items():
+                if key != step and isinstance(value, _CONTAINERS):
+                    return None
+            if any(key in node for key in SIGNAL_ID_KEYS):
+                return None
+            if isinstance(node.get("groupName"), str):
+                group_name = node["groupName"]
+            child = node.get(step)
+            if isinstance(child, _CONTAINERS):
+                next_frontier.append((child, group_name))
+        frontier = next_frontier
+
+    id_key = shape.id_key
+    value_key = shape.value_key
+    record_keys = shape.record_keys
+    in_catalog = len(shape.path) >= 2 and shape.path[-2] == "signals" and id_key in ("id", "signalId")
+
+    values = {}
+    catalog = []
+    signal_ids = set()
+    for record, group_name in frontier:
+        if not isinstance(record, dict) or not record.keys() <= record_keys:
+            return None
+        if any(isinstance(value, _CONTAINERS) for value in record.values()):
+            return None
+
+        signal_id = record.get(id_key)
+        if signal_id is None:
+            continue
+        signal_ids.add(str(signal_id))
+        if not signal_id:
+            continue
+        if value_key is not None and value_key in record:
+            values[str(signal_id)] = record[value_key]
+        if in_catalog:
+            catalog.append(
+                {
+                    "id": str(signal_id),
+                    "name": record.get("name"),
+                    "unit": record.get("unit"),
+                    "group": group_name,
+                }
+            )
+
+    return {"values": values, "catalog": catalog, "ids": signal_ids}
@@ -1,5 +1,4 @@
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.core import callback
@@ -9,7 +8,15 @@ from homeassistant.const import (
 )
 import logging
 
-from .const import DOMAIN, REGISTER_NAME_MAP, SENSITIVE_REGISTERS, WRITABLE_REGISTERS
+from .const import (
+    DEFAULT_COMPACT_ATTRIBUTES,
+    DOMAIN,
+    METRIC_OPERATIONS,
+    REGISTER_NAME_MAP,
+    SENSITIVE_REGISTERS,
+    WRITABLE_REGISTERS,
+)
+from .entity import RegisterDeltaMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +31,35 @@ DEBUG_SENSOR_TYPES = {
     },
 }
 
+DEBUG_UPDATE_ATTRIBUTES = [
+    "last_update_error",
+    "last_update_at",
+    "last_update_duration_ms",
+    "last_update_spans",
+    "last_update_response_excerpt",
+    "last_register_count",
+    "writable_registers_available",
+    "missing_writable_registers",
+    "available_registers",
+]
+
+DEBUG_WRITE_ATTRIBUTES = [
+    "last_write_param_id",
+    "last_write_value",
+    "last_write_error",
+    "last_write_at",
+    "last_write_duration_ms",
+    "last_write_attempts",
+    "last_write_response_excerpt",
+]
+
+# Large debug payloads that compact mode serves through diagnostics instead of the recorder
+DEBUG_BULKY_ATTRIBUTES = {
+    "last_update_response_excerpt",
+    "last_write_response_excerpt",
+    "available_registers",
+}
+
 # Main sensors - visible by default (core charging information)
 MAIN_SENSOR_REGISTERS = [
     "device_status",  # Charger status from wallbox-info
@@ -53,15 +89,144 @@ REGISTER_CONFIG = {
 }
 
 
+def _decode_power_kw(raw_value):
+    if isinstance(raw_value, (int, float)):
+        # Values above 100 can only be watts for a wallbox rated in kW.
+        if raw_value > 100:
+            return raw_value / 1000
+        return float(raw_value)
+    return _decode_default(raw_value)
+
+
+def _decode_energy(raw_value):
+    if isinstance(raw_value, (int, float)):
+        return round(float(raw_value), 3)
+    return _decode_default(raw_value)
+
+
+def _decode_count(raw_value):
+    if isinstance(raw_value, (int, float)):
+        return int(raw_value) if float(raw_value).is_integer() else round(float(raw_value), 1)
+    return _decode_default(raw_value)
+
+
+def _decode_voltage(raw_value):
+    if isinstance(raw_value, (int, float)):
+        return round(float(raw_value), 1)
+    return _decode_default(raw_value)
+
+
+def _decode_device_info(raw_value):
+    if not isinstance(raw_value, str):
+        return str(raw_value)[:200]
+
+    lines = raw_value.split('\n')
+    extracted = {}
+    for line in lines:
+        line = line.strip()
+        if not line or '=' not in line:
+            continue
+        key, _, value = line.partition('=')
+        key = key.strip()
+        value = value.strip()
+        if key in ("BoardType", "Model", "VendorName") and value:
+            extracted[key] = value
+
+    key_info = [extracted[key] for key in ("BoardType", "Model", "VendorName") if key in extracted]
+    if key_info:
+        return ' - '.join(key_info)
+    # Fallback: just return first meaningful line
+    for line in lines:
+        stripped_line = line.strip()
+        if stripped_line and not stripped_line.startswith('/$') and '=' in stripped_line:
+            return stripped_line[:200]
+    return "Device Info Available"
+
+
+def _decode_default(raw_value):
+    if isinstance(raw_value, (int, float)):
+        return raw_value
+
+    # Keep string states within Home Assistant's 255 character limit.
+    str_value = str(raw_value)
+    if len(str_value) > 255:
+        return str_value[:252] + "..."
+    return str_value
+
+
+def _decode_sensitive(raw_value):
+    return None
+
+
+# Decoder applied to each register value, resolved once per entity.
+REGISTER_CODECS = {
+    "10003": _decode_power_kw,
+    "538976569": _decode_power_kw,
+    "538976570": _decode_power_kw,
+    "10008": _decode_energy,
+    "10009": _decode_energy,
+    "10010": _decode_count,
+    "20012": _decode_count,
+    "539006290": _decode_count,
+    "2101259": _decode_voltage,
+    "2101260": _decode_voltage,
+    "2101261": _decode_voltage,
+    "2101251": _decode_device_info,
+}
+REGISTER_CODECS.update({reg_id: _decode_sensitive for reg_id in SENSITIVE_REGISTERS})
+
+
+def register_codec(reg_id):
+    return REGISTER_CODECS.get(reg_id, _decode_default)
+
+
+def _compact_attributes(coordinator):
+    return getattr(coordinator, "compact_attributes", DEFAULT_COMPACT_ATTRIBUTES)
+
+
 def _register_sort_key(reg_id):
     reg_id = str(reg_id)
     return (0, int(reg_id)) if reg_id.isdigit() else (1, reg_id)
 
 
-def _sensor_unique_id(entry_id, reg_id):
+def _sensor_unique_id(entry_id, reg_id, wallbox_dn=None):
+    if wallbox_dn:
+        return f"{entry_id}_{wallbox_dn}_sensor_{reg_id}"
     return f"{entry_id}_sensor_{reg_id}"
 
 
+def _parse_sensor_unique_id(entry_id, unique_id):
+    """Return (wallbox_dn, reg_id) for register sensors of the entry, or None."""
+    prefix = f"{entry_id}_"
+    if not unique_id.startswith(prefix):
+        return None
+    scoped_id = unique_id[len(prefix):]
+    if scoped_id.startswith("sensor_"):
+        return None, scoped_id[len("sensor_"):]
+    wallbox_dn, separator, reg_id = scoped_id.rpartition("_sensor_")
+    if not separator or not wallbox_dn:
+        return None
+    return wallbox_dn, reg_id
+
+
+def _device_info(coordinator, wallbox_dn=None):
+    entry_id = coordinator.entry.entry_id
+    if not wallbox_dn:
+        return {
+            "identifiers": {(DOMAIN, entry_id)},
+            "name": "Huawei Charger",
+            "manufacturer": "Huawei",
+        }
+
+    wallbox = getattr(coordinator, "additional_wallboxes", {}).get(wallbox_dn) or {}
+    return {
+        "identifiers": {(DOMAIN, f"{entry_id}_{wallbox_dn}")},
+        "name": f"Huawei Charger {wallbox.get('name') or wallbox_dn}",
+        "manufacturer": "Huawei",
+        "via_device": (DOMAIN, entry_id),
+    }
+
+
 def _active_sensor_registers(data, config_signal_values=None, existing_register_ids=None):
     available_registers = {str(reg_id) for reg_id in (data or {})}
     available_registers.update(str(reg_id) for reg_id in (config_signal_values or {}))
@@ -78,10 +243,36 @@ def _active_sensor_registers(data, config_signal_values=None, existing_register_
     return active_main, active_diagnostic
 
 
+def _active_sensor_keys(coordinator):
+    """Return the (wallbox_dn, reg_id) keys of the register sensors set up for the coordinator."""
+    current_data = getattr(coordinator, "data", None) or getattr(coordinator, "param_values", {})
+    active_main, active_diagnostic = _active_sensor_registers(current_data, coordinator.config_signal_values)
+    active_keys = {(None, reg_id) for reg_id in active_main + active_diagnostic}
+    for wallbox_dn, wallbox in getattr(coordinator, "additional_wallboxes", {}).items():
+        wallbox_main, wallbox_diagnostic = _active_sensor_registers(wallbox["values"])
+        active_keys.update((wallbox_dn, reg_id) for reg_id in wallbox_main + wallbox_diagnostic)
+    return active_keys
+
+
+def stale_unique_id_filter(entry_id, coordinator):
+    """Return a check for register sensor unique IDs of the entry that no longer map to an entity.
+
+    Sensitive registers never get a sensor, so their unique IDs are stale as well.
+    """
+    active_keys = _active_sensor_keys(coordinator)
+
+    def is_stale(unique_id):
+        sensor_key = _parse_sensor_unique_id(entry_id, unique_id)
+        return sensor_key is not None and sensor_key not in active_keys
+
+    return is_stale
+
+
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    # Options changes reload the entry, so the compact setting is fixed for these entities.
+    register_sensor = HuaweiChargerCompactSensor if _compact_attributes(coordinator) else HuaweiChargerSensor
     entities = []
-    registry = er.async_get(hass)
     current_data = getattr(coordinator, "data", None) or getattr(coordinator, "param_values", {})
 
     active_main, active_diagnostic = _active_sensor_registers(
@@ -90,33 +281,31 @@ async def async_setup_entry(hass, entry, async_add_entities):
     )
 
     for reg_id in active_main:
-        entities.append(HuaweiChargerSensor(coordinator, reg_id, is_diagnostic=False))
+        entities.append(register_sensor(coordinator, reg_id, is_diagnostic=False))
 
     for reg_id in active_diagnostic:
-        entities.append(HuaweiChargerSensor(coordinator, reg_id, is_diagnostic=True))
+        entities.append(register_sensor(coordinator, reg_id, is_diagnostic=True))
+
+    # Other wallboxes of the station get their own device, built from the same device-list response.
+    known_wallbox_register_ids = {}
+    for wallbox_dn, wallbox in getattr(coordinator, "additional_wallboxes", {}).items():
+        wallbox_main, wallbox_diagnostic = _active_sensor_registers(wallbox["values"])
+        for reg_id in wallbox_main + wallbox_diagnostic:
+            entities.append(
+                register_sensor(
+                    coordinator,
+                    reg_id,
+                    is_diagnostic=reg_id not in wallbox_main,
+                    wallbox_dn=wallbox_dn,
+                )
+            )
+        known_wallbox_register_ids[wallbox_dn] = set(wallbox_main + wallbox_diagnostic)
 
     for debug_type in DEBUG_SENSOR_TYPES:
         entities.append(HuaweiChargerDebugSensor(coordinator, debug_type))
 
-    active_sensor_ids = set(active_main + active_diagnostic)
-    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
-        if registry_entry.domain != "sensor" or not registry_entry.unique_id:
-            continue
-
-        if registry_entry.unique_id in {
-            _sensor_unique_id(entry.entry_id, sensitive_reg_id)
-            for sensitive_reg_id in SENSITIVE_REGISTERS
-        }:
-            registry.async_remove(registry_entry.entity_id)
-            continue
-
-        sensor_prefix = f"{entry.entry_id}_sensor_"
-        if not registry_entry.unique_id.startswith(sensor_prefix):
-            continue
-
-        reg_id = registry_entry.unique_id[len(sensor_prefix):]
-        if reg_id not in active_sensor_ids:
-            registry.async_remove(registry_entry.entity_id)
+    for operation in METRIC_OPERATIONS:
+        entities.append(HuaweiChargerRequestMetricSensor(coordinator, operation))
 
     async_add_entities(entities)
 
@@ -124,54 +313,76 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     @callback
     def _async_add_new_sensors():
-        nonlocal known_register_ids
-        updated_data = getattr(coordinator, "data", None) or getattr(coordinator, "param_values", {})
-
-        updated_main, updated_diagnostic = _active_sensor_registers(
-            updated_data,
-            coordinator.config_signal_values,
-            known_register_ids,
-        )
-        updated_register_ids = set(updated_main + updated_diagnostic)
-        new_register_ids = updated_register_ids.difference(known_register_ids)
-        if not new_register_ids:
+        # The coordinator reports registers that appeared since the last update, so
+        # regular updates with an unchanged register set cost a single call here.
+        new_register_keys = coordinator.take_new_register_keys()
+        if not new_register_keys:
             return
 
+        new_register_ids = {}
+        for wallbox_dn, reg_id in new_register_keys:
+            if reg_id not in WRITABLE_REGISTERS and reg_id not in SENSITIVE_REGISTERS:
+                new_register_ids.setdefault(wallbox_dn, set()).add(reg_id)
+
+        main_ids = new_register_ids.pop(None, set()).difference(known_register_ids)
         new_entities = [
-            HuaweiChargerSensor(
+            register_sensor(
                 coordinator,
                 reg_id,
                 is_diagnostic=reg_id not in MAIN_SENSOR_REGISTERS,
             )
-            for reg_id in sorted(new_register_ids, key=_register_sort_key)
+            for reg_id in sorted(main_ids, key=_register_sort_key)
         ]
-        known_register_ids.update(new_register_ids)
-        async_add_entities(new_entities)
+        known_register_ids.update(main_ids)
+
+        for wallbox_dn in getattr(coordinator, "additional_wallboxes", {}):
+            if wallbox_dn not in new_register_ids:
+                continue
+            wallbox_known_ids = known_wallbox_register_ids.setdefault(wallbox_dn, set())
+            new_wallbox_ids = new_register_ids[wallbox_dn].difference(wallbox_known_ids)
+            new_entities.extend(
+                register_sensor(
+                    coordinator,
+                    reg_id,
+                    is_diagnostic=reg_id not in MAIN_SENSOR_REGISTERS,
+                    wallbox_dn=wallbox_dn,
+                )
+                for reg_id in sorted(new_wallbox_ids, key=_register_sort_key)
+            )
+            wallbox_known_ids.update(new_wallbox_ids)
+
+        if new_entities:
+            async_add_entities(new_entities)
 
     remove_listener = coordinator.async_add_listener(_async_add_new_sensors)
     if hasattr(entry, "async_on_unload"):
         entry.async_on_unload(remove_listener)
 
-class HuaweiChargerSensor(CoordinatorEntity, SensorEntity):
-    def __init__(self, coordinator, reg_id, is_diagnostic=False):
+class HuaweiChargerSensor(RegisterDeltaMixin, CoordinatorEntity, SensorEntity):
+    def __init__(self, coordinator, reg_id, is_diagnostic=False, wallbox_dn=None):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self._reg_id = reg_id
         self._is_diagnostic = is_diagnostic
+        self._wallbox_dn = wallbox_dn
         mapped_name = REGISTER_NAME_MAP.get(reg_id)
         self._attr_name = mapped_name or f"Register {reg_id}"
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_sensor_{reg_id}"
+        self._attr_unique_id = _sensor_unique_id(coordinator.entry.entry_id, reg_id, wallbox_dn)
         
+        self._codec = register_codec(reg_id)
+        self._decoded_raw = None
+        self._decoded_value = None
+        self._state_generation = None
+        self._state_raw = None
+        self._attributes_key = None
+        self._attributes = None
+
         # Set entity category for diagnostic sensors
         if is_diagnostic:
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
         
         # Set up device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.entry.entry_id)},
-            "name": "Huawei Charger",
-            "manufacturer": "Huawei",
-        }
+        self._attr_device_info = _device_info(coordinator, wallbox_dn)
         
         # Configure sensor attributes based on register type
         config = REGISTER_CONFIG.get(reg_id, {})
@@ -182,82 +393,30 @@ class HuaweiChargerSensor(CoordinatorEntity, SensorEntity):
         if "state_class" in config:
             self._attr_state_class = config["state_class"]
 
+    @callback
+    def _handle_coordinator_update(self):
+        if self._registers_changed((self._reg_id,), self._wallbox_dn):
+            self.async_write_ha_state()
+
     @property
     def native_value(self):
-        if self._reg_id in SENSITIVE_REGISTERS:
-            return None
-
-        raw_value = self.coordinator.get_register_value(self._reg_id)
-        
-        # Return None if no data available
+        raw_value = self._register_value()
         if raw_value is None:
             return None
-            
-        # Convert values if needed
+
+        # Registers only change on coordinator updates, so decode each distinct raw value once.
+        cached_raw = self._decoded_raw
+        if type(raw_value) is type(cached_raw) and raw_value == cached_raw:
+            return self._decoded_value
+
         try:
-            # For power values, ensure they're in kW
-            if self._reg_id in ["10003", "538976569", "538976570"] and isinstance(raw_value, (int, float)):
-                # Convert W to kW if the value seems to be in watts
-                if raw_value > 100:  # Assume values > 100 are in watts
-                    return raw_value / 1000
-                return float(raw_value)
-            
-            # For energy values, ensure proper formatting
-            if self._reg_id in ["10008", "10009"]:
-                if isinstance(raw_value, (int, float)):
-                    return round(float(raw_value), 3)
-
-            # For current/time values, ensure proper formatting
-            if self._reg_id in ["10010", "20012", "539006290"] and isinstance(raw_value, (int, float)):
-                return int(raw_value) if float(raw_value).is_integer() else round(float(raw_value), 1)
-
-            if self._reg_id in ["2101259", "2101260", "2101261"] and isinstance(raw_value, (int, float)):
-                return round(float(raw_value), 1)
-                    
-            # Special handling for Device Info register (2101251)
-            if self._reg_id == "2101251":
-                if isinstance(raw_value, str):
-                    # Extract key information from the device info
-                    lines = raw_value.split('\n')
-                    extracted = {}
-                    for line in lines:
-                        line = line.strip()
-                        if not line or '=' not in line:
-                            continue
-                        key, _, value = line.partition('=')
-                        key = key.strip()
-                        value = value.strip()
-                        if key in ("BoardType", "Model", "VendorName") and value:
-                            extracted[key] = value
-
-                    if extracted:
-                        ordered_keys = ["BoardType", "Model", "VendorName"]
-                        key_info = [extracted[key] for key in ordered_keys if key in extracted]
-                        if key_info:
-                            return ' - '.join(key_info)
-                    # Fallback: just return first meaningful line
-                    for line in lines:
-                        stripped_line = line.strip()
-                        if stripped_line and not stripped_line.startswith('/$') and '=' in stripped_line:
-                            return stripped_line[:200]  # Limit to 200 chars
-                    return "Device Info Available"
-                return str(raw_value)[:200]  # Fallback truncation
-                    
-            # Default: pass through native numeric values
-            if isinstance(raw_value, (int, float)) and not isinstance(raw_value, bool):
-                return raw_value
-            if isinstance(raw_value, bool):
-                return raw_value
-            
-            # Ensure string values don't exceed 255 characters
-            str_value = str(raw_value)
-            if len(str_value) > 255:
-                return str_value[:252] + "..."
-            return str_value
-            
+            value = self._codec(raw_value)
         except (ValueError, TypeError):
             self._log_warning("Could not convert value for register %s: %s", self._reg_id, raw_value)
-            return str(raw_value)
+            value = str(raw_value)
+        self._decoded_raw = raw_value
+        self._decoded_value = value
+        return value
 
     @property
     def should_poll(self):
@@ -267,26 +426,57 @@ class HuaweiChargerSensor(CoordinatorEntity, SensorEntity):
     def available(self):
         if self._reg_id in SENSITIVE_REGISTERS:
             return False
-        return self.coordinator.get_register_value(self._reg_id) is not None
+        return self._register_value() is not None
 
     @property
     def extra_state_attributes(self):
-        return {
-            "register_id": self._reg_id,
-            "raw_value": (
-                "***"
-                if self._reg_id in SENSITIVE_REGISTERS
-                else self.coordinator.get_register_value(self._reg_id)
-            ),
-            "stale": not self.coordinator.last_update_success,
-        }
+        cache_key = (getattr(self.coordinator, "data_generation", None), self.coordinator.last_update_success)
+        if cache_key[0] is None or cache_key != self._attributes_key:
+            self._attributes = {
+                "register_id": self._reg_id,
+                "stale": not self.coordinator.last_update_success,
+            }
+            # The raw value mostly repeats the state; compact mode leaves it to diagnostics.
+            if not _compact_attributes(self.coordinator):
+                self._attributes["raw_value"] = (
+                    "***"
+                    if self._reg_id in SENSITIVE_REGISTERS
+                    else self._register_value()
+                )
+            self._attributes_key = cache_key
+        return self._attributes
+
+    def _register_value(self):
+        # HA reads state, availability and attributes several times per write; one
+        # coordinator lookup per data generation serves all of them.
+        generation = getattr(self.coordinator, "data_generation", None)
+        if generation is not None and generation == self._state_generation:
+            return self._state_raw
+
+        if self._wallbox_dn is None:
+            raw_value = self.coordinator.get_register_value(self._reg_id)
+        else:
+            raw_value = self.coordinator.get_register_value(self._reg_id, self._wallbox_dn)
+        self._state_generation = generation
+        self._state_raw = raw_value
+        return raw_value
 
     def _log_warning(self, message, *args):
         if getattr(self.coordinator, "enable_logging", True):
             _LOGGER.warning(message, *args)
 
 
+class HuaweiChargerCompactSensor(HuaweiChargerSensor):
+    """Register sensor of an entry in compact mode; ``register_id`` stays out of the recorder."""
+
+    # Home Assistant merges unrecorded attributes per class, not per entity.
+    _unrecorded_attributes = frozenset({"register_id"})
+
+
 class HuaweiChargerDebugSensor(CoordinatorEntity, SensorEntity):
+    # The per-phase timings change every poll; diagnostics keep their history instead.
+    _unrecorded_attributes = frozenset({"last_update_spans"})
+
     def __init__(self, coordinator, debug_type):
         super().__init__(coordinator)
         self.coordinator = coordinator
@@ -318,23 +508,54 @@ class HuaweiChargerDebugSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         debug_data = self.coordinator.debug_data
         if self._debug_type == "update":
-            return {
-                "last_update_error": debug_data.get("last_update_error"),
-                "last_update_at": debug_data.get("last_update_at"),
-                "last_update_duration_ms": debug_data.get("last_update_duration_ms"),
-                "last_update_response_excerpt": debug_data.get("last_update_response_excerpt"),
-                "last_register_count": debug_data.get("last_register_count"),
-                "writable_registers_available": debug_data.get("writable_registers_available"),
-                "missing_writable_registers": debug_data.get("missing_writable_registers"),
-                "available_registers": debug_data.get("available_registers"),
-            }
+            keys = DEBUG_UPDATE_ATTRIBUTES
+        else:
+            keys = DEBUG_WRITE_ATTRIBUTES
+        if _compact_attributes(self.coordinator):
+            keys = [key for key in keys if key not in DEBUG_BULKY_ATTRIBUTES]
+        return {key: debug_data.get(key) for key in keys}
+
+
+class HuaweiChargerRequestMetricSensor(CoordinatorEntity, SensorEntity):
+    """p95 latency of one FusionSolar endpoint, with counters and other quantiles as attributes."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
+    def __init__(self, coordinator, operation):
+        super().__init__(coordinator)
+        self.coordinator = coordinator
+        self._operation = operation
+        self._attr_name = f"Request Latency {operation.replace('-', ' ').title()}"
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_request_metric_{operation}"
+        self._attr_device_info = _device_info(coordinator)
+
+    def _metrics(self):
+        return self.coordinator.request_metrics.get(self._operation)
+
+    @property
+    def native_value(self):
+        metrics = self._metrics()
+        return metrics.quantile(0.95) if metrics is not None else None
+
+    @property
+    def available(self):
+        return True
+
+    @property
+    def should_poll(self):
+        return False
+
+    @property
+    def extra_state_attributes(self):
+        metrics = self._metrics()
+        if metrics is None:
+            return {"count": 0, "errors": 0}
         return {
-            "last_write_param_id": debug_data.get("last_write_param_id"),
-            "last_write_value": debug_data.get("last_write_value"),
-            "last_write_error": debug_data.get("last_write_error"),
-            "last_write_at": debug_data.get("last_write_at"),
-            "last_write_duration_ms": debug_data.get("last_write_duration_ms"),
-            "last_write_attempts": debug_data.get("last_write_attempts"),
-            "last_write_response_excerpt": debug_data.get("last_write_response_excerpt"),
+            "count": metrics.count,
+            "errors": metrics.errors,
+            "p50_ms": metrics.quantile(0.5),
+            "p99_ms": metrics.quantile(0.99),
         }
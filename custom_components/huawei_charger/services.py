@@ -64,7 +64,7 @@ def async_register_services(hass: HomeAssistant) -> None:
         for coordinator in coordinators:
             if refresh:
                 try:
-                    await hass.async_add_executor_job(_refresh_config_signals, coordinator)
+                    await _async_refresh_config_signals(coordinator)
                 except Exception as err:
                     _LOGGER.warning(
                         "Huawei charger config signal refresh failed for entry_id=%s: %s",
@@ -107,17 +107,18 @@ def _get_coordinators(hass: HomeAssistant, *, entry_id: Optional[str] = None) ->
             continue
         if entry_id and key != entry_id:
             continue
-        if hasattr(value, "fetch_wallbox_config_probe"):
+        if hasattr(value, "async_fetch_wallbox_config_probe"):
             coordinators.append(value)
     return coordinators
 
 
-def _refresh_config_signals(coordinator) -> None:
-    coordinator._ensure_device_context()
+async def _async_refresh_config_signals(coordinator) -> None:
+    await coordinator._async_ensure_device_context()
     if not coordinator.wallbox_dn or not coordinator.wallbox_dn_id:
-        coordinator.fetch_wallbox_info()
+        await coordinator.async_fetch_wallbox_info()
     else:
-        coordinator.fetch_wallbox_config_probe()
+        await coordinator.async_fetch_wallbox_config_probe()
+        coordinator._track_register_changes()
         coordinator._update_register_debug_state()
 
 
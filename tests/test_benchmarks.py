@@ -0,0 +1,70 @@
+import asyncio
+
+from benchmarks.bench_coordinator import benchmarks
+from benchmarks.harness import compare, measure, run_benchmarks
+
+
+def test_measure_reports_time_cpu_and_peak_memory():
+    result = measure(lambda: [bytearray(4096) for _ in range(64)], rounds=3)
+
+    assert result["rounds"] == 3
+    assert result["median_ms"] >= result["min_ms"] >= 0
+    assert result["peak_kib"] >= 256
+
+
+def test_compare_flags_metrics_past_the_threshold_only():
+    baseline = {
+        "walk": {"min_ms": 2.0, "peak_kib": 100.0},
+        "decode": {"min_ms": 2.0, "peak_kib": 100.0},
+        "tiny": {"min_ms": 0.001, "peak_kib": 1.0},
+    }
+    results = {
+        "walk": {"min_ms": 3.5, "peak_kib": 100.0},
+        "decode": {"min_ms": 2.5, "peak_kib": 160.0},
+        "tiny": {"min_ms": 0.004, "peak_kib": 4.0},
+        "new": {"min_ms": 50.0, "peak_kib": 500.0},
+    }
+
+    assert compare(results, baseline, threshold=1.5) == [
+        "walk: min_ms 3.5 > 1.5 x 2.0",
+        "decode: peak_kib 160.0 > 1.5 x 100.0",
+    ]
+
+
+def test_quick_coordinator_suite_runs_every_stage():
+    results = asyncio.run(run_benchmarks(benchmarks(), quick=True))
+
+    assert sorted(results) == [
+        "cycle[devices=1,signals=10]",
+        "decode[signals=100]",
+        "device-records[devices=10]",
+        "normalize[signals=100]",
+        "sanitize[devices=10]",
+        "walk[signals=100]",
+    ]
+    assert results["cycle[devices=1,signals=10]"]["requests"] > 0
+
+
+def test_entity_fanout_bench_writes_only_entities_with_changed_registers():
+    from benchmarks.bench_entities import FanoutBench
+
+    async def run():
+        bench = FanoutBench(2, 20)
+        await bench.async_setup()
+        bench.publish(100)
+        first_writes = bench.writes
+        bench.writes = 0
+        bench.publish(0)
+        idle_writes = bench.writes
+        bench.writes = 0
+        bench.publish(50)
+        return bench, first_writes, idle_writes, bench.writes
+
+    bench, first_writes, idle_writes, half_writes = asyncio.run(run())
+
+    assert first_writes == len(bench.entities)
+    assert len(bench.sensor_listeners()) == 2
+    # Debug, metric and binary sensors publish every update; register sensors only on change.
+    assert idle_writes < half_writes < first_writes
+    # Ten register sensors per entry, plus both numbers, which follow rated power (10003).
+    assert half_writes - idle_writes == 2 * (10 + 2)
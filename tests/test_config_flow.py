@@ -10,11 +10,19 @@ from custom_components.huawei_charger.config_flow import (
     HuaweiChargerOptionsFlow,
 )
 from custom_components.huawei_charger.const import (
+    CONF_CHARGING_INTERVAL,
+    CONF_COMPACT_ATTRIBUTES,
     CONF_ENABLE_LOGGING,
+    CONF_IDLE_INTERVAL,
     CONF_INTERVAL,
+    CONF_MAX_BACKOFF_INTERVAL,
     CONF_STATION_DN,
     CONF_WALLBOX_DN,
+    DEFAULT_CHARGING_INTERVAL,
+    DEFAULT_COMPACT_ATTRIBUTES,
     DEFAULT_FUSIONSOLAR_HOST,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_BACKOFF_INTERVAL,
 )
 
 
@@ -47,6 +55,15 @@ def test_build_unique_id():
     )
 
 
+def test_build_unique_id_scopes_pinned_wallbox():
+    assert (
+        HuaweiChargerConfigFlow._build_unique_id(
+            "User@Example.com", "intl.fusionsolar.huawei.com", "NE=123"
+        )
+        == "user@example.com@intl.fusionsolar.huawei.com/NE=123"
+    )
+
+
 def test_options_flow_uses_current_home_assistant_base_class():
     assert issubclass(HuaweiChargerOptionsFlow, config_entries.OptionsFlow)
 
@@ -161,8 +178,12 @@ def test_options_flow_updates_host_from_active_integration():
         },
         options={
             CONF_INTERVAL: 60,
+            CONF_CHARGING_INTERVAL: DEFAULT_CHARGING_INTERVAL,
+            CONF_IDLE_INTERVAL: DEFAULT_IDLE_INTERVAL,
+            CONF_MAX_BACKOFF_INTERVAL: DEFAULT_MAX_BACKOFF_INTERVAL,
             CONF_VERIFY_SSL: True,
             CONF_ENABLE_LOGGING: False,
+            CONF_COMPACT_ATTRIBUTES: DEFAULT_COMPACT_ATTRIBUTES,
         },
         title="user@example.com @ uni005eu5.fusionsolar.huawei.com",
         unique_id="user@example.com@uni005eu5.fusionsolar.huawei.com",
@@ -185,6 +206,9 @@ def test_options_schema_includes_logging_toggle():
     schema = flow._options_schema(entry)
 
     assert CONF_ENABLE_LOGGING in schema.schema
+    assert CONF_CHARGING_INTERVAL in schema.schema
+    assert CONF_IDLE_INTERVAL in schema.schema
+    assert CONF_MAX_BACKOFF_INTERVAL in schema.schema
     assert CONF_STATION_DN in schema.schema
     assert CONF_WALLBOX_DN in schema.schema
 
@@ -234,8 +258,12 @@ def test_options_flow_missing_logging_value_turns_logging_off():
         },
         options={
             CONF_INTERVAL: 60,
+            CONF_CHARGING_INTERVAL: DEFAULT_CHARGING_INTERVAL,
+            CONF_IDLE_INTERVAL: DEFAULT_IDLE_INTERVAL,
+            CONF_MAX_BACKOFF_INTERVAL: DEFAULT_MAX_BACKOFF_INTERVAL,
             CONF_VERIFY_SSL: True,
             CONF_ENABLE_LOGGING: False,
+            CONF_COMPACT_ATTRIBUTES: DEFAULT_COMPACT_ATTRIBUTES,
         },
         title="user@example.com @ uni005eu5.fusionsolar.huawei.com",
         unique_id="user@example.com@uni005eu5.fusionsolar.huawei.com",
@@ -289,8 +317,12 @@ def test_options_flow_string_false_turns_logging_off():
         },
         options={
             CONF_INTERVAL: 60,
+            CONF_CHARGING_INTERVAL: DEFAULT_CHARGING_INTERVAL,
+            CONF_IDLE_INTERVAL: DEFAULT_IDLE_INTERVAL,
+            CONF_MAX_BACKOFF_INTERVAL: DEFAULT_MAX_BACKOFF_INTERVAL,
             CONF_VERIFY_SSL: False,
             CONF_ENABLE_LOGGING: False,
+            CONF_COMPACT_ATTRIBUTES: DEFAULT_COMPACT_ATTRIBUTES,
         },
         title="user@example.com @ uni005eu5.fusionsolar.huawei.com",
         unique_id="user@example.com@uni005eu5.fusionsolar.huawei.com",
@@ -346,12 +378,16 @@ def test_options_flow_updates_optional_station_and_wallbox_targets():
         },
         options={
             CONF_INTERVAL: 60,
+            CONF_CHARGING_INTERVAL: DEFAULT_CHARGING_INTERVAL,
+            CONF_IDLE_INTERVAL: DEFAULT_IDLE_INTERVAL,
+            CONF_MAX_BACKOFF_INTERVAL: DEFAULT_MAX_BACKOFF_INTERVAL,
             CONF_VERIFY_SSL: True,
             CONF_ENABLE_LOGGING: False,
+            CONF_COMPACT_ATTRIBUTES: DEFAULT_COMPACT_ATTRIBUTES,
             CONF_STATION_DN: "NE=station-2",
             CONF_WALLBOX_DN: "NE=wallbox-2",
         },
         title="user@example.com @ uni005eu5.fusionsolar.huawei.com",
-        unique_id="user@example.com@uni005eu5.fusionsolar.huawei.com",
+        unique_id="user@example.com@uni005eu5.fusionsolar.huawei.com/NE=wallbox-2",
     )
     assert result == {"title": "", "data": {}}
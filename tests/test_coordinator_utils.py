@@ -1,7 +1,14 @@
+import asyncio
+import json as json_module
+import re
+import time
+from collections import deque
+from datetime import timedelta
+from functools import partial
 from types import SimpleNamespace
 
+import aiohttp
 import pytest
-import requests
 
 from custom_components.huawei_charger.coordinator import (
     AuthenticationFailed,
@@ -9,50 +16,174 @@ from custom_components.huawei_charger.coordinator import (
     HuaweiChargerCoordinator,
     UpdateFailed,
 )
+from custom_components.huawei_charger.hub import FusionSolarAccountHub, SingleFlightGroup
 from custom_components.huawei_charger.const import (
+    CYCLE_TRACE_HISTORY,
+    DEFAULT_COMPACT_ATTRIBUTES,
     DEFAULT_FUSIONSOLAR_HOST,
     DEFAULT_LOCALE,
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_MAXSIZE,
     DEFAULT_TIMEZONE_OFFSET,
+    DIAGNOSTIC_RESPONSE_HISTORY,
 )
 
 
+class FakeStore:
+    def __init__(self, data=None):
+        self.data = data
+        self.saved = []
+        self.removed = False
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.saved.append(data)
+        self.data = data
+
+    async def async_remove(self):
+        self.removed = True
+        self.data = None
+
+
 def build_coordinator(language="en-US", time_zone="UTC"):
     scheduled_calls = []
     coordinator = object.__new__(HuaweiChargerCoordinator)
     coordinator.hass = SimpleNamespace(
         config=SimpleNamespace(language=language, time_zone=time_zone),
         loop=SimpleNamespace(
-            call_soon_threadsafe=lambda func, *args: scheduled_calls.append((func, args))
+            call_soon=lambda func, *args: scheduled_calls.append((func, args)) or object()
         ),
     )
-    coordinator.entry = SimpleNamespace(data={}, options={})
+    coordinator.entry = SimpleNamespace(entry_id="entry", data={}, options={})
     coordinator.verify_ssl = False
     coordinator.enable_logging = True
+    coordinator.compact_attributes = DEFAULT_COMPACT_ATTRIBUTES
     coordinator.request_timeout = 15
+    coordinator.pool_maxsize = DEFAULT_POOL_MAXSIZE
+    coordinator.pool_idle_timeout = DEFAULT_POOL_IDLE_TIMEOUT
+    coordinator.topology_refresh_interval = 900
+    coordinator.base_update_interval = 30
+    coordinator.charging_update_interval = 15
+    coordinator.idle_update_interval = 300
+    coordinator.max_backoff_interval = 900
+    coordinator.preferred_station_dn = None
+    coordinator.preferred_wallbox_dn = None
+    coordinator.update_interval = timedelta(seconds=30)
     coordinator.username = "user"
     coordinator.password = "password"
     coordinator.token = "token"
     coordinator.headers = {"Auth": "token"}
     coordinator.region_ip = "1.2.3.4"
+    coordinator.roa_rand = None
     coordinator.auth_host = DEFAULT_FUSIONSOLAR_HOST
     coordinator.dn_id = "station"
     coordinator.wallbox_dn = "NE=168363665"
     coordinator.wallbox_dn_id = "wallbox"
     coordinator.station_values = {}
     coordinator.param_values = {}
+    coordinator.additional_wallboxes = {}
+    coordinator.data_generation = 0
+    coordinator._register_snapshot = {}
+    coordinator._register_generations = {}
+    coordinator._new_register_keys = set()
+    coordinator._response_shapes = {}
+    coordinator.schema_fallbacks = {}
     coordinator.config_signal_details = {}
     coordinator.config_signal_values = {}
+    coordinator._device_list_values = {}
+    coordinator._device_list_filtered = True
+    coordinator._station_refreshed_at = time.monotonic()
+    coordinator._topology_refreshed_at = None
     coordinator.locale = DEFAULT_LOCALE
     coordinator.timezone_offset = DEFAULT_TIMEZONE_OFFSET
     coordinator._request_counter = 0
     coordinator._last_realtime_signal_catalog = None
     coordinator._last_config_signal_catalog = None
+    coordinator.response_history = {}
+    coordinator.signal_catalogs = {}
+    coordinator.request_metrics = {}
+    coordinator.cycle_traces = deque(maxlen=CYCLE_TRACE_HISTORY)
+    coordinator._update_cycle = 0
+    coordinator._unpublished_trace = None
     coordinator._history_probe_completed = False
+    coordinator._realtime_expected = True
+    coordinator._session_store = FakeStore()
+    coordinator._session_expires_at = None
+    coordinator._session_from_cache = False
+    coordinator._saved_session_context = None
+    coordinator._consecutive_failures = 0
+    coordinator._plugged_in = None
+    coordinator._charging = False
+    coordinator._last_session_energy = None
+    coordinator._write_boost_until = None
+    coordinator.account_hub = FusionSolarAccountHub("user@intl.fusionsolar.huawei.com")
+    coordinator._inflight = SingleFlightGroup()
+    coordinator._http_session = None
     coordinator._scheduled_calls = scheduled_calls
+    coordinator._debug_push_handle = None
+    coordinator.last_update_success = True
+    notifications = []
+    coordinator.async_update_listeners = lambda: notifications.append(True)
+    coordinator._notifications = notifications
     coordinator.debug_data = coordinator._build_debug_data()
     return coordinator
 
 
+class FakeClientResponse:
+    def __init__(self, payload=None, status=200, text=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._text = text if text is not None else json_module.dumps(payload or {})
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self, errors="strict"):
+        return self._text
+
+
+class FakeClientSession:
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.handler(method, url, **kwargs)
+
+
+def install_session(coordinator, handler):
+    session = FakeClientSession(handler)
+    coordinator._get_session = lambda: session
+    return session
+
+
+def async_return(value):
+    async def fake_call(*args, **kwargs):
+        return value
+
+    return fake_call
+
+
+def async_record(calls):
+    async def fake_call(*args, **kwargs):
+        calls.append(True)
+
+    return fake_call
+
+
+def record_sleeps(sleep_calls):
+    async def fake_sleep(delay):
+        sleep_calls.append(delay)
+
+    return fake_sleep
+
+
 class FailingJsonResponse:
     def json(self):
         raise ValueError("bad json")
@@ -67,10 +198,6 @@ class DummyResponse:
     def json(self):
         return self._payload
 
-    def raise_for_status(self):
-        if self.status_code >= 400:
-            raise requests.exceptions.HTTPError(response=self)
-
 
 def test_derive_locale_variants():
     coordinator = build_coordinator(language="en-US")
@@ -106,84 +233,230 @@ def test_json_or_error_without_default():
         coordinator._json_or_error(FailingJsonResponse(), "context")
 
 
-def test_request_post_success(monkeypatch):
+def test_request_post_success():
     coordinator = build_coordinator()
-    response = DummyResponse({"ok": True}, status_code=200)
 
-    def fake_post(url, *, json=None, data=None, headers=None, verify=None, timeout=None):
-        assert verify is coordinator.verify_ssl
-        assert timeout == coordinator.request_timeout
-        return response
+    def handler(method, url, **kwargs):
+        assert method == "POST"
+        assert kwargs["json"] == {"a": 1}
+        assert kwargs["timeout"].total == coordinator.request_timeout
+        return FakeClientResponse({"ok": True}, headers={"Content-Type": "application/json"})
 
-    monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.requests.post", fake_post
-    )
+    install_session(coordinator, handler)
 
-    result = coordinator._request_post(
-        "https://example.test",
-        json={"a": 1},
-        headers={"Authorization": "Token"},
+    result = asyncio.run(
+        coordinator._async_request_post(
+            "https://example.test",
+            json={"a": 1},
+            headers={"Authorization": "Token"},
+        )
     )
-    assert result is response
+    assert result.status_code == 200
+    assert result.json() == {"ok": True}
+    assert result.headers == {"Content-Type": "application/json"}
 
 
-def test_request_get_success(monkeypatch):
+def test_request_get_success():
     coordinator = build_coordinator()
-    response = DummyResponse({"ok": True}, status_code=200)
 
-    def fake_get(url, *, params=None, headers=None, verify=None, timeout=None):
-        assert params == {"deviceDn": "NE=1"}
-        assert verify is coordinator.verify_ssl
-        assert timeout == coordinator.request_timeout
-        return response
+    def handler(method, url, **kwargs):
+        assert method == "GET"
+        assert kwargs["params"] == {"deviceDn": "NE=1"}
+        assert kwargs["timeout"].total == coordinator.request_timeout
+        return FakeClientResponse({"ok": True})
 
-    monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.requests.get", fake_get
-    )
+    install_session(coordinator, handler)
 
-    result = coordinator._request_get(
-        "https://example.test",
-        params={"deviceDn": "NE=1"},
-        headers={"Authorization": "Token"},
+    result = asyncio.run(
+        coordinator._async_request_get(
+            "https://example.test",
+            params={"deviceDn": "NE=1"},
+            headers={"Authorization": "Token"},
+        )
     )
-    assert result is response
+    assert result.json() == {"ok": True}
+
+
+def test_session_pools_keepalive_connections_without_cookie_jar(monkeypatch):
+    connectors = []
+
+    class RecordingConnector(aiohttp.TCPConnector):
+        def __init__(self, **kwargs):
+            connectors.append(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr("custom_components.huawei_charger.coordinator.aiohttp.TCPConnector", RecordingConnector)
+    coordinator = build_coordinator()
+    coordinator.pool_maxsize = 3
+    coordinator.pool_idle_timeout = 30
+
+    async def run():
+        session = coordinator._get_session()
+        assert coordinator._get_session() is session
+        await coordinator.async_close_session()
+        return session
+
+    session = asyncio.run(run())
+
+    assert len(connectors) == 1
+    assert connectors[0]["limit"] == 3
+    assert connectors[0]["keepalive_timeout"] == 30
+    assert isinstance(session.cookie_jar, aiohttp.DummyCookieJar)
+    assert session.closed
+    assert coordinator._http_session is None
 
 
-def test_request_post_ssl_error(monkeypatch):
+def test_request_post_ssl_error():
     coordinator = build_coordinator()
     coordinator.verify_ssl = True
 
-    def fake_post(url, *, json=None, data=None, headers=None, verify=None, timeout=None):
-        raise requests.exceptions.SSLError("ssl failure")
+    def handler(method, url, **kwargs):
+        raise aiohttp.ClientSSLError(SimpleNamespace(ssl=True, host="example.test", port=443), OSError("ssl failure"))
 
-    monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.requests.post", fake_post
-    )
+    install_session(coordinator, handler)
 
     with pytest.raises(UpdateFailed) as exc:
-        coordinator._request_post("https://example.test")
+        asyncio.run(coordinator._async_request_post("https://example.test"))
     assert "disable verify_ssl" in str(exc.value)
 
 
-def test_request_post_http_auth_error(monkeypatch):
+def test_request_post_connection_error():
     coordinator = build_coordinator()
 
-    def fake_post(url, *, json=None, data=None, headers=None, verify=None, timeout=None):
-        return DummyResponse(
+    def handler(method, url, **kwargs):
+        raise aiohttp.ClientConnectionError("refused")
+
+    install_session(coordinator, handler)
+
+    with pytest.raises(UpdateFailed) as exc:
+        asyncio.run(coordinator._async_request_post("https://example.test"))
+    assert "Connection error" in str(exc.value)
+
+
+def test_request_post_http_auth_error():
+    coordinator = build_coordinator()
+
+    def handler(method, url, **kwargs):
+        return FakeClientResponse(
             {"accessToken": "secret-token", "message": "expired"},
-            status_code=401,
+            status=401,
         )
 
-    monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.requests.post", fake_post
-    )
+    install_session(coordinator, handler)
 
     with pytest.raises(AuthenticationFailed) as exc:
-        coordinator._request_post("https://example.test")
+        asyncio.run(coordinator._async_request_post("https://example.test"))
     assert "secret-token" not in str(exc.value)
     assert "***" in str(exc.value)
 
 
+def test_request_get_http_error_maps_to_request_error():
+    coordinator = build_coordinator()
+
+    def handler(method, url, **kwargs):
+        return FakeClientResponse(text="upstream down", status=502)
+
+    install_session(coordinator, handler)
+
+    with pytest.raises(FusionSolarRequestError) as exc:
+        asyncio.run(coordinator._async_request_get("https://example.test"))
+    assert not isinstance(exc.value, AuthenticationFailed)
+    assert "HTTP 502" in str(exc.value)
+    assert exc.value.response_excerpt == "upstream down"
+
+
+def test_realtime_fetch_skips_excerpts_when_logging_is_disabled():
+    coordinator = build_coordinator()
+    coordinator.enable_logging = False
+    coordinator._history_probe_completed = True
+    install_session(
+        coordinator,
+        lambda method, url, **kwargs: FakeClientResponse({"data": {"signals": [{"id": "10009", "value": "1.5"}]}}),
+    )
+    coordinator._json_dump = fail_request
+    coordinator._debug_repr = fail_request
+    coordinator._response_excerpt = fail_request
+    coordinator._response_headers_excerpt = fail_request
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_realtime_data())
+
+    assert result == {"10009": 1.5}
+
+
+def test_responses_are_captured_for_diagnostics_without_serializing():
+    coordinator = build_coordinator()
+    coordinator.enable_logging = False
+    coordinator._history_probe_completed = True
+    install_session(
+        coordinator,
+        lambda method, url, **kwargs: FakeClientResponse(
+            {"data": {"signals": [{"id": "10009", "name": "Energy", "realValue": "1.5"}]}, "token": "secret"},
+            headers={"Set-Cookie": "bspsession=abc"},
+        ),
+    )
+    coordinator._json_dump = fail_request
+    coordinator._sanitize_debug_value = fail_request
+    coordinator._sanitize_response_value = fail_request
+
+    async def run():
+        for _ in range(DIAGNOSTIC_RESPONSE_HISTORY + 2):
+            await coordinator.async_fetch_wallbox_realtime_data()
+
+    asyncio.run(run())
+
+    history = coordinator.response_history["wallbox-realtime"]
+    assert len(history) == DIAGNOSTIC_RESPONSE_HISTORY
+    assert [entry[1] for entry in history] == list(range(3, DIAGNOSTIC_RESPONSE_HISTORY + 3))
+
+    del coordinator._sanitize_debug_value
+    del coordinator._sanitize_response_value
+    snapshot = coordinator.diagnostics_snapshot()
+
+    captured = snapshot["responses"]["wallbox-realtime"][-1]
+    assert captured["status"] == 200
+    assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", captured["at"])
+    assert captured["body"]["token"] == "***"
+    assert captured["headers"] == {"Set-Cookie": "***"}
+    assert snapshot["signal_catalogs"]["wallbox-realtime"][0]["id"] == "10009"
+    assert snapshot["state"]["wallbox_dn"] == "NE=168363665"
+
+
+def test_request_metrics_group_operations_by_endpoint():
+    coordinator = build_coordinator()
+    statuses = iter([200, 500])
+    install_session(
+        coordinator,
+        lambda method, url, **kwargs: FakeClientResponse({}, status=next(statuses)),
+    )
+
+    async def run():
+        await coordinator._async_request_post("https://host", operation="set-config-new:20001")
+        with pytest.raises(FusionSolarRequestError):
+            await coordinator._async_request_post("https://host", operation="set-config-new:538976598")
+
+    asyncio.run(run())
+
+    metrics = coordinator.request_metrics["set-config-new"]
+    assert metrics.count == 2
+    assert metrics.errors == 1
+    assert coordinator.diagnostics_snapshot()["request_metrics"]["set-config-new"]["count"] == 2
+
+
+def test_debug_log_formats_lazy_excerpts_when_emitted(caplog):
+    coordinator = build_coordinator()
+    install_session(
+        coordinator,
+        lambda method, url, **kwargs: FakeClientResponse({"data": {"accessToken": "secret-token"}}),
+    )
+
+    with caplog.at_level("WARNING"):
+        asyncio.run(coordinator._async_request_get("https://example.test", headers={"Cookie": "bspsession=abc"}))
+
+    assert '"accessToken": "***"' in caplog.text
+    assert '"Cookie": "***"' in caplog.text
+    assert "secret-token" not in caplog.text
+
+
 def test_response_headers_excerpt_masks_sensitive_headers():
     coordinator = build_coordinator()
     response = DummyResponse({"ok": True})
@@ -208,18 +481,16 @@ def test_json_dump_masks_refresh_token():
     assert "***" in dumped
 
 
-def test_request_post_timeout(monkeypatch):
+def test_request_post_timeout():
     coordinator = build_coordinator()
 
-    def fake_post(url, *, json=None, data=None, headers=None, verify=None, timeout=None):
-        raise requests.exceptions.Timeout()
+    def handler(method, url, **kwargs):
+        raise asyncio.TimeoutError()
 
-    monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.requests.post", fake_post
-    )
+    install_session(coordinator, handler)
 
     with pytest.raises(UpdateFailed) as exc:
-        coordinator._request_post("https://example.test")
+        asyncio.run(coordinator._async_request_post("https://example.test"))
     assert "Request timeout" in str(exc.value)
 
 
@@ -228,14 +499,14 @@ def test_authenticate_uses_entry_host_when_region_missing(monkeypatch):
     coordinator.auth_host = "uni005eu5.fusionsolar.huawei.com"
     station_calls = []
 
-    def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
         assert url.startswith("https://uni005eu5.fusionsolar.huawei.com:32800/")
         return DummyResponse({"data": {"accessToken": "tenant-token"}})
 
-    coordinator._request_post = fake_request_post
-    coordinator.fetch_station_dn = lambda: station_calls.append(True)
+    coordinator._async_request_post = fake_request_post
+    coordinator.async_fetch_station_dn = async_record(station_calls)
 
-    coordinator.authenticate()
+    asyncio.run(coordinator.async_authenticate())
 
     assert coordinator.token == "tenant-token"
     assert coordinator.region_ip == "uni005eu5.fusionsolar.huawei.com"
@@ -249,7 +520,7 @@ def test_authenticate_retries_default_host_when_tenant_host_has_no_token(monkeyp
     post_calls = []
     station_calls = []
 
-    def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
         post_calls.append(url)
         if "uni005eu5.fusionsolar.huawei.com" in url:
             return DummyResponse({"data": {"message": "migrated"}})
@@ -257,10 +528,10 @@ def test_authenticate_retries_default_host_when_tenant_host_has_no_token(monkeyp
             {"data": {"accessToken": "intl-token", "regionFloatIp": "5.6.7.8"}}
         )
 
-    coordinator._request_post = fake_request_post
-    coordinator.fetch_station_dn = lambda: station_calls.append(True)
+    coordinator._async_request_post = fake_request_post
+    coordinator.async_fetch_station_dn = async_record(station_calls)
 
-    coordinator.authenticate()
+    asyncio.run(coordinator.async_authenticate())
 
     assert post_calls == [
         "https://uni005eu5.fusionsolar.huawei.com:32800/rest/neteco/appauthen/v1/smapp/app/token",
@@ -271,9 +542,260 @@ def test_authenticate_retries_default_host_when_tenant_host_has_no_token(monkeyp
     assert station_calls == [True]
 
 
+def fake_account_post(post_calls):
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+        post_calls.append(operation)
+        await asyncio.sleep(0)
+        if operation.startswith("authenticate"):
+            return DummyResponse({"data": {"accessToken": "token", "regionFloatIp": "5.6.7.8"}})
+        if operation == "station-list":
+            return DummyResponse({"data": {"list": [{"dn": "NE=station", "chargeStore": 1}]}})
+        return DummyResponse(
+            {
+                "data": [
+                    {"dn": "NE=wallbox-1", "dnId": 1, "paramValues": {"10009": "1.5"}},
+                    {"dn": "NE=wallbox-2", "dnId": 2, "paramValues": {"10009": "2.5"}},
+                ]
+            }
+        )
+
+    return fake_request_post
+
+
+def test_concurrent_authenticate_calls_share_one_login():
+    coordinator = build_coordinator()
+    coordinator._reset_auth_state()
+    post_calls = []
+    coordinator._async_request_post = fake_account_post(post_calls)
+
+    async def run():
+        await asyncio.gather(*(coordinator.async_authenticate() for _ in range(3)))
+
+    asyncio.run(run())
+
+    assert post_calls == [f"authenticate:{DEFAULT_FUSIONSOLAR_HOST}", "station-list"]
+    assert coordinator.token == "token"
+    assert coordinator.dn_id == "NE=station"
+    assert coordinator.account_hub._requests.requests == {}
+
+
+def test_account_hub_shares_login_and_device_list_between_entries():
+    hub = FusionSolarAccountHub("user@intl.fusionsolar.huawei.com")
+    post_calls = []
+    coordinators = []
+    for index, wallbox_dn in enumerate(("NE=wallbox-1", "NE=wallbox-2")):
+        coordinator = build_coordinator()
+        coordinator.entry.entry_id = f"entry-{index}"
+        coordinator._reset_auth_state()
+        coordinator.account_hub = hub
+        coordinator.preferred_wallbox_dn = wallbox_dn
+        coordinator._async_request_post = fake_account_post(post_calls)
+        coordinators.append(coordinator)
+
+    async def run():
+        for coordinator in coordinators:
+            await coordinator._async_ensure_device_context()
+        return await asyncio.gather(*(coordinator._async_fetch_wallbox_record() for coordinator in coordinators))
+
+    records = asyncio.run(run())
+
+    assert post_calls == [f"authenticate:{DEFAULT_FUSIONSOLAR_HOST}", "station-list", "wallbox-info"]
+    assert [record["dn"] for record in records] == ["NE=wallbox-1", "NE=wallbox-2"]
+    assert coordinators[1].token == "token"
+
+
+def test_rejected_login_is_dropped_from_account_hub():
+    hub = FusionSolarAccountHub("user@intl.fusionsolar.huawei.com")
+    hub.publish_session({"token": "token", "region_ip": "5.6.7.8", "expires_at": time.time() + 60})
+    coordinator = build_coordinator()
+    coordinator.account_hub = hub
+
+    coordinator._reset_auth_state(token_rejected=True)
+
+    assert hub.current_session() is None
+
+
+def test_transient_failure_keeps_shared_login_in_account_hub(monkeypatch):
+    monkeypatch.setattr("custom_components.huawei_charger.coordinator.asyncio.sleep", async_return(None))
+    hub = FusionSolarAccountHub("user@intl.fusionsolar.huawei.com")
+    hub.publish_session({"token": "token", "region_ip": "5.6.7.8", "expires_at": time.time() + 60})
+    coordinator = build_coordinator()
+    coordinator.account_hub = hub
+    coordinator.token = "token"
+    attempts = []
+
+    async def flaky_refresh():
+        attempts.append(coordinator.token)
+        if len(attempts) == 1:
+            raise FusionSolarRequestError("HTTP 502 error while contacting FusionSolar API")
+        return {}
+
+    coordinator._async_refresh_device_data = flaky_refresh
+
+    asyncio.run(coordinator._async_run_update_cycle())
+
+    assert attempts == ["token", None]
+    assert hub.current_session()["token"] == "token"
+
+
+def test_concurrent_callers_share_in_flight_failure():
+    coordinator = build_coordinator()
+    probe_calls = []
+
+    async def failing_probe():
+        probe_calls.append(True)
+        await asyncio.sleep(0)
+        raise FusionSolarRequestError("probe failed")
+
+    async def run():
+        return await asyncio.gather(
+            coordinator._async_single_flight(("config-probe", "NE=1"), failing_probe),
+            coordinator._async_single_flight(("config-probe", "NE=1"), failing_probe),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert probe_calls == [True]
+    assert all(isinstance(result, FusionSolarRequestError) for result in results)
+    assert coordinator._inflight.requests == {}
+
+
+def test_single_flight_survives_cancelled_caller():
+    coordinator = build_coordinator()
+
+    async def run():
+        release = asyncio.Event()
+
+        async def slow_request():
+            await release.wait()
+            return "record"
+
+        first = asyncio.ensure_future(coordinator._async_single_flight(("device-list", "NE=1"), slow_request))
+        second = asyncio.ensure_future(coordinator._async_single_flight(("device-list", "NE=1"), slow_request))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        return await second, first.cancelled()
+
+    assert asyncio.run(run()) == ("record", True)
+
+
+def test_single_flight_keys_by_target_identifier():
+    coordinator = build_coordinator()
+    calls = []
+
+    async def request():
+        calls.append(True)
+        await asyncio.sleep(0)
+
+    async def run():
+        await asyncio.gather(
+            coordinator._async_single_flight(("device-list", "NE=1"), request),
+            coordinator._async_single_flight(("device-list", "NE=2"), request),
+        )
+
+    asyncio.run(run())
+
+    assert calls == [True, True]
+
+
+def cached_session(**overrides):
+    cached = {
+        "username": "user",
+        "auth_host": DEFAULT_FUSIONSOLAR_HOST,
+        "token": "cached-token",
+        "region_ip": "5.6.7.8",
+        "roa_rand": "cached-rand",
+        "dn_id": "NE=station",
+        "wallbox_dn": "NE=wallbox",
+        "wallbox_dn_id": 42,
+        "station_values": {"charge_store": "Connected"},
+        "expires_at": time.time() + 3600,
+    }
+    cached.update(overrides)
+    return cached
+
+
+def test_restore_session_context_uses_cached_login():
+    coordinator = build_coordinator()
+    coordinator._reset_auth_state()
+    coordinator._session_store = FakeStore(cached_session())
+
+    assert asyncio.run(coordinator.async_restore_session_context()) is True
+
+    assert coordinator.token == "cached-token"
+    assert coordinator.region_ip == "5.6.7.8"
+    assert coordinator.headers["roaRand"] == "cached-rand"
+    assert "bspsession=cached-token" in coordinator.headers["Cookie"]
+    assert coordinator.dn_id == "NE=station"
+    assert coordinator.wallbox_dn == "NE=wallbox"
+    assert coordinator.wallbox_dn_id == 42
+    assert coordinator.station_values == {"charge_store": "Connected"}
+    assert coordinator._session_from_cache is True
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"expires_at": time.time() - 1},
+        {"username": "someone-else"},
+        {"auth_host": "uni005eu5.fusionsolar.huawei.com"},
+        {"token": None},
+    ],
+)
+def test_restore_session_context_ignores_stale_cache(overrides):
+    coordinator = build_coordinator()
+    coordinator._reset_auth_state()
+    coordinator._session_store = FakeStore(cached_session(**overrides))
+
+    assert asyncio.run(coordinator.async_restore_session_context()) is False
+    assert coordinator.token is None
+
+
+def test_refresh_device_data_falls_back_to_login_when_cached_session_is_rejected():
+    coordinator = build_coordinator()
+    coordinator._reset_auth_state()
+    coordinator._session_store = FakeStore(cached_session())
+    asyncio.run(coordinator.async_restore_session_context())
+    fetch_tokens = []
+
+    async def fake_fetch_wallbox_info():
+        fetch_tokens.append(coordinator.token)
+        if coordinator.token == "cached-token":
+            raise AuthenticationFailed("HTTP 401 authentication error from FusionSolar")
+        return {}
+
+    async def fake_authenticate():
+        coordinator._apply_session_token("fresh-token", "9.9.9.9")
+        coordinator._session_expires_at = time.time() + 60
+        coordinator.dn_id = "NE=station"
+
+    coordinator.async_fetch_wallbox_info = fake_fetch_wallbox_info
+    coordinator.async_authenticate = fake_authenticate
+
+    asyncio.run(coordinator._async_refresh_device_data())
+
+    assert fetch_tokens == ["cached-token", "fresh-token"]
+    assert coordinator._session_store.removed is True
+    assert coordinator._session_store.saved[-1]["token"] == "fresh-token"
+    assert coordinator._session_from_cache is False
+
+
+def test_save_session_context_skips_unchanged_context():
+    coordinator = build_coordinator()
+    coordinator._session_expires_at = time.time() + 60
+
+    asyncio.run(coordinator._async_save_session_context())
+    asyncio.run(coordinator._async_save_session_context())
+
+    assert len(coordinator._session_store.saved) == 1
+    assert coordinator._session_store.saved[0]["wallbox_dn"] == "NE=168363665"
+
+
 def test_fetch_station_dn_stores_charge_store():
     coordinator = build_coordinator()
-    coordinator._request_post = lambda *args, **kwargs: DummyResponse(
+    coordinator._async_request_post = async_return(DummyResponse(
         {
             "data": {
                 "list": [
@@ -284,9 +806,9 @@ def test_fetch_station_dn_stores_charge_store():
                 ]
             }
         }
-    )
+    ))
 
-    coordinator.fetch_station_dn()
+    asyncio.run(coordinator.async_fetch_station_dn())
 
     assert coordinator.dn_id == "NE=149170766"
     assert coordinator.station_values == {"charge_store": "Connected"}
@@ -295,7 +817,7 @@ def test_fetch_station_dn_stores_charge_store():
 def test_fetch_station_dn_prefers_configured_station():
     coordinator = build_coordinator()
     coordinator.preferred_station_dn = "NE=station-2"
-    coordinator._request_post = lambda *args, **kwargs: DummyResponse(
+    coordinator._async_request_post = async_return(DummyResponse(
         {
             "data": {
                 "list": [
@@ -304,9 +826,9 @@ def test_fetch_station_dn_prefers_configured_station():
                 ]
             }
         }
-    )
+    ))
 
-    coordinator.fetch_station_dn()
+    asyncio.run(coordinator.async_fetch_station_dn())
 
     assert coordinator.dn_id == "NE=station-2"
     assert coordinator.station_values == {"charge_store": "Connected"}
@@ -317,7 +839,7 @@ def test_fetch_wallbox_info_falls_back_to_realtime_data():
     coordinator.dn_id = "NE=149170766"
     coordinator.wallbox_dn = None
     coordinator.wallbox_dn_id = None
-    coordinator._request_post = lambda *args, **kwargs: DummyResponse(
+    coordinator._async_request_post = async_return(DummyResponse(
         {
             "code": 0,
             "data": [
@@ -331,8 +853,8 @@ def test_fetch_wallbox_info_falls_back_to_realtime_data():
                 }
             ],
         }
-    )
-    coordinator._request_get = lambda *args, **kwargs: DummyResponse(
+    ))
+    coordinator._async_request_get = async_return(DummyResponse(
         {
             "data": [
                 {"id": "20012", "value": "40"},
@@ -340,9 +862,9 @@ def test_fetch_wallbox_info_falls_back_to_realtime_data():
                 {"id": "538976598", "value": "7.4"},
             ]
         }
-    )
+    ))
 
-    result = coordinator.fetch_wallbox_info()
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
 
     assert coordinator.wallbox_dn == "NE=168363665"
     assert coordinator.wallbox_dn_id == 118509961
@@ -354,7 +876,7 @@ def test_fetch_wallbox_info_falls_back_to_realtime_data():
 def test_fetch_wallbox_info_keeps_config_values_separate_from_runtime_values():
     coordinator = build_coordinator()
     coordinator.dn_id = "NE=149170766"
-    coordinator._request_post = lambda *args, **kwargs: DummyResponse(
+    coordinator._async_request_post = async_return(DummyResponse(
         {
             "code": 0,
             "data": [
@@ -367,18 +889,18 @@ def test_fetch_wallbox_info_keeps_config_values_separate_from_runtime_values():
                 }
             ],
         }
-    )
-    def fake_fetch_wallbox_config_probe():
+    ))
+    async def fake_fetch_wallbox_config_probe():
         coordinator.config_signal_values = {
             "20001": 4.0,
             "538976598": 7.4,
         }
         return coordinator.config_signal_values
 
-    coordinator.fetch_wallbox_config_probe = fake_fetch_wallbox_config_probe
-    coordinator.fetch_wallbox_realtime_data = lambda: {"10008": 12.34}
+    coordinator.async_fetch_wallbox_config_probe = fake_fetch_wallbox_config_probe
+    coordinator.async_fetch_wallbox_realtime_data = async_return({"10008": 12.34})
 
-    result = coordinator.fetch_wallbox_info()
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
 
     assert result["10008"] == 12.34
     assert coordinator.config_signal_values == {
@@ -391,9 +913,9 @@ def test_fetch_wallbox_info_prefers_configured_wallbox():
     coordinator = build_coordinator()
     coordinator.dn_id = "NE=149170766"
     coordinator.preferred_wallbox_dn = "NE=wallbox-2"
-    coordinator.fetch_wallbox_config_probe = lambda: {}
-    coordinator.fetch_wallbox_realtime_data = lambda: {}
-    coordinator._request_post = lambda *args, **kwargs: DummyResponse(
+    coordinator.async_fetch_wallbox_config_probe = async_return({})
+    coordinator.async_fetch_wallbox_realtime_data = async_return({})
+    coordinator._async_request_post = async_return(DummyResponse(
         {
             "code": 0,
             "data": [
@@ -411,9 +933,9 @@ def test_fetch_wallbox_info_prefers_configured_wallbox():
                 },
             ],
         }
-    )
+    ))
 
-    result = coordinator.fetch_wallbox_info()
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
 
     assert coordinator.wallbox_dn == "NE=wallbox-2"
     assert coordinator.wallbox_dn_id == 222
@@ -421,19 +943,479 @@ def test_fetch_wallbox_info_prefers_configured_wallbox():
     assert result["10003"] == 11
 
 
+def test_fetch_wallbox_info_fans_out_requests_when_wallbox_is_known():
+    coordinator = build_coordinator()
+    coordinator.dn_id = "NE=149170766"
+    in_flight = []
+    max_in_flight = []
+
+    async def track(result):
+        in_flight.append(True)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.pop()
+        return result
+
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+        return await track(
+            DummyResponse(
+                {
+                    "data": [
+                        {
+                            "dn": "NE=168363665",
+                            "dnId": 118509961,
+                            "paramValues": {"10008": "1.0", "10009": "0.5"},
+                        }
+                    ]
+                }
+            )
+        )
+
+    async def fake_config_probe():
+        return await track({})
+
+    async def fake_realtime():
+        return await track({"10009": 0.75, "20017": True})
+
+    coordinator._async_request_post = fake_request_post
+    coordinator.async_fetch_wallbox_config_probe = fake_config_probe
+    coordinator.async_fetch_wallbox_realtime_data = fake_realtime
+    coordinator.station_values = {"charge_store": "Connected"}
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    assert max(max_in_flight) == 3
+    assert result["10008"] == 1
+    assert result["10009"] == 0.75
+    assert result["charge_store"] == "Connected"
+
+
+def station_device_list(post_calls):
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+        post_calls.append(operation)
+        return DummyResponse(
+            {
+                "data": [
+                    {
+                        "dn": "NE=168363665",
+                        "dnId": 1,
+                        "paramValues": {"10003": "7.4", "10008": "1.0", "10009": "0.5", "10010": "3", "20017": "1"},
+                    },
+                    {
+                        "dn": "NE=garage",
+                        "dnId": 2,
+                        "name": "Garage",
+                        "paramValues": {"10008": "4.0"},
+                    },
+                    {
+                        "dn": "NE=carport",
+                        "dnId": 3,
+                        "paramValues": {"10003": "11", "10008": "9.0", "10009": "2.0", "10010": "5", "20017": "0"},
+                    },
+                ]
+            }
+        )
+
+    return fake_request_post
+
+
+def test_fetch_wallbox_info_exposes_every_wallbox_from_one_device_list():
+    coordinator = build_coordinator()
+    post_calls = []
+    realtime_calls = []
+
+    async def fake_realtime(device_dn=None):
+        realtime_calls.append(device_dn)
+        return {"10009": 0.9, "20017": True}
+
+    coordinator._async_request_post = station_device_list(post_calls)
+    coordinator.async_fetch_wallbox_config_probe = async_return({})
+    coordinator.async_fetch_wallbox_realtime_data = fake_realtime
+    coordinator.station_values = {"charge_store": "Connected"}
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    assert post_calls == ["wallbox-info"]
+    assert realtime_calls == [None, "NE=garage"]
+    assert result["10009"] == 0.5
+    assert sorted(coordinator.additional_wallboxes) == ["NE=carport", "NE=garage"]
+    assert coordinator.additional_wallboxes["NE=garage"]["name"] == "Garage"
+    assert coordinator.get_register_value("10009", "NE=garage") == 0.9
+    assert coordinator.get_register_value("10008", "NE=carport") == 9
+    assert coordinator.get_register_value("charge_store", "NE=carport") == "Connected"
+    assert coordinator.get_register_value("10009", "NE=168363665") == 0.5
+    assert coordinator.get_register_value("10009", "NE=unknown") is None
+
+
+def test_fetch_wallbox_info_keeps_last_values_when_additional_wallbox_fails():
+    coordinator = build_coordinator()
+    coordinator._topology_refreshed_at = time.monotonic()
+    coordinator._realtime_expected = False
+    coordinator._device_list_values = {"10009": 0.5}
+    coordinator.additional_wallboxes = {
+        "NE=garage": {
+            "dn_id": 2,
+            "name": "Garage",
+            "realtime": True,
+            "device_values": {"10008": 4},
+            "values": {"10008": 4, "10009": 0.8},
+        }
+    }
+
+    async def fake_realtime(device_dn=None):
+        raise UpdateFailed("garage offline")
+
+    coordinator.account_hub.share_window = 0
+    coordinator._async_request_post = station_device_list([])
+    coordinator.async_fetch_wallbox_realtime_data = fake_realtime
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    assert result["10009"] == 0.5
+    assert coordinator.get_register_value("10009", "NE=garage") == 0.8
+
+
+def test_pinned_wallbox_does_not_expose_other_wallboxes():
+    coordinator = build_coordinator()
+    coordinator.preferred_wallbox_dn = "NE=168363665"
+    coordinator._async_request_post = station_device_list([])
+    coordinator.async_fetch_wallbox_config_probe = async_return({})
+    coordinator.async_fetch_wallbox_realtime_data = async_return({})
+
+    asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    assert coordinator.additional_wallboxes == {}
+
+
+def test_unpinned_entry_skips_wallboxes_pinned_by_other_entries():
+    coordinator = build_coordinator()
+    coordinator.wallbox_dn = None
+    coordinator.account_hub.pinned_wallboxes = {"other-entry": "NE=168363665", "entry": "NE=ignored"}
+    coordinator._async_request_post = station_device_list([])
+    coordinator.async_fetch_wallbox_config_probe = async_return({})
+    coordinator.async_fetch_wallbox_realtime_data = async_return({})
+
+    asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    assert coordinator.wallbox_dn == "NE=garage"
+    assert sorted(coordinator.additional_wallboxes) == ["NE=carport"]
+
+
+def test_fetch_wallbox_info_refetches_when_selected_wallbox_changes():
+    coordinator = build_coordinator()
+    coordinator.dn_id = "NE=149170766"
+    coordinator.wallbox_dn = "NE=old"
+    realtime_dns = []
+    probe_dns = []
+
+    async def fake_config_probe():
+        probe_dns.append(coordinator.wallbox_dn)
+        return {}
+
+    async def fake_realtime():
+        realtime_dns.append(coordinator.wallbox_dn)
+        return {"10009": 1.0 if coordinator.wallbox_dn == "NE=new" else 9.0}
+
+    coordinator._async_request_post = async_return(
+        DummyResponse({"data": [{"dn": "NE=new", "dnId": 2, "paramValues": {}}]})
+    )
+    coordinator.async_fetch_wallbox_config_probe = fake_config_probe
+    coordinator.async_fetch_wallbox_realtime_data = fake_realtime
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    assert probe_dns == ["NE=old", "NE=new"]
+    assert realtime_dns == ["NE=old", "NE=new"]
+    assert result["10009"] == 1.0
+
+
+def fail_request(*args, **kwargs):
+    raise AssertionError("topology request should have been skipped")
+
+
+def test_fetch_wallbox_info_steady_state_skips_station_and_config_refresh():
+    coordinator = build_coordinator()
+    coordinator._topology_refreshed_at = time.monotonic()
+    coordinator._device_list_values = {"device_status": "3", "10003": 7}
+    coordinator.station_values = {"charge_store": "Connected"}
+    operations = []
+    payloads = []
+
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+        operations.append(operation)
+        payloads.append(data)
+        return DummyResponse(
+            {"data": [{"dn": "NE=168363665", "dnId": 1, "deviceStatus": "Charging", "paramValues": {"10003": 7}}]}
+        )
+
+    coordinator._async_request_post = fake_request_post
+    coordinator.async_fetch_wallbox_config_probe = fail_request
+    coordinator.async_fetch_wallbox_realtime_data = async_return({"10009": 1.5, "20017": True})
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    # deviceStatus is live data, so the device list is read on every poll; station list and config are not.
+    assert operations == ["wallbox-info"]
+    # Without other wallboxes to show, the poll asks for the record of its own wallbox only.
+    assert "conditionParams.dn=NE=168363665&conditionParams.recordperpage=1" in payloads[0]
+    assert result == {
+        "device_status": "Charging",
+        "10003": 7,
+        "10009": 1.5,
+        "20017": True,
+        "charge_store": "Connected",
+    }
+    assert coordinator._device_list_values == {"device_status": "Charging", "10003": 7}
+
+
+def test_fetch_wallbox_info_reads_full_device_list_once_dn_filter_is_ignored():
+    coordinator = build_coordinator()
+    coordinator._topology_refreshed_at = time.monotonic()
+    coordinator._realtime_expected = False
+    post_calls = []
+    request_post = station_device_list(post_calls)
+    payloads = []
+
+    async def fake_request_post(url, *, data=None, **kwargs):
+        payloads.append(data)
+        return await request_post(url, data=data, **kwargs)
+
+    coordinator.wallbox_dn = "NE=carport"
+    coordinator._async_request_post = fake_request_post
+    coordinator.async_fetch_wallbox_config_probe = async_return({})
+    coordinator.async_fetch_wallbox_realtime_data = async_return({})
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    # The filtered read returned another wallbox, so the cycle fell back to the station's list.
+    assert "conditionParams.dn=NE=carport" in payloads[0]
+    assert "conditionParams.dn=" not in payloads[1]
+    assert coordinator._device_list_filtered is False
+    assert coordinator.wallbox_dn == "NE=carport"
+    assert result["10008"] == 9
+    assert sorted(coordinator.additional_wallboxes) == ["NE=168363665", "NE=garage"]
+
+
+def test_fetch_wallbox_info_refreshes_topology_on_telemetry_miss():
+    coordinator = build_coordinator()
+    coordinator._topology_refreshed_at = time.monotonic()
+    realtime_calls = []
+
+    async def fake_realtime():
+        realtime_calls.append(True)
+        return {} if len(realtime_calls) == 1 else {"10009": 2.0}
+
+    coordinator._async_request_post = async_return(
+        DummyResponse({"data": [{"dn": "NE=168363665", "dnId": 1, "deviceStatus": "1"}]})
+    )
+    coordinator.async_fetch_wallbox_config_probe = async_return({})
+    coordinator.async_fetch_wallbox_realtime_data = fake_realtime
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    assert len(realtime_calls) == 2
+    assert result["device_status"] == "1"
+    assert result["10009"] == 2.0
+    assert coordinator._device_list_values == {"device_status": "1"}
+
+
+def test_fetch_wallbox_info_refreshes_topology_after_interval():
+    coordinator = build_coordinator()
+    coordinator._topology_refreshed_at = time.monotonic() - coordinator.topology_refresh_interval - 1
+    coordinator._station_refreshed_at = coordinator._topology_refreshed_at
+    operations = []
+
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+        operations.append(operation)
+        if operation == "station-list":
+            return DummyResponse({"data": {"list": [{"dn": "station", "chargeStore": "Idle"}]}})
+        return DummyResponse({"data": [{"dn": "NE=168363665", "dnId": 1, "paramValues": {}}]})
+
+    coordinator._async_request_post = fake_request_post
+    coordinator.async_fetch_wallbox_config_probe = async_return({})
+    coordinator.async_fetch_wallbox_realtime_data = async_return({"10009": 2.0})
+
+    result = asyncio.run(coordinator.async_fetch_wallbox_info())
+
+    assert sorted(operations) == ["station-list", "wallbox-info"]
+    assert result["charge_store"] == "Idle"
+    assert coordinator._topology_refresh_due() is False
+
+
+def run_update_cycle(coordinator, values):
+    async def fake_refresh():
+        coordinator.param_values = dict(values)
+
+    coordinator._async_refresh_device_data = fake_refresh
+    return asyncio.run(coordinator._async_update_data())
+
+
+def test_update_cycle_records_phase_trace(monkeypatch):
+    coordinator = build_coordinator()
+    monkeypatch.setattr(
+        "custom_components.huawei_charger.coordinator.asyncio.sleep", record_sleeps([])
+    )
+    install_session(
+        coordinator,
+        lambda method, url, **kwargs: FakeClientResponse({"data": {"signals": [{"id": "10009", "value": "1.5"}]}}),
+    )
+    attempts = []
+
+    async def flaky_refresh():
+        attempts.append(True)
+        if len(attempts) == 1:
+            raise UpdateFailed("temporary")
+        # The failed attempt reset the session context.
+        coordinator.region_ip = "1.2.3.4"
+        coordinator.wallbox_dn = "NE=168363665"
+        await coordinator.async_fetch_wallbox_realtime_data()
+        coordinator.param_values = {"10009": 1.5}
+
+    coordinator._history_probe_completed = True
+    coordinator._async_refresh_device_data = flaky_refresh
+
+    asyncio.run(coordinator._async_update_data())
+
+    trace = coordinator.cycle_traces[-1].as_dict()
+    assert trace["status"] == "success"
+    assert trace["attempts"] == 2
+    assert trace["loop_lag_ms"] is not None
+    assert {"realtime", "normalization", "backoff"} <= set(trace["spans_ms"])
+    assert coordinator.debug_data["last_update_spans"]["attempts"] == 2
+    assert coordinator.diagnostics_snapshot()["cycle_traces"] == [trace]
+
+
+def test_cycle_trace_counts_concurrent_requests_once_and_skips_concurrent_writes():
+    coordinator = build_coordinator()
+
+    class SlowResponse(FakeClientResponse):
+        async def __aenter__(self):
+            await asyncio.sleep(0.05)
+            return self
+
+    install_session(coordinator, lambda method, url, **kwargs: SlowResponse({}))
+
+    def request(operation):
+        return coordinator._async_request("POST", "https://example.invalid", request_id=1, operation=operation)
+
+    async def refresh():
+        await asyncio.gather(request("wallbox-realtime"), request("wallbox-realtime"))
+
+    coordinator._async_refresh_device_data = refresh
+
+    async def run():
+        # A write from a service call overlaps the cycle in its own task.
+        write = asyncio.ensure_future(request("set-config-new:20001"))
+        await coordinator._async_update_data()
+        await write
+
+    asyncio.run(run())
+
+    trace = coordinator.cycle_traces[-1].as_dict()
+    assert 45 <= trace["spans_ms"]["realtime"] < 90
+    assert "write" not in trace["spans_ms"]
+    assert trace["spans_ms"]["realtime"] <= trace["duration_ms"]
+    assert coordinator.request_metrics["set-config-new"].count == 1
+
+
+def test_only_cycle_ending_notification_records_publish_span():
+    coordinator = build_coordinator()
+
+    async def refresh():
+        coordinator.param_values = {"10009": 1.5}
+
+    coordinator._async_refresh_device_data = refresh
+    coordinator._listeners = {}
+    notify = partial(HuaweiChargerCoordinator.async_update_listeners, coordinator)
+
+    asyncio.run(coordinator._async_update_data())
+    assert "publish" not in coordinator.debug_data["last_update_spans"]["spans_ms"]
+
+    # DataUpdateCoordinator notifies once the cycle returns; later pushes are not part of it.
+    notify()
+    publish_ms = coordinator.cycle_traces[-1].spans["publish"]
+    notify()
+
+    assert coordinator.cycle_traces[-1].spans["publish"] == publish_ms
+    assert coordinator.debug_data["last_update_spans"]["spans_ms"]["publish"] == publish_ms
+
+
+def test_update_interval_slows_down_while_unplugged():
+    coordinator = build_coordinator()
+
+    run_update_cycle(coordinator, {"20017": False, "10009": 0})
+
+    assert coordinator.update_interval == timedelta(seconds=300)
+
+
+def test_update_interval_speeds_up_while_session_energy_advances():
+    coordinator = build_coordinator()
+
+    run_update_cycle(coordinator, {"20017": True, "10009": 1.5})
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+    run_update_cycle(coordinator, {"20017": True, "10009": 1.8})
+    assert coordinator.update_interval == timedelta(seconds=15)
+
+    run_update_cycle(coordinator, {"20017": True, "10009": 1.8})
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+
+def test_update_interval_speeds_up_when_car_is_plugged_in():
+    coordinator = build_coordinator()
+
+    run_update_cycle(coordinator, {"20017": 0, "10009": 0})
+    run_update_cycle(coordinator, {"20017": 1, "10009": 0})
+
+    assert coordinator.update_interval == timedelta(seconds=15)
+
+
+def test_update_interval_speeds_up_after_config_write():
+    coordinator = build_coordinator()
+    coordinator._write_boost_until = time.monotonic() + 60
+
+    run_update_cycle(coordinator, {"20017": False})
+
+    assert coordinator.update_interval == timedelta(seconds=15)
+
+
+def test_update_interval_backs_off_while_cloud_fails(monkeypatch):
+    coordinator = build_coordinator()
+    coordinator._charging = True
+    monkeypatch.setattr(
+        "custom_components.huawei_charger.coordinator.asyncio.sleep", record_sleeps([])
+    )
+
+    async def failing_refresh():
+        raise UpdateFailed("cloud down")
+
+    coordinator._async_refresh_device_data = failing_refresh
+    coordinator._reset_auth_state = lambda: None
+
+    expected = [60, 120, 240, 480, 900, 900]
+    for seconds in expected:
+        with pytest.raises(UpdateFailed):
+            asyncio.run(coordinator._async_update_data())
+        assert coordinator.update_interval == timedelta(seconds=seconds)
+
+    run_update_cycle(coordinator, {"20017": False})
+    assert coordinator._consecutive_failures == 0
+    assert coordinator.update_interval == timedelta(seconds=300)
+
+
 def test_fetch_wallbox_config_probe_uses_dn_get_shape():
     coordinator = build_coordinator()
     coordinator.wallbox_dn = "NE=168363665"
     coordinator.wallbox_dn_id = 118509961
     calls = []
 
-    def fake_request_get(url, *, params=None, headers=None, operation=None):
+    async def fake_request_get(url, *, params=None, headers=None, operation=None):
         calls.append(("GET", url, params, operation))
         return DummyResponse({"data": [{"id": "20001", "name": "Dynamic Power Limit", "value": "4.0"}]})
 
-    coordinator._request_get = fake_request_get
+    coordinator._async_request_get = fake_request_get
 
-    coordinator.fetch_wallbox_config_probe()
+    asyncio.run(coordinator.async_fetch_wallbox_config_probe())
 
     assert coordinator.config_signal_values == {"20001": 4.0}
     assert [call[3] for call in calls] == [
@@ -441,7 +1423,7 @@ def test_fetch_wallbox_config_probe_uses_dn_get_shape():
     ]
 
 
-def test_extract_config_signal_catalog_collects_writable_metadata():
+def test_walk_signal_payload_collects_writable_config_metadata():
     coordinator = build_coordinator()
 
     payload = {
@@ -470,7 +1452,7 @@ def test_extract_config_signal_catalog_collects_writable_metadata():
         ]
     }
 
-    result = coordinator._extract_config_signal_catalog(payload)
+    result = coordinator._walk_signal_payload(payload, config_catalog=True)["config_catalog"]
 
     assert result == [
         {
@@ -506,7 +1488,7 @@ def test_extract_config_signal_catalog_collects_writable_metadata():
     ]
 
 
-def test_extract_signal_values_collects_common_signal_shapes():
+def test_walk_signal_payload_collects_common_signal_shapes():
     coordinator = build_coordinator()
 
     payload = {
@@ -521,7 +1503,7 @@ def test_extract_signal_values_collects_common_signal_shapes():
         }
     }
 
-    result = coordinator._extract_signal_values(payload)
+    result = coordinator._walk_signal_payload(payload)["values"]
 
     assert result == {
         "20012": "40",
@@ -532,7 +1514,7 @@ def test_extract_signal_values_collects_common_signal_shapes():
     }
 
 
-def test_extract_signal_catalog_collects_group_name_and_unit():
+def test_walk_signal_payload_collects_group_name_and_unit():
     coordinator = build_coordinator()
 
     payload = {
@@ -547,7 +1529,7 @@ def test_extract_signal_catalog_collects_group_name_and_unit():
         ]
     }
 
-    result = coordinator._extract_signal_catalog(payload)
+    result = coordinator._walk_signal_payload(payload)["catalog"]
 
     assert result == [
         {
@@ -565,6 +1547,69 @@ def test_extract_signal_catalog_collects_group_name_and_unit():
     ]
 
 
+def test_walk_signal_payload_collects_values_catalog_and_ids_in_one_pass():
+    coordinator = build_coordinator()
+
+    payload = {
+        "data": [
+            {
+                "groupName": "Basic",
+                "paramValues": {"20012": "30"},
+                "signals": [
+                    {"id": "20012", "name": "Power", "unit": "kW", "value": "40"},
+                    {"signalId": "10008", "name": "Energy", "unit": "kWh", "realValue": "1.5"},
+                ],
+            },
+            {"groupName": "Other", "signals": [{"id": "10003", "name": "Rated"}]},
+        ]
+    }
+
+    result = coordinator._walk_signal_payload(payload, config_catalog=True)
+
+    assert result["values"] == {"20012": "40", "10008": "1.5"}
+    assert [(item["id"], item["group"]) for item in result["catalog"]] == [
+        ("20012", "Basic"),
+        ("10008", "Basic"),
+        ("10003", "Other"),
+    ]
+    assert result["ids"] == {"20012", "10008", "10003"}
+    assert [item["id"] for item in result["config_catalog"]] == ["20012", "10008", "10003"]
+    assert coordinator._walk_signal_payload(payload)["config_catalog"] is None
+
+
+def test_decode_signal_payload_learns_shape_and_counts_fallbacks():
+    coordinator = build_coordinator()
+    payload = {"data": {"signals": [{"id": "20012", "name": "Power", "value": "40"}]}}
+
+    first = coordinator._decode_signal_payload("wallbox-realtime", payload)
+    assert "wallbox-realtime" in coordinator._response_shapes
+
+    coordinator._walk_signal_payload = lambda payload: pytest.fail("generic walker used")
+    second = coordinator._decode_signal_payload("wallbox-realtime", payload)
+    assert second["values"] == first["values"] == {"20012": "40"}
+    assert second["catalog"] == first["catalog"]
+    assert coordinator.schema_fallbacks == {}
+
+    del coordinator._walk_signal_payload
+    changed = {"data": {"paramValues": {"20012": "41"}}}
+    assert coordinator._decode_signal_payload("wallbox-realtime", changed)["values"] == {"20012": "41"}
+    assert coordinator.schema_fallbacks == {"wallbox-realtime": 1}
+
+
+def test_walk_signal_payload_stops_at_depth_guard():
+    coordinator = build_coordinator()
+
+    payload = {"id": "20012", "value": "40"}
+    for _ in range(5000):
+        payload = {"child": [payload]}
+    payload["signals"] = [{"id": "10008", "name": "Energy"}]
+
+    result = coordinator._walk_signal_payload(payload)
+
+    assert result["values"] == {}
+    assert [item["id"] for item in result["catalog"]] == ["10008"]
+
+
 def test_history_probe_signal_ids_prefers_known_and_realtime_registers():
     coordinator = build_coordinator()
 
@@ -579,13 +1624,13 @@ def test_fetch_wallbox_history_probe_marks_completed(monkeypatch):
     coordinator.wallbox_dn = "NE=168363665"
     calls = []
 
-    def fake_request_get(url, *, params=None, headers=None, operation=None):
+    async def fake_request_get(url, *, params=None, headers=None, operation=None):
         calls.append((url, params, operation))
         return DummyResponse({"data": [{"signalId": "10008"}]})
 
-    coordinator._request_get = fake_request_get
+    coordinator._async_request_get = fake_request_get
 
-    coordinator.fetch_wallbox_history_probe(["10008", "10012"])
+    asyncio.run(coordinator.async_fetch_wallbox_history_probe(["10008", "10012"]))
 
     assert coordinator._history_probe_completed is True
     assert calls
@@ -601,14 +1646,14 @@ def test_set_config_value_success(monkeypatch):
     coordinator.data = {"20001": 2.5}
     calls = []
 
-    def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
         calls.append((url, json, data, headers))
         return DummyResponse({}, status_code=200)
 
-    coordinator._request_post = fake_request_post
+    coordinator._async_request_post = fake_request_post
     coordinator._json_or_error = lambda response, context, default=None: {}
 
-    result = coordinator.set_config_value("20001", 3.2)
+    result = asyncio.run(coordinator.async_set_config_value("20001", 3.2))
 
     assert result is True
     assert len(calls) == 1
@@ -619,9 +1664,11 @@ def test_set_config_value_success(monkeypatch):
     assert payload_data["changeValues"] == '[{"id":"20001","value":"3.2"}]'
     assert headers is not coordinator.headers  # copy made
     assert headers["Content-Type"] == "application/x-www-form-urlencoded"
-    assert coordinator._scheduled_calls
+    assert coordinator._scheduled_calls == []
+    assert coordinator._notifications == [True]
     assert coordinator.param_values["20001"] == 3.2
     assert coordinator.config_signal_values["20001"] == 3.2
+    assert coordinator._write_boost_until > time.monotonic()
 
 
 def test_set_config_value_rejects_error_payloads():
@@ -631,14 +1678,14 @@ def test_set_config_value_rejects_error_payloads():
 
     monkeypatch = pytest.MonkeyPatch()
     monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.time.sleep",
-        lambda delay: sleep_calls.append(delay),
+        "custom_components.huawei_charger.coordinator.asyncio.sleep",
+        record_sleeps(sleep_calls),
     )
 
-    coordinator._request_post = lambda *args, **kwargs: DummyResponse({}, status_code=200)
+    coordinator._async_request_post = async_return(DummyResponse({}, status_code=200))
     coordinator._json_or_error = lambda response, context, default=None: {"errorCode": "9"}
 
-    result = coordinator.set_config_value("20001", 3.2)
+    result = asyncio.run(coordinator.async_set_config_value("20001", 3.2))
 
     monkeypatch.undo()
 
@@ -654,18 +1701,18 @@ def test_set_config_value_returns_error_when_new_endpoint_fails():
 
     monkeypatch = pytest.MonkeyPatch()
     monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.time.sleep",
-        lambda delay: sleep_calls.append(delay),
+        "custom_components.huawei_charger.coordinator.asyncio.sleep",
+        record_sleeps(sleep_calls),
     )
 
-    def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
         calls.append((url, json, data, operation))
         raise FusionSolarRequestError("new endpoint failed")
 
-    coordinator._request_post = fake_request_post
+    coordinator._async_request_post = fake_request_post
     coordinator._json_or_error = lambda response, context, default=None: {}
 
-    result = coordinator.set_config_value("20001", 3.2)
+    result = asyncio.run(coordinator.async_set_config_value("20001", 3.2))
 
     monkeypatch.undo()
 
@@ -685,33 +1732,33 @@ def test_set_config_value_reauth_flow(monkeypatch):
     post_calls = []
 
     monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.time.sleep",
-        lambda delay: sleep_calls.append(delay),
+        "custom_components.huawei_charger.coordinator.asyncio.sleep",
+        record_sleeps(sleep_calls),
     )
 
-    def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
         post_calls.append((url, json, data))
         if len(post_calls) == 1:
             raise AuthenticationFailed("expired")
         return DummyResponse({}, status_code=200)
 
-    coordinator._request_post = fake_request_post
+    coordinator._async_request_post = fake_request_post
     coordinator._json_or_error = lambda response, context, default=None: {}
 
-    def fake_authenticate():
+    async def fake_authenticate():
         coordinator.region_ip = "5.6.7.8"
         coordinator.wallbox_dn = "NE=168363665"
         coordinator.wallbox_dn_id = "wallbox"
         coordinator.headers = {"Auth": "token"}
 
-    coordinator.authenticate = fake_authenticate
+    coordinator.async_authenticate = fake_authenticate
 
     coordinator.token = "expired"
     coordinator.headers = {"Auth": "old"}
     coordinator.region_ip = "stale"
     coordinator.wallbox_dn_id = "stale"
 
-    result = coordinator.set_config_value("20001", 2.5)
+    result = asyncio.run(coordinator.async_set_config_value("20001", 2.5))
 
     assert result is True
     assert sleep_calls == [1]
@@ -729,25 +1776,25 @@ def test_set_config_value_recovers_wallbox_context_after_reauth(monkeypatch):
     fetch_calls = []
 
     monkeypatch.setattr(
-        "custom_components.huawei_charger.coordinator.time.sleep",
-        lambda delay: sleep_calls.append(delay),
+        "custom_components.huawei_charger.coordinator.asyncio.sleep",
+        record_sleeps(sleep_calls),
     )
 
-    def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
+    async def fake_request_post(url, *, json=None, data=None, headers=None, operation=None):
         post_calls.append((url, json, data))
         if len(post_calls) == 1:
             raise AuthenticationFailed("expired")
         return DummyResponse({}, status_code=200)
 
-    coordinator._request_post = fake_request_post
+    coordinator._async_request_post = fake_request_post
     coordinator._json_or_error = lambda response, context, default=None: {}
 
-    def fake_authenticate():
+    async def fake_authenticate():
         coordinator.region_ip = "5.6.7.8"
         coordinator.headers = {"Auth": "token"}
         coordinator.dn_id = "station"
 
-    def fake_fetch_wallbox_info():
+    async def fake_fetch_wallbox_info():
         fetch_calls.append(True)
         coordinator.wallbox_dn = "NE=wallbox-restored"
         coordinator.wallbox_dn_id = "wallbox-restored"
@@ -755,15 +1802,15 @@ def test_set_config_value_recovers_wallbox_context_after_reauth(monkeypatch):
         coordinator._update_register_debug_state()
         return coordinator.param_values
 
-    coordinator.authenticate = fake_authenticate
-    coordinator.fetch_wallbox_info = fake_fetch_wallbox_info
+    coordinator.async_authenticate = fake_authenticate
+    coordinator.async_fetch_wallbox_info = fake_fetch_wallbox_info
 
     coordinator.token = "expired"
     coordinator.headers = {"Auth": "old"}
     coordinator.region_ip = "stale"
     coordinator.wallbox_dn_id = "stale"
 
-    result = coordinator.set_config_value("20001", 2.5)
+    result = asyncio.run(coordinator.async_set_config_value("20001", 2.5))
 
     assert result is True
     assert sleep_calls == [1]
@@ -773,6 +1820,50 @@ def test_set_config_value_recovers_wallbox_context_after_reauth(monkeypatch):
     assert post_calls[1][2]["dn"] == "NE=wallbox-restored"
 
 
+def test_track_register_changes_reports_only_moved_registers():
+    coordinator = build_coordinator()
+    coordinator.param_values = {"10009": 1.5, "538976516": "192.168.1.2", "20017": 1}
+    coordinator.config_signal_values = {"20001": 7.4}
+    coordinator.additional_wallboxes = {"NE=garage": {"values": {"10009": 0.2}}}
+
+    first = coordinator._track_register_changes()
+    first_generation = coordinator.data_generation
+
+    coordinator.param_values = {"10009": 1.8, "538976516": "192.168.1.2", "20017": True}
+    coordinator.additional_wallboxes = {"NE=garage": {"values": {"10009": 0.2}}}
+    second = coordinator._track_register_changes()
+
+    assert len(first) == 5
+    assert second == {(None, "10009"), (None, "20017")}
+    assert coordinator.registers_changed_since(first_generation, ["10009"])
+    assert not coordinator.registers_changed_since(first_generation, ["538976516", "20001"])
+    assert not coordinator.registers_changed_since(first_generation, ["10009"], "NE=garage")
+
+    assert coordinator._track_register_changes() == set()
+    assert coordinator.data_generation == first_generation + 1
+
+
+def test_take_new_register_keys_reports_appeared_registers_once():
+    coordinator = build_coordinator()
+    coordinator.param_values = {"10009": 1.5}
+    coordinator._track_register_changes()
+    assert coordinator.take_new_register_keys() == {(None, "10009")}
+
+    coordinator.param_values = {"10009": 1.8}
+    coordinator._track_register_changes()
+    assert coordinator.take_new_register_keys() == ()
+
+    coordinator.param_values = {"10009": 1.8, "10010": 12}
+    coordinator.additional_wallboxes = {"NE=garage": {"values": {"10009": 0.2}}}
+    coordinator._track_register_changes()
+    coordinator.param_values = {"10009": 2.0, "10010": 13}
+    coordinator._track_register_changes()
+
+    # Registers that appeared in cycles nobody consumed are kept until the next call.
+    assert coordinator.take_new_register_keys() == {(None, "10010"), ("NE=garage", "10009")}
+    assert coordinator.take_new_register_keys() == ()
+
+
 def test_update_register_debug_state_tracks_writable_registers():
     coordinator = build_coordinator()
     coordinator.param_values = {"20001": 2.5, "10009": 1.2}
@@ -795,10 +1886,10 @@ def test_record_update_debug_schedules_coordinator_update():
         duration_ms=123,
     )
 
-    assert coordinator._scheduled_calls
+    assert len(coordinator._scheduled_calls) == 1
     callback, args = coordinator._scheduled_calls[-1]
-    assert callback == coordinator.async_set_updated_data
-    assert args == (coordinator.data,)
+    assert callback == coordinator._flush_debug_state_push
+    assert args == ()
 
 
 def test_record_write_debug_schedules_coordinator_update():
@@ -813,10 +1904,94 @@ def test_record_write_debug_schedules_coordinator_update():
         attempts=1,
     )
 
-    assert coordinator._scheduled_calls
+    assert len(coordinator._scheduled_calls) == 1
     callback, args = coordinator._scheduled_calls[-1]
-    assert callback == coordinator.async_set_updated_data
-    assert args == (coordinator.data,)
+    assert callback == coordinator._flush_debug_state_push
+
+    coordinator._update_register_debug_state()
+    assert len(coordinator._scheduled_calls) == 1
+
+    callback()
+    assert coordinator._notifications == [True]
+    assert coordinator._debug_push_handle is None
+
+
+def test_failed_write_publishes_debug_state_once(monkeypatch):
+    coordinator = build_coordinator()
+    monkeypatch.setattr(
+        "custom_components.huawei_charger.coordinator.asyncio.sleep", record_sleeps([])
+    )
+
+    async def failing_post(url, *, json=None, data=None, headers=None, operation=None):
+        raise FusionSolarRequestError("write rejected")
+
+    coordinator._async_request_post = failing_post
+
+    result = asyncio.run(coordinator.async_set_config_value("20001", 3.2, retries=3))
+
+    assert result is False
+    assert coordinator.debug_data["last_write_status"] == "error"
+    assert coordinator._scheduled_calls == []
+    assert coordinator._notifications == [True]
+
+
+def test_write_overlapping_a_cycle_publishes_when_the_write_ends(monkeypatch):
+    coordinator = build_coordinator()
+    monkeypatch.setattr(
+        "custom_components.huawei_charger.coordinator.asyncio.sleep", record_sleeps([])
+    )
+
+    async def failing_post(url, *, json=None, data=None, headers=None, operation=None):
+        raise FusionSolarRequestError("write rejected")
+
+    coordinator._async_request_post = failing_post
+    published_during_cycle = []
+
+    async def run():
+        cycle_waiting = asyncio.Event()
+        write_done = asyncio.Event()
+
+        async def slow_refresh():
+            # Held back by the cycle's own batch.
+            coordinator._update_register_debug_state()
+            cycle_waiting.set()
+            await write_done.wait()
+            published_during_cycle.extend(coordinator._notifications)
+
+        coordinator._async_refresh_device_data = slow_refresh
+        cycle = asyncio.ensure_future(coordinator._async_update_data())
+        await cycle_waiting.wait()
+        # A service call writes from its own task while the cycle is still running.
+        await coordinator.async_set_config_value("20001", 3.2, retries=1)
+        write_done.set()
+        await cycle
+
+    asyncio.run(run())
+
+    assert published_during_cycle == [True]
+    assert coordinator._scheduled_calls == []
+    assert coordinator._notifications == [True]
+
+
+@pytest.mark.parametrize("previous_success, expected_notifications", [(True, []), (False, [True])])
+def test_failed_update_cycle_publishes_debug_state_once(monkeypatch, previous_success, expected_notifications):
+    coordinator = build_coordinator()
+    coordinator.last_update_success = previous_success
+    coordinator._reset_auth_state = lambda: None
+    monkeypatch.setattr(
+        "custom_components.huawei_charger.coordinator.asyncio.sleep", record_sleeps([])
+    )
+
+    async def failing_refresh():
+        raise UpdateFailed("cloud down")
+
+    coordinator._async_refresh_device_data = failing_refresh
+
+    with pytest.raises(UpdateFailed):
+        asyncio.run(coordinator._async_update_data())
+
+    assert coordinator._scheduled_calls == []
+    assert coordinator._notifications == expected_notifications
 
 
 def test_clear_register_debug_state_resets_snapshot():
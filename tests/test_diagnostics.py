@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.huawei_charger.const import DOMAIN
+from custom_components.huawei_charger.coordinator import HuaweiChargerCoordinator
+from custom_components.huawei_charger.diagnostics import async_get_config_entry_diagnostics
+
+
+def test_diagnostics_redact_credentials_and_sensitive_registers():
+    entry = SimpleNamespace(
+        entry_id="entry-1",
+        data={"username": "user@example.com", "password": "secret", "host": "intl.fusionsolar.huawei.com"},
+        options={"update_interval": 30},
+    )
+    coordinator = SimpleNamespace(
+        diagnostics_snapshot=lambda: {
+            "state": {"region_ip": "1.2.3.4", "wallbox_dn": "NE=1"},
+            "debug": {"available_registers": ["10009", "20034"]},
+            "registers": {"10009": 1.5, "20034": "pin"},
+            "responses": {"wallbox-realtime": [{"status": 200, "body": {"data": {}}}]},
+        }
+    )
+    hass = SimpleNamespace(data={DOMAIN: {"entry-1": coordinator}})
+
+    result = asyncio.run(async_get_config_entry_diagnostics(hass, entry))
+
+    assert result["entry"]["data"]["password"] == "**REDACTED**"
+    assert result["entry"]["data"]["username"] == "**REDACTED**"
+    assert result["entry"]["options"] == {"update_interval": 30}
+    assert result["state"] == {"region_ip": "**REDACTED**", "wallbox_dn": "NE=1"}
+    assert result["registers"] == {"10009": 1.5, "20034": "**REDACTED**"}
+    assert result["debug"]["available_registers"] == ["10009", "20034"]
+    assert result["responses"]["wallbox-realtime"][0]["status"] == 200
+
+
+def test_diagnostics_keep_signal_values_and_redact_response_tokens():
+    entry = SimpleNamespace(entry_id="entry-1", data={}, options={})
+    coordinator = object.__new__(HuaweiChargerCoordinator)
+    response = SimpleNamespace(
+        json=lambda: {
+            "data": {"signals": [{"id": "10009", "name": "Energy", "value": "1.5"}]},
+            "accessToken": "secret",
+            "roaRand": "csrf",
+        },
+        text="",
+    )
+    coordinator.diagnostics_snapshot = lambda: {
+        "responses": {"wallbox-realtime": [{"status": 200, "body": coordinator._diagnostic_body(response)}]}
+    }
+    hass = SimpleNamespace(data={DOMAIN: {"entry-1": coordinator}})
+
+    result = asyncio.run(async_get_config_entry_diagnostics(hass, entry))
+
+    body = result["responses"]["wallbox-realtime"][0]["body"]
+    assert body["data"]["signals"][0]["value"] == "1.5"
+    assert body["accessToken"] == "***"
+    assert body["roaRand"] == "***"
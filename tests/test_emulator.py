@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from benchmarks.fusionsolar_emulator import FusionSolarEmulator, stub_hass
+from custom_components.huawei_charger.const import CONF_WALLBOX_DN
+from custom_components.huawei_charger.coordinator import UpdateFailed
+
+_real_sleep = asyncio.sleep
+
+
+def test_coordinator_runs_full_cycle_against_emulator():
+    async def run():
+        async with FusionSolarEmulator(devices=3, signals=40) as emulator:
+            coordinator = emulator.build_coordinator(stub_hass())
+            values = await coordinator._async_update_data()
+            await coordinator._async_update_data()
+            # A manual refresh right after a poll still reads the device list again.
+            await coordinator._async_update_data()
+            written = await coordinator.async_set_config_value("20001", 3.2)
+            return emulator, coordinator, values, written
+
+    emulator, coordinator, values, written = asyncio.run(run())
+
+    assert values["10003"] == 7.4
+    assert "30032" in values
+    assert len(coordinator.additional_wallboxes) == 2
+    assert written is True
+    assert coordinator.get_register_value("20001") == 3.2
+    assert emulator.requests["token"] == 1
+    assert emulator.requests["station-list"] == 1
+    # Every cycle reads the device list once, shared by the primary and the other wallboxes.
+    assert emulator.requests["device-list"] == 3
+    # Three cycles of realtime reads for three wallboxes.
+    assert emulator.requests["device-realtime-data"] == 9
+
+
+def test_pinned_entry_reads_only_its_own_device_record_between_refreshes():
+    async def run():
+        async with FusionSolarEmulator(devices=3, signals=40) as emulator:
+            coordinator = emulator.build_coordinator(
+                stub_hass(), options={CONF_WALLBOX_DN: "NE=100002"}
+            )
+            await coordinator._async_update_data()
+            values = await coordinator._async_update_data()
+            return emulator, coordinator, values
+
+    emulator, coordinator, values = asyncio.run(run())
+
+    assert coordinator.wallbox_dn == "NE=100002"
+    assert "device_status" in values
+    # The second cycle got its own wallbox back from the dn-filtered read, without a topology refresh.
+    assert coordinator._device_list_filtered is True
+    assert emulator.requests["device-list"] == 2
+    assert emulator.requests["get-config-signals"] == 1
+
+
+def test_coordinator_logs_in_again_after_emulated_token_expiry(monkeypatch):
+    monkeypatch.setattr(
+        "custom_components.huawei_charger.coordinator.asyncio.sleep",
+        lambda delay: _real_sleep(0),
+    )
+
+    async def run():
+        async with FusionSolarEmulator() as emulator:
+            coordinator = emulator.build_coordinator(stub_hass())
+            await coordinator._async_update_data()
+            emulator.expire_tokens()
+            await coordinator._async_update_data()
+            return emulator
+
+    emulator = asyncio.run(run())
+
+    assert emulator.requests["token"] == 2
+    assert emulator.errors["device-realtime-data"] == 1
+
+
+def test_emulator_error_rate_surfaces_as_update_failure(monkeypatch):
+    monkeypatch.setattr(
+        "custom_components.huawei_charger.coordinator.asyncio.sleep",
+        lambda delay: _real_sleep(0),
+    )
+
+    async def run():
+        async with FusionSolarEmulator(error_rate=1.0) as emulator:
+            coordinator = emulator.build_coordinator(stub_hass())
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+            return coordinator
+
+    coordinator = asyncio.run(run())
+
+    assert coordinator.request_metrics["station-list"].errors == 3
@@ -0,0 +1,124 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from custom_components.huawei_charger.const import DOMAIN
+from custom_components.huawei_charger.hub import (
+    ACCOUNT_HUBS,
+    FusionSolarAccountHub,
+    async_get_account_hub,
+    async_release_account_hub,
+)
+
+
+def test_account_hub_is_shared_until_last_entry_is_released():
+    hass = SimpleNamespace(data={})
+
+    first = async_get_account_hub(hass, "user@host", "entry-1")
+    second = async_get_account_hub(hass, "user@host", "entry-2")
+    other = async_get_account_hub(hass, "other@host", "entry-3")
+
+    assert first is second
+    assert other is not first
+
+    async_release_account_hub(hass, first, "entry-1")
+    assert hass.data[DOMAIN][ACCOUNT_HUBS]["user@host"] is first
+
+    async_release_account_hub(hass, first, "entry-2")
+    async_release_account_hub(hass, other, "entry-3")
+    assert ACCOUNT_HUBS not in hass.data[DOMAIN]
+
+
+def test_account_hub_tracks_wallboxes_pinned_by_other_entries():
+    hass = SimpleNamespace(data={})
+
+    hub = async_get_account_hub(hass, "user@host", "entry-1", "NE=garage")
+    async_get_account_hub(hass, "user@host", "entry-2")
+
+    assert hub.claimed_wallboxes("entry-1") == set()
+    assert hub.claimed_wallboxes("entry-2") == {"NE=garage"}
+
+    async_release_account_hub(hass, hub, "entry-1")
+    assert hub.claimed_wallboxes("entry-2") == set()
+
+
+def test_account_hub_reuses_device_list_within_share_window():
+    hub = FusionSolarAccountHub("user@host", share_window=60)
+    calls = []
+
+    async def fetch():
+        calls.append(True)
+        return [{"dn": "NE=1"}]
+
+    async def run():
+        first = await hub.async_device_list("NE=station", fetch, ("entry-1", 1))
+        same_cycle = await hub.async_device_list("NE=station", fetch, ("entry-1", 1))
+        other_entry = await hub.async_device_list("NE=station", fetch, ("entry-2", 7))
+        await hub.async_device_list("NE=other-station", fetch, ("entry-1", 1))
+        return first, same_cycle, other_entry
+
+    first, same_cycle, other_entry = asyncio.run(run())
+
+    assert first is same_cycle is other_entry
+    assert len(calls) == 2
+
+
+def test_account_hub_next_cycle_of_same_entry_reads_again():
+    hub = FusionSolarAccountHub("user@host", share_window=60)
+    calls = []
+
+    async def fetch():
+        calls.append(True)
+        return [{"dn": "NE=1", "deviceStatus": len(calls)}]
+
+    async def run():
+        await hub.async_device_list("NE=station", fetch, ("entry-1", 1))
+        return await hub.async_device_list("NE=station", fetch, ("entry-1", 2))
+
+    records = asyncio.run(run())
+
+    assert len(calls) == 2
+    assert records[0]["deviceStatus"] == 2
+
+
+def test_account_hub_refetches_after_share_window():
+    hub = FusionSolarAccountHub("user@host", share_window=0)
+    calls = []
+
+    async def fetch():
+        calls.append(True)
+        return []
+
+    async def run():
+        await hub.async_station_list("1.2.3.4", fetch, ("entry-1", 1))
+        await hub.async_station_list("1.2.3.4", fetch, ("entry-2", 1))
+
+    asyncio.run(run())
+
+    assert len(calls) == 2
+
+
+def test_account_hub_login_publishes_session_and_drops_cached_reads():
+    hub = FusionSolarAccountHub("user@host", share_window=60)
+    hub._responses[("device-list", "NE=station")] = (time.monotonic(), ("entry-1", 1), [])
+
+    async def login():
+        return {"token": "token", "region_ip": "1.2.3.4", "expires_at": time.time() + 60}
+
+    session = asyncio.run(hub.async_login(login))
+
+    assert hub.current_session() == session
+    assert hub._responses == {}
+
+    hub.discard_session("other-token")
+    assert hub.current_session() == session
+
+    hub.discard_session("token")
+    assert hub.current_session() is None
+
+
+def test_account_hub_expires_session():
+    hub = FusionSolarAccountHub("user@host")
+    hub.publish_session({"token": "token", "region_ip": "1.2.3.4", "expires_at": time.time() - 1})
+
+    assert hub.current_session() is None
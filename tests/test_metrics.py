@@ -0,0 +1,45 @@
+from custom_components.huawei_charger.metrics import CycleTrace, EndpointMetrics
+
+
+def test_endpoint_metrics_counts_and_buckets_latency():
+    metrics = EndpointMetrics()
+    for duration_ms in [40] * 90 + [700] * 9 + [30000]:
+        metrics.record(duration_ms)
+    metrics.record(120, error=True)
+
+    assert metrics.count == 101
+    assert metrics.errors == 1
+    assert metrics.quantile(0.5) == 50
+    assert metrics.quantile(0.95) == 1000
+    assert metrics.quantile(0.999) == 30000
+    assert metrics.as_dict()["max_ms"] == 30000
+
+
+def test_endpoint_metrics_without_samples():
+    metrics = EndpointMetrics()
+
+    assert metrics.quantile(0.95) is None
+    assert metrics.as_dict() == {
+        "count": 0,
+        "errors": 0,
+        "p50_ms": None,
+        "p95_ms": None,
+        "p99_ms": None,
+        "max_ms": None,
+    }
+
+
+def test_cycle_trace_counts_overlapping_intervals_once():
+    trace = CycleTrace("2026-01-01T00:00:00Z", 10.0)
+    # Two concurrent realtime requests and a device-list request overlapping the second.
+    trace.add("realtime", 10.0, 10.1)
+    trace.add("realtime", 10.0, 10.1)
+    trace.add("device-list", 10.05, 10.15)
+    trace.add("normalization", 10.2, 10.21)
+    trace.add("publish", 10.25, 10.3)
+    trace.duration_ms = 250
+
+    result = trace.as_dict()
+
+    assert result["spans_ms"] == {"realtime": 100, "device-list": 100, "normalization": 10, "publish": 50}
+    assert result["unattributed_ms"] == 250 - 160
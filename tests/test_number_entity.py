@@ -21,7 +21,7 @@ class DummyCoordinator:
         self.config_signal_details = {}
         self.config_signal_values = {}
 
-    def set_config_value(self, reg_id, value):
+    async def async_set_config_value(self, reg_id, value):
         self.set_calls.append((reg_id, value))
         return True
 
@@ -122,6 +122,30 @@ def test_async_set_native_value_debounced(monkeypatch):
     asyncio.run(run())
 
 
+def test_number_writes_state_only_when_its_registers_or_limits_change():
+    coordinator = DummyCoordinator({"538976570": 7.4})
+    coordinator.data_generation = 1
+    coordinator.changed = set()
+    coordinator.registers_changed_since = (
+        lambda generation, reg_ids, wallbox_dn=None: bool(coordinator.changed.intersection(reg_ids))
+    )
+    number = HuaweiChargerNumber(coordinator, REG_FIXED_MAX_POWER)
+    writes = []
+    number.async_write_ha_state = lambda: writes.append(number.native_max_value)
+
+    number._handle_coordinator_update()
+    number._handle_coordinator_update()
+    assert writes == [7.4]
+
+    coordinator.data["538976570"] = 11.0
+    number._handle_coordinator_update()
+    assert writes == [7.4, 11.0]
+
+    coordinator.changed = {REG_FIXED_MAX_POWER}
+    number._handle_coordinator_update()
+    assert len(writes) == 3
+
+
 def test_number_stays_available_with_cached_value():
     coordinator = DummyCoordinator(last_update_success=False)
     coordinator.config_signal_values = {REG_FIXED_MAX_POWER: 7.4}
@@ -141,9 +141,10 @@ def test_register_custom_cards_supports_lovelace_object_data(tmp_path, monkeypat
     assert len(resources.created) == len(huawei_init.CUSTOM_CARDS) - 1
 
 
-def test_remove_legacy_platform_entities(monkeypatch):
+def test_reconcile_entity_registry_removes_stale_entries_in_one_pass(monkeypatch):
     registry = SimpleNamespace(async_remove=MagicMock())
     entry = SimpleNamespace(entry_id="entry-1")
+    coordinator = SimpleNamespace(data={"10008": 1.2}, config_signal_values={}, additional_wallboxes={})
     registry_entries = [
         SimpleNamespace(
             domain="button",
@@ -165,6 +166,31 @@ def test_remove_legacy_platform_entities(monkeypatch):
             unique_id="entry-1_sensor_10008",
             entity_id="sensor.huawei_charger_total_energy",
         ),
+        SimpleNamespace(
+            domain="sensor",
+            unique_id="entry-1_sensor_99999",
+            entity_id="sensor.huawei_charger_register_99999",
+        ),
+        SimpleNamespace(
+            domain="sensor",
+            unique_id="entry-1_debug_update",
+            entity_id="sensor.huawei_charger_debug_update_status",
+        ),
+        SimpleNamespace(
+            domain="binary_sensor",
+            unique_id="entry-1_credentials_rejected",
+            entity_id="binary_sensor.huawei_charger_credentials_rejected",
+        ),
+        SimpleNamespace(
+            domain="binary_sensor",
+            unique_id="entry-1_reauthentication_required",
+            entity_id="binary_sensor.huawei_charger_reauthentication_required",
+        ),
+        SimpleNamespace(
+            domain="number",
+            unique_id="entry-1_20001",
+            entity_id="number.huawei_charger_dynamic_power_limit",
+        ),
     ]
 
     monkeypatch.setattr(huawei_init.er, "async_get", lambda hass: registry)
@@ -175,11 +201,13 @@ def test_remove_legacy_platform_entities(monkeypatch):
     )
 
     asyncio.run(
-        huawei_init._async_remove_legacy_platform_entities(SimpleNamespace(), entry)
+        huawei_init._async_reconcile_entity_registry(SimpleNamespace(), entry, coordinator)
     )
 
     assert registry.async_remove.call_args_list == [
         call("button.huawei_charger_start_charging"),
         call("button.huawei_charger_stop_charging"),
         call("switch.huawei_charger_charging"),
+        call("sensor.huawei_charger_register_99999"),
+        call("binary_sensor.huawei_charger_credentials_rejected"),
     ]
@@ -0,0 +1,62 @@
+from custom_components.huawei_charger.schema import (
+    decode_signal_shape,
+    learn_signal_shape,
+)
+
+
+REALTIME_PAYLOAD = {
+    "success": True,
+    "data": [
+        {
+            "groupName": "Basic",
+            "signals": [
+                {"id": 10008, "name": "Energy", "unit": "kWh", "value": "12.5"},
+                {"id": 20012, "name": "Power", "unit": "kW", "value": "7.4"},
+            ],
+        },
+        {"groupName": "Status", "signals": [{"id": 20017, "name": "Plugged", "value": "1"}]},
+    ],
+}
+
+
+def test_learn_signal_shape_finds_realtime_record_path():
+    shape = learn_signal_shape(REALTIME_PAYLOAD)
+
+    assert shape.path == ("data", None, "signals", None)
+    assert shape.id_key == "id"
+    assert shape.value_key == "value"
+
+
+def test_decode_signal_shape_reads_records_directly():
+    shape = learn_signal_shape(REALTIME_PAYLOAD)
+
+    decoded = decode_signal_shape(shape, REALTIME_PAYLOAD)
+
+    assert decoded["values"] == {"10008": "12.5", "20012": "7.4", "20017": "1"}
+    assert decoded["ids"] == {"10008", "20012", "20017"}
+    assert [(item["id"], item["group"]) for item in decoded["catalog"]] == [
+        ("10008", "Basic"),
+        ("20012", "Basic"),
+        ("20017", "Status"),
+    ]
+
+
+def test_decode_signal_shape_rejects_changed_shapes():
+    shape = learn_signal_shape(REALTIME_PAYLOAD)
+
+    assert decode_signal_shape(shape, {"data": {"signals": []}}) is None
+    assert decode_signal_shape(shape, {"data": [], "paramValues": {"10008": "1"}}) is None
+    assert (
+        decode_signal_shape(shape, {"data": [{"signals": [{"signalId": 10008, "value": "1"}]}]})
+        is None
+    )
+    assert (
+        decode_signal_shape(shape, {"data": [{"signals": [{"id": 10008, "value": {"raw": "1"}}]}]})
+        is None
+    )
+
+
+def test_learn_signal_shape_skips_mixed_record_keys():
+    payload = {"data": [{"id": "1", "value": "a"}, {"id": "2", "realValue": "b"}]}
+
+    assert learn_signal_shape(payload) is None
@@ -1,6 +1,5 @@
 import asyncio
 from types import SimpleNamespace
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -10,8 +9,10 @@ from custom_components.huawei_charger.binary_sensor import (
     HuaweiChargerCredentialsRejectedBinarySensor,
 )
 from custom_components.huawei_charger.const import DOMAIN
+from custom_components.huawei_charger.metrics import EndpointMetrics
 from custom_components.huawei_charger.sensor import (
     HuaweiChargerDebugSensor,
+    HuaweiChargerRequestMetricSensor,
     HuaweiChargerSensor,
     _active_sensor_registers,
 )
@@ -114,6 +115,57 @@ def test_device_info_sensor_extracts_summary():
     assert sensor.native_value == "SCharger-7KS-S0 - SCharger-7KS-S0 - Huawei"
 
 
+def test_sensor_decodes_each_register_value_once():
+    coordinator = DummyCoordinator({"10009": 1.23456})
+    sensor = HuaweiChargerSensor(coordinator, "10009")
+    decoded = []
+
+    def codec(raw_value):
+        decoded.append(raw_value)
+        return round(raw_value, 3)
+
+    sensor._codec = codec
+
+    assert sensor.native_value == pytest.approx(1.235)
+    assert sensor.native_value == pytest.approx(1.235)
+    assert decoded == [1.23456]
+
+    coordinator.data["10009"] = 2.5
+    assert sensor.native_value == pytest.approx(2.5)
+    assert decoded == [1.23456, 2.5]
+
+
+def test_sensor_reads_register_once_per_data_generation():
+    coordinator = DummyCoordinator({"10009": 1.5})
+    coordinator.compact_attributes = False
+    coordinator.data_generation = 1
+    reads = []
+    coordinator.get_register_value = lambda reg_id: reads.append(reg_id) or coordinator.data.get(reg_id)
+    sensor = HuaweiChargerSensor(coordinator, "10009")
+
+    assert sensor.available is True
+    assert sensor.native_value == pytest.approx(1.5)
+    attributes = sensor.extra_state_attributes
+    assert sensor.extra_state_attributes is attributes
+    assert reads == ["10009"]
+
+    coordinator.data["10009"] = 2.0
+    coordinator.data_generation = 2
+    assert sensor.native_value == pytest.approx(2.0)
+    assert sensor.extra_state_attributes["raw_value"] == 2.0
+    assert reads == ["10009", "10009"]
+
+    coordinator.last_update_success = False
+    assert sensor.extra_state_attributes["stale"] is True
+
+
+def test_sensitive_register_codec_hides_value():
+    coordinator = DummyCoordinator({"20034": "secret"})
+    sensor = HuaweiChargerSensor(coordinator, "20034", is_diagnostic=True)
+
+    assert sensor.native_value is None
+
+
 def test_sensor_availability_requires_value():
     coordinator = DummyCoordinator({"20017": True})
     sensor = HuaweiChargerSensor(coordinator, "20017")
@@ -135,6 +187,7 @@ def test_sensor_stays_available_with_stale_cached_value():
 
 def test_sensor_extra_state_attributes():
     coordinator = DummyCoordinator({"538976598": 7.4})
+    coordinator.compact_attributes = False
     sensor = HuaweiChargerSensor(coordinator, "538976598")
 
     attrs = sensor.extra_state_attributes
@@ -145,6 +198,7 @@ def test_sensor_extra_state_attributes():
 
 def test_sensitive_register_is_masked_and_unavailable():
     coordinator = DummyCoordinator({"20034": "secret"})
+    coordinator.compact_attributes = False
     sensor = HuaweiChargerSensor(coordinator, "20034", is_diagnostic=True)
 
     assert sensor.available is False
@@ -154,6 +208,7 @@ def test_sensitive_register_is_masked_and_unavailable():
 
 def test_debug_update_sensor_attributes():
     coordinator = DummyCoordinator({"20017": True})
+    coordinator.compact_attributes = False
     sensor = HuaweiChargerDebugSensor(coordinator, "update")
 
     assert sensor.native_value == "success"
@@ -165,6 +220,7 @@ def test_debug_update_sensor_attributes():
 
 def test_debug_write_sensor_attributes():
     coordinator = DummyCoordinator({"20017": True})
+    coordinator.compact_attributes = False
     sensor = HuaweiChargerDebugSensor(coordinator, "write")
 
     assert sensor.native_value == "error"
@@ -174,6 +230,47 @@ def test_debug_write_sensor_attributes():
     assert attrs["last_write_response_excerpt"] == "{\"failCode\":403}"
 
 
+def test_update_spans_stay_out_of_the_recorder():
+    coordinator = DummyCoordinator({"538976598": 7.4})
+    coordinator.debug_data["last_update_spans"] = {"status": "success", "spans_ms": {"realtime": 120}}
+    update_sensor = HuaweiChargerDebugSensor(coordinator, "update")
+
+    assert update_sensor.extra_state_attributes["last_update_spans"]["spans_ms"] == {"realtime": 120}
+    assert "last_update_spans" in HuaweiChargerDebugSensor._unrecorded_attributes
+
+
+def test_compact_attributes_leave_bulky_payloads_to_diagnostics():
+    coordinator = DummyCoordinator({"538976598": 7.4})
+    sensor = HuaweiChargerSensor(coordinator, "538976598")
+    update_sensor = HuaweiChargerDebugSensor(coordinator, "update")
+    write_sensor = HuaweiChargerDebugSensor(coordinator, "write")
+
+    assert sensor.extra_state_attributes == {"register_id": "538976598", "stale": False}
+
+    update_attrs = update_sensor.extra_state_attributes
+    assert update_attrs["last_register_count"] == 2
+    assert "last_update_response_excerpt" not in update_attrs
+    assert "available_registers" not in update_attrs
+    assert "last_write_response_excerpt" not in write_sensor.extra_state_attributes
+
+
+def test_request_metric_sensor_reports_p95_latency():
+    coordinator = DummyCoordinator({})
+    metrics = EndpointMetrics()
+    for duration_ms in (80, 90, 400):
+        metrics.record(duration_ms)
+    coordinator.request_metrics = {"wallbox-realtime": metrics}
+
+    sensor = HuaweiChargerRequestMetricSensor(coordinator, "wallbox-realtime")
+    idle_sensor = HuaweiChargerRequestMetricSensor(coordinator, "wallbox-history")
+
+    assert sensor.name == "Request Latency Wallbox Realtime"
+    assert sensor.native_value == 500
+    assert sensor.extra_state_attributes == {"count": 3, "errors": 0, "p50_ms": 100, "p99_ms": 500}
+    assert idle_sensor.native_value is None
+    assert idle_sensor.extra_state_attributes == {"count": 0, "errors": 0}
+
+
 def test_credentials_rejected_binary_sensor_on():
     coordinator = DummyCoordinator({"20017": True})
     coordinator.is_reauth_required = lambda: True
@@ -196,32 +293,21 @@ def test_credentials_rejected_binary_sensor_off():
     assert sensor.is_on is False
 
 
-def test_binary_sensor_setup_removes_legacy_auth_sensor(monkeypatch):
+def test_binary_sensor_stale_filter_flags_legacy_auth_sensor():
+    coordinator = DummyCoordinator({"20017": True})
+    is_stale = binary_sensor.stale_unique_id_filter("test_entry", coordinator)
+
+    assert is_stale("test_entry_credentials_rejected")
+    assert not is_stale("test_entry_reauthentication_required")
+    assert not is_stale("other_entry_credentials_rejected")
+
+
+def test_binary_sensor_setup_adds_reauthentication_sensor():
     coordinator = DummyCoordinator({"20017": True})
     entry = SimpleNamespace(entry_id="test_entry", async_on_unload=lambda callback: None)
-    registry = MagicMock()
-    registry_entries = [
-        SimpleNamespace(
-            domain="binary_sensor",
-            unique_id="test_entry_credentials_rejected",
-            entity_id="binary_sensor.huawei_charger_credentials_rejected",
-        ),
-        SimpleNamespace(
-            domain="binary_sensor",
-            unique_id="test_entry_reauthentication_required",
-            entity_id="binary_sensor.huawei_charger_reauthentication_required",
-        ),
-    ]
     hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: coordinator}})
     added_entities = []
 
-    monkeypatch.setattr(binary_sensor.er, "async_get", lambda hass_arg: registry)
-    monkeypatch.setattr(
-        binary_sensor.er,
-        "async_entries_for_config_entry",
-        lambda registry_arg, entry_id: registry_entries,
-    )
-
     asyncio.run(
         binary_sensor.async_setup_entry(
             hass,
@@ -230,9 +316,6 @@ def test_binary_sensor_setup_removes_legacy_auth_sensor(monkeypatch):
         )
     )
 
-    registry.async_remove.assert_called_once_with(
-        "binary_sensor.huawei_charger_credentials_rejected"
-    )
     assert len(added_entities) == 1
     assert added_entities[0].unique_id == "test_entry_reauthentication_required"
 
@@ -327,42 +410,37 @@ def test_main_breaker_current_sensor_uses_ampere_unit():
     assert sensor.native_value == 40
 
 
-def test_sensor_setup_removes_stale_dynamic_sensor_entries(monkeypatch):
-    coordinator = DummyCoordinator({"device_status": "Connected", "10008": 1.2})
+def test_sensor_stale_filter_flags_missing_and_sensitive_registers():
+    coordinator = DummyCoordinator({"device_status": "Connected", "10008": 1.2, "20034": "secret"})
+    is_stale = sensor_platform.stale_unique_id_filter("test_entry", coordinator)
+
+    assert not is_stale("test_entry_sensor_device_status")
+    assert not is_stale("test_entry_sensor_10008")
+    assert is_stale("test_entry_sensor_99999")
+    assert is_stale("test_entry_sensor_20034")
+    assert not is_stale("test_entry_debug_update")
+    assert not is_stale("other_entry_sensor_99999")
+
+
+def test_sensor_stale_filter_scopes_registers_per_wallbox():
+    coordinator = MultiWallboxCoordinator(
+        {"device_status": "Connected"},
+        {"NE=garage": {"name": "Garage", "values": {"10009": 0.9, "538976598": 7.4}}},
+    )
+    is_stale = sensor_platform.stale_unique_id_filter("test_entry", coordinator)
+
+    assert not is_stale("test_entry_NE=garage_sensor_10009")
+    assert is_stale("test_entry_NE=garage_sensor_538976598")
+    assert is_stale("test_entry_NE=removed_sensor_10009")
+
+
+def test_sensor_setup_uses_param_values_when_coordinator_data_is_none():
+    coordinator = DummyCoordinator(None)
+    coordinator.param_values = {"device_status": "Connected", "10008": 1.2}
     entry = SimpleNamespace(entry_id="test_entry", async_on_unload=lambda callback: None)
-    registry = MagicMock()
-    registry_entries = [
-        SimpleNamespace(
-            domain="sensor",
-            unique_id="test_entry_sensor_device_status",
-            entity_id="sensor.huawei_charger_device_status",
-        ),
-        SimpleNamespace(
-            domain="sensor",
-            unique_id="test_entry_sensor_10008",
-            entity_id="sensor.huawei_charger_total_energy_charged",
-        ),
-        SimpleNamespace(
-            domain="sensor",
-            unique_id="test_entry_sensor_99999",
-            entity_id="sensor.huawei_charger_stale_register",
-        ),
-        SimpleNamespace(
-            domain="sensor",
-            unique_id="test_entry_debug_update",
-            entity_id="sensor.huawei_charger_debug_update_status",
-        ),
-    ]
     hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: coordinator}})
     added_entities = []
 
-    monkeypatch.setattr(sensor_platform.er, "async_get", lambda hass_arg: registry)
-    monkeypatch.setattr(
-        sensor_platform.er,
-        "async_entries_for_config_entry",
-        lambda registry_arg, entry_id: registry_entries,
-    )
-
     asyncio.run(
         sensor_platform.async_setup_entry(
             hass,
@@ -371,25 +449,43 @@ def test_sensor_setup_removes_stale_dynamic_sensor_entries(monkeypatch):
         )
     )
 
-    registry.async_remove.assert_called_once_with("sensor.huawei_charger_stale_register")
     assert any(entity.unique_id == "test_entry_sensor_device_status" for entity in added_entities)
     assert any(entity.unique_id == "test_entry_sensor_10008" for entity in added_entities)
 
 
-def test_sensor_setup_uses_param_values_when_coordinator_data_is_none(monkeypatch):
-    coordinator = DummyCoordinator(None)
-    coordinator.param_values = {"device_status": "Connected", "10008": 1.2}
+@pytest.mark.parametrize("compact", [True, False])
+def test_register_id_is_unrecorded_only_in_compact_mode(compact):
+    coordinator = DummyCoordinator({"10008": 1.2})
+    coordinator.compact_attributes = compact
     entry = SimpleNamespace(entry_id="test_entry", async_on_unload=lambda callback: None)
-    registry = MagicMock()
     hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: coordinator}})
     added_entities = []
 
-    monkeypatch.setattr(sensor_platform.er, "async_get", lambda hass_arg: registry)
-    monkeypatch.setattr(
-        sensor_platform.er,
-        "async_entries_for_config_entry",
-        lambda registry_arg, entry_id: [],
+    asyncio.run(sensor_platform.async_setup_entry(hass, entry, added_entities.extend))
+
+    (register_sensor,) = [entity for entity in added_entities if isinstance(entity, HuaweiChargerSensor)]
+    assert ("register_id" in register_sensor._unrecorded_attributes) is compact
+
+
+class MultiWallboxCoordinator(DummyCoordinator):
+    def __init__(self, data, additional_wallboxes):
+        super().__init__(data)
+        self.additional_wallboxes = additional_wallboxes
+
+    def get_register_value(self, reg_id, wallbox_dn=None):
+        if wallbox_dn is not None:
+            return self.additional_wallboxes[wallbox_dn]["values"].get(str(reg_id))
+        return super().get_register_value(reg_id)
+
+
+def test_sensor_setup_adds_device_per_additional_wallbox():
+    coordinator = MultiWallboxCoordinator(
+        {"device_status": "Connected", "10008": 1.2},
+        {"NE=garage": {"name": "Garage", "values": {"10009": 0.9, "538976598": 7.4}}},
     )
+    entry = SimpleNamespace(entry_id="test_entry", async_on_unload=lambda callback: None)
+    hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: coordinator}})
+    added_entities = []
 
     asyncio.run(
         sensor_platform.async_setup_entry(
@@ -399,5 +495,95 @@ def test_sensor_setup_uses_param_values_when_coordinator_data_is_none(monkeypatc
         )
     )
 
-    assert any(entity.unique_id == "test_entry_sensor_device_status" for entity in added_entities)
-    assert any(entity.unique_id == "test_entry_sensor_10008" for entity in added_entities)
+    garage_sensors = [entity for entity in added_entities if "NE=garage" in entity.unique_id]
+    assert [entity.unique_id for entity in garage_sensors] == ["test_entry_NE=garage_sensor_10009"]
+    garage_sensor = garage_sensors[0]
+    assert garage_sensor.native_value == pytest.approx(0.9)
+    assert garage_sensor.device_info["identifiers"] == {(DOMAIN, "test_entry_NE=garage")}
+    assert garage_sensor.device_info["name"] == "Huawei Charger Garage"
+    assert garage_sensor.device_info["via_device"] == (DOMAIN, "test_entry")
+
+
+class DiscoveryCoordinator(MultiWallboxCoordinator):
+    def __init__(self, data, additional_wallboxes):
+        super().__init__(data, additional_wallboxes)
+        self.listeners = []
+        self.new_register_keys = set()
+
+    def async_add_listener(self, update_callback):
+        self.listeners.append(update_callback)
+        return lambda: None
+
+    def take_new_register_keys(self):
+        new_register_keys, self.new_register_keys = self.new_register_keys, set()
+        return new_register_keys
+
+
+def test_sensor_listener_only_adds_sensors_for_new_register_keys():
+    coordinator = DiscoveryCoordinator(
+        {"10008": 1.2},
+        {"NE=garage": {"name": "Garage", "values": {"10009": 0.9}}},
+    )
+    entry = SimpleNamespace(entry_id="test_entry", async_on_unload=lambda callback: None)
+    hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: coordinator}})
+    added_batches = []
+
+    asyncio.run(sensor_platform.async_setup_entry(hass, entry, added_batches.append))
+    (listener,) = coordinator.listeners
+
+    listener()
+    assert len(added_batches) == 1
+
+    coordinator.data.update({"10009": 2.5, "20001": 7.4, "20034": "secret"})
+    coordinator.additional_wallboxes["NE=garage"]["values"]["10008"] = 40.0
+    coordinator.new_register_keys = {
+        (None, "10009"),
+        (None, "10008"),
+        (None, "20001"),
+        (None, "20034"),
+        ("NE=garage", "10008"),
+        ("NE=garage", "10009"),
+    }
+    listener()
+    listener()
+
+    assert len(added_batches) == 2
+    assert [entity.unique_id for entity in added_batches[1]] == [
+        "test_entry_sensor_10009",
+        "test_entry_NE=garage_sensor_10008",
+    ]
+
+
+class DeltaCoordinator(DummyCoordinator):
+    def __init__(self, data):
+        super().__init__(data)
+        self.data_generation = 1
+        self.changed = {"10009"}
+
+    def registers_changed_since(self, generation, reg_ids, wallbox_dn=None):
+        return any(str(reg_id) in self.changed for reg_id in reg_ids)
+
+
+def test_sensor_skips_state_write_when_register_is_unchanged():
+    coordinator = DeltaCoordinator({"10009": 1.5, "538976516": "192.168.1.2"})
+    session_energy = HuaweiChargerSensor(coordinator, "10009")
+    ip_address = HuaweiChargerSensor(coordinator, "538976516", is_diagnostic=True)
+    writes = []
+    for sensor in (session_energy, ip_address):
+        sensor.async_write_ha_state = lambda sensor=sensor: writes.append(sensor.unique_id)
+
+    session_energy._handle_coordinator_update()
+    ip_address._handle_coordinator_update()
+    assert writes == ["test_entry_sensor_10009", "test_entry_sensor_538976516"]
+
+    writes.clear()
+    session_energy._handle_coordinator_update()
+    ip_address._handle_coordinator_update()
+    assert writes == ["test_entry_sensor_10009"]
+
+    writes.clear()
+    coordinator.changed = set()
+    coordinator.last_update_success = False
+    ip_address._handle_coordinator_update()
+    ip_address._handle_coordinator_update()
+    assert writes == ["test_entry_sensor_538976516"]
@@ -1,9 +1,10 @@
+import asyncio
 from types import SimpleNamespace
 
 from custom_components.huawei_charger.const import DOMAIN
 from custom_components.huawei_charger.services import (
+    _async_refresh_config_signals,
     _get_coordinators,
-    _refresh_config_signals,
     build_config_signal_dump,
 )
 
@@ -42,15 +43,18 @@ class DummyCoordinator:
         }
         self.calls = []
 
-    def _ensure_device_context(self):
+    async def _async_ensure_device_context(self):
         self.calls.append("ensure")
 
-    def fetch_wallbox_info(self):
+    async def async_fetch_wallbox_info(self):
         self.calls.append("fetch_info")
 
-    def fetch_wallbox_config_probe(self):
+    async def async_fetch_wallbox_config_probe(self):
         self.calls.append("fetch_probe")
 
+    def _track_register_changes(self):
+        self.calls.append("track_changes")
+
     def _update_register_debug_state(self):
         self.calls.append("update_debug")
 
@@ -71,15 +75,15 @@ def test_build_config_signal_dump_highlights_candidates_and_masks_sensitive():
 def test_refresh_config_signals_uses_config_probe_when_wallbox_is_known():
     coordinator = DummyCoordinator()
 
-    _refresh_config_signals(coordinator)
+    asyncio.run(_async_refresh_config_signals(coordinator))
 
-    assert coordinator.calls == ["ensure", "fetch_probe", "update_debug"]
+    assert coordinator.calls == ["ensure", "fetch_probe", "track_changes", "update_debug"]
 
 
 def test_refresh_config_signals_fetches_wallbox_info_when_wallbox_is_missing():
     coordinator = DummyCoordinator(wallbox_dn=None, wallbox_dn_id=None)
 
-    _refresh_config_signals(coordinator)
+    asyncio.run(_async_refresh_config_signals(coordinator))
 
     assert coordinator.calls == ["ensure", "fetch_info"]
 